@@ -11,7 +11,6 @@ import time
 import os
 import json
 import numpy as np
-import dill as pickle
 from azure.ai.translation.text import TextTranslationClient, TranslatorCredential
 from azure.ai.translation.text.models import InputTextItem
 
@@ -19,14 +18,10 @@ def savejson(entry, filepath):
     with open(filepath, 'w') as outfile:
         json.dump(entry, outfile)
         
-def savepickle(entry, filepath):
-    with open(filepath, 'wb') as outfile:
-        pickle.dump(entry, outfile)
-        
 class language():
     def __init__(self):
         self.ui = WindowClass()
-        self.processedfilepath = 'preprocessing//multilingual_dict.pkl'
+        self.processedfilepath = 'preprocessing//babelfish.json'
         langkeys = ['en', 'zh-Hans', 'tlh-Latn', 'ar', 'bn', 'cs', 'da', 'de', 'el', 'es',
                     'fi', 'fil', 'fr', 'he', 'hi', 'hr', 'id', 'it', 'ja', 'ko',
                     'nb', 'ne', 'pa', 'pl', 'ps', 'pt', 'ro', 'ru', 'th', 'uk',
@@ -49,14 +44,11 @@ class language():
             
     def saveProcessedLanguageDict(self):
         self.buildBabelFishDict()
-        self.saveBabelFishasPickle()
+        self.saveBabelFishasJSON()
         
     def saveBabelFishasJSON(self):
         savejson(self.babelFishDict, self.processedfilepath)
         
-    def saveBabelFishasPickle(self):
-        savepickle(self.babelFishDict, self.processedfilepath)
-
     def buildBabelFishDict(self):
         self.ui.getInterfaceWidgetsText()
         self.getSectionTextList()
@@ -264,7 +256,7 @@ class language():
             for nameKey in actDict[typeKey].keys():
                 for actKey in actDict[typeKey][nameKey].keys():
                     keypairs.append([nameKey, actKey])
-                    funcoutstr = actDict[typeKey][nameKey][actKey]('{x}','{y}','{z}')
+                    funcoutstr = actDict[typeKey][nameKey][actKey]('{a}','{b}','{c}')
                     input_text_elements.append(InputTextItem(text=funcoutstr))
             
             if langkey != 'tlh-Latn':
@@ -281,8 +273,7 @@ class language():
             textlist = [val.translations[0].text for val in response]
             print(textlist)
             for ii, keypair in enumerate(keypairs):
-                func = eval('lambda x, y, z: f"' + textlist[ii] + '"')
-                self.babelFishDict['Action'][keypair[0]][langkey]['Func'][keypair[1]] = func
+                self.babelFishDict['Action'][keypair[0]][langkey]['Func'][keypair[1]] = textlist[ii]
             print(textlist)
 
     def addItemLanguageBlockDict(self, langkey):
@@ -21,8 +21,7 @@ from PyQt5.QtWidgets import (QMainWindow,
                              QGridLayout,
                              QTextEdit,
                              QTabWidget,
-                             QTableWidget,
-                             QTableWidgetItem,
+                             QTableView,
                              QGraphicsView,
                              QSizePolicy,
                              QLineEdit,
@@ -40,6 +39,8 @@ from PyQt5.QtWidgets import (QMainWindow,
                              QScrollArea
                              )
 from PyQt5.QtCore import (Qt,
+                          QAbstractTableModel,
+                          QModelIndex,
                           QEventLoop,
                           QSize,
                           QRectF,
@@ -59,66 +60,15 @@ from PyQt5.QtGui import (QPen,
 import qdarktheme
 import os
 import copy
-import pandas as pd
 import json
-import dill as pickle
 import sip
 import ctypes
 import plaintextdictionary
+import uwl
+from uwl import savejson, loadjson
 
 
-def savejson(entry, filepath):
-    """
-    Save dictionary as .json file.
-
-    Parameters
-    ----------
-    entry : dict
-    filepath : str
-
-    """
-    with open(filepath, 'w') as outfile:
-        json.dump(entry, outfile)
-
-
-def loadjson(filepath):
-    """
-    Import .json file as dictionary.
-
-    Parameters
-    ----------
-    filepath : str
-
-    Returns
-    -------
-    data : dict
-
-    """
-    with open(filepath) as loadfile:
-        data = json.load(loadfile)
-        return data
-
-
-def loadpickle(filepath):
-    """
-    Import .pkl file as a dictionary.
-
-    Parameters
-    ----------
-    filepath : str
-
-    Returns
-    -------
-    data : dict
-
-    """
-    with open(filepath, 'rb') as loadfile:
-        data = pickle.load(loadfile)
-        return data
-
-
-filepath = 'preprocessing//multilingual_dict.pkl'
-babelFish = loadpickle(filepath)
+babelFish = uwl.getBabelFish()
 
 
 class WindowClass(QMainWindow):
@@ -257,8 +207,11 @@ class WindowClass(QMainWindow):
         Workflow Editing
             Copy - Edit >> Copy, Right click and select, or < Ctrl + C >
             Paste - Edit >> Paste, Right click and select, or < Ctrl + V >
+            Copy / Paste Table Cells - Table tab, Edit >> Copy / Paste or < Ctrl + C > / < Ctrl + V >
             Select All - Edit >> Copy, Right click and select, or < Ctrl + A >
             Delete - Edit >> Delete, Right click and select, or < Delete >
+            Undo - < Ctrl + Z >
+            Redo - < Ctrl + Y > or < Ctrl + Shift + Z >
             Move Blocks - Click and drag
             Highlight Blocks - Click and drag box or < Ctrl + Click >
         """
@@ -667,9 +620,13 @@ class WindowClass(QMainWindow):
         Create a copy of the selected workflow segment in clipboard.
 
         Current copy operations are handled by scene method. Operations is
-        connected to the Ctrl+C hot key.
+        connected to the Ctrl+C hot key. In the table tab, selected cell values
+        are copied instead.
 
         """
+        if self.centralWidget().currentWidget() is self.tabCtrl.tableTab:
+            self.tabCtrl.tableTab.onCopy()
+            return
         currTabInd = self.centralWidget().widget(0).currentIndex()
         self.centralWidget().widget(0).widget(currTabInd).scene().onCopyBlock()
 
@@ -679,9 +636,13 @@ class WindowClass(QMainWindow):
 
         Paste occurs at last recorded mouse location in the workflow. Current
         paste operations are handled by scene method. Operation is connected to
-        the Ctrl+V hot key.
+        the Ctrl+V hot key. In the table tab, clipboard text is pasted into
+        table cells instead.
 
         """
+        if self.centralWidget().currentWidget() is self.tabCtrl.tableTab:
+            self.tabCtrl.tableTab.onPaste()
+            return
         currTabInd = self.centralWidget().widget(0).currentIndex()
         self.centralWidget(
         ).widget(0).widget(currTabInd).scene().onPasteBlock()
@@ -1012,8 +973,11 @@ class WindowClass(QMainWindow):
     def updateEntryBase(self):
         """Update workflow data from base information tool bar widget."""
         currTabInd = self.centralWidget().widget(0).currentIndex()
-        self.centralWidget().widget(0).widget(currTabInd).scene(
-        ).mainEntry['Description'] = self.descWidget.toPlainText()
+        scene = self.centralWidget().widget(0).widget(currTabInd).scene()
+        description = self.descWidget.toPlainText()
+        if scene.mainEntry['Description'] != description:
+            scene.mainEntry['Description'] = description
+            scene.markChanged(blocks=False)
         self.centralWidget().updateEntries()
 
     def updateToolBars(self):
@@ -1129,6 +1093,10 @@ class TabViewController(QTabWidget):
         self.addTab(self.rawTextTab, 'Raw')
 
         self.entries = []
+        self.tableVersion = None
+        self.parameterNames = None
+        self.tableEntries = {}
+        self.entryIDs = []
 
         self.currentChanged.connect(self.onCurrentChanged)
 
@@ -1140,34 +1108,61 @@ class TabViewController(QTabWidget):
         self.updateCurrentTab()
 
     def updateEntries(self):
-        """Rebuild workflow data from workflows and distribute to all tabs."""
+        """
+        Gather workflow data from workflows and distribute to all tabs.
+
+        Each workflow scene carries a data version which changes whenever its
+        workflow is edited. Views are only rebuilt for workflows whose
+        version differs from the version last rendered by the view.
+
+        """
         self.entriesWorkflow = {}
+        self.entriesVersion = {}
+        self.entriesScene = {}
+        blockVersions = []
         c = 0
         while self.workflowTab.widget(c) is not None:
-            entryName = self.workflowTab.widget(c).scene(
-            ).mainEntry['Name']
+            scene = self.workflowTab.widget(c).scene()
+            scene.syncMainEntry()
+            entryName = scene.mainEntry['Name']
 
-            self.entriesWorkflow[entryName] = self.workflowTab.widget(
-                c).scene().mainEntry
+            self.entriesWorkflow[entryName] = scene.mainEntry
+            self.entriesVersion[entryName] = scene.version
+            self.entriesScene[entryName] = scene
+            blockVersions.append((entryName, scene.blockVersion))
 
             c = c + 1
 
-        self.updateEntryTable()
+        tableVersion = [self.lankey, blockVersions]
+        if tableVersion != self.tableVersion:
+            self.updateEntryTable()
+            self.tableVersion = tableVersion
         self.updateEntryText()
 
     def updateEntryText(self):
         """Update display data for plain text and raw data tabs."""
-        self.plainTextTab.updateFromWorkflows(self.entriesWorkflow)
-        self.rawTextTab.updateFromWorkflows(self.entriesWorkflow)
+        self.plainTextTab.updateFromWorkflows(
+            self.entriesWorkflow, self.entriesVersion)
+        self.rawTextTab.updateFromWorkflows(
+            self.entriesWorkflow, self.entriesVersion)
 
     def updateEntryTable(self):
-        """Empty and rebuild all data in table controller."""
-        self.tableTab.clear()
-        self.buildTableNames()
-        self.entriesTable = pd.DataFrame([], index=self.tableNames)
-        self.addDatatoTable()
-        self.tableTab.updateTable(self.entriesTable)
-        self.tableTab.tabletoWorkflowIndex = self.tabletoWorkflowIndex
+        """Rebuild all data in table controller."""
+        self.buildTable()
+
+        targets = {}
+        for [c, iTab, entryID, sectionPath, objKey, ii_param
+             ] in self.tabletoWorkflowIndex:
+            section = self.entriesWorkflow[entryID]
+            for sectionKey in sectionPath:
+                section = section['Objects'][sectionKey]
+            targets[(iTab, c)] = [section['Objects'][objKey]['Values'],
+                                  ii_param, sectionPath, objKey]
+        columnScenes = [self.entriesScene[entryID]
+                        for entryID in self.entryIDs]
+
+        self.tableTab.updateTable(
+            self.tableNames, self.entryIDs, targets, columnScenes)
 
     def updateCurrentTab(self):
         """Set tabs to match current tab across data views."""
@@ -1175,1168 +1170,417 @@ class TabViewController(QTabWidget):
         self.plainTextTab.setCurrentIndex(self.subTabInd)
         self.rawTextTab.setCurrentIndex(self.subTabInd)
 
-    def buildTableNames(self):
-        """Iterate through all work flows and add unique parameter names."""
-        self.tableNames = []
-        for entryID in self.entriesWorkflow.keys():
-            self.entrynames = []
-            entry = self.entriesWorkflow[entryID]
-            self.addSectionTableNames(section=entry)
-
-    def addSectionTableNames(self, section, prevSectName=''):
-        """
-        Add unique table names to tableNames class attribute.
-
-        Iterate through all parameters within the action and item blocks of the
-        current section or workflow and add the parameter with associated
-        relationship branching to the tableNames class attribute if it does not
-        already exist. If a section within the current section is found,
-        recursively iterate through this function with the nested section.
-
-        Parameters
-        ----------
-        section : dict
-            Work flow or section object containing action and / or item blocks.
-        prevSectName : str, optional
-            Name of previous section within section nesting. Section name
-            branches are labeled as [First Level] > [Second Level] > ... >
-            [Previous Level]. The default is ''.
-
-        """
-        if section['Type'] == 'root':
-            sectName = ''
-        else:
-            sectName = prevSectName + section['Name'] + ' > '
-
-        for objKey in section['Objects'].keys():
-            block = section['Objects'][objKey]
-            if block['Type'] in ['Action', 'Item']:
-                try:
-                    blockName = babelFish[block['Type']
-                                          ][block['Name']][self.lankey]['Name']
-                except Exception as e:
-                    print(e)
-                    blockName = block['Name']
-                blockName = blockName + ' > '
-                if block['Type'] == 'Action':
-                    actionMod = self.getActionModifier(section, block)
-                else:
-                    actionMod = ''
-
-                for param in block['Parameters']:
-                    try:
-                        param_type = babelFish[block['Type'] + ' Parameter']
-                        param = param_type[param][self.lankey]['Name']
-                    except Exception as e:
-                        print(e)
-                        param = param
-
-                    entryName = sectName + blockName + param + actionMod
-                    entryName = self.fixEntryNameDuplicates(entryName)
-                    if entryName not in self.tableNames:
-                        self.tableNames.append(entryName)
-            elif block['Type'] == 'Section':
-                self.addSectionTableNames(section=block, prevSectName=sectName)
-
-    def getActionModifier(self, section, block):
+    def buildTable(self):
         """
-        Return descriptive text for an action block.
-
-        Action block modifier text is used to add context to an action block
-        parameter. In most cases, action block names are not unique, so the
-        modifier text will display next to the name to add specificity. For
-        example:
-            Add > Mass [Potassium chloride to beaker]
-
-        Parameters
-        ----------
-        section : dict
-            Work flow or section dictionary data.
-        block : dict
-            Dictionary data for an action block object.
+        Build table names, values, and workflow index in a single pass.
 
-        Returns
-        -------
-        actionMod : str
-            Descriptive text to add context to action block parameters.
+        Rows are added in order of first appearance across all workflows and
+        located through a dictionary of row indices. Cell values are not
+        copied, the table model reads them through the workflow index.
+        Parameter entries of each workflow are kept with the workflow block
+        data version and only regenerated for changed workflows.
 
         """
-        try:
-            actionMod = ''
-            if block['Subtype'] == 'Add':
-                ABlockName = self.getConnectionBlockName(section, block, 'A')
-                BBlockName = self.getConnectionBlockName(section, block, 'B')
-                try:
-                    ABlockName = babelFish[
-                        'Item'][ABlockName][self.lankey]['Name']
-                    BBlockName = babelFish[
-                        'Item'][BBlockName][self.lankey]['Name']
-                except Exception as e:
-                    print(e)
-                    pass
-                actionMod = ' [' + BBlockName + ' to ' + ABlockName + '] '
-            elif block['Subtype'] == 'Remove':
-                ABlockName = self.getConnectionBlockName(section, block, 'A')
-                BBlockName = self.getConnectionBlockName(section, block, 'B')
-                try:
-                    ABlockName = babelFish[
-                        'Item'][ABlockName][self.lankey]['Name']
-                    BBlockName = babelFish[
-                        'Item'][BBlockName][self.lankey]['Name']
-                except Exception as e:
-                    print(e)
-                    pass
-                actionMod = ' [' + BBlockName + ' from ' + ABlockName + '] '
-            elif block['Subtype'] == 'Modify':
-                ABlockName = self.getConnectionBlockName(section, block, 'A')
-                try:
-                    ABlockName = babelFish[
-                        'Item'][ABlockName][self.lankey]['Name']
-                except Exception as e:
-                    print(e)
-                    pass
-                actionMod = ' [' + ABlockName + '] '
-        except Exception as e:
-            print(e)
-            actionMod = ''
-
-        return actionMod
-
-    def getConnectionBlockName(self, section, block, connectionType):
-        """
-        Return name of item block(s) connected to an action block.
-
-        Parameters
-        ----------
-        section : dict
-            Work flow or section dictionary data.
-        block : dict
-            Action block used to search for connections.
-        connectionType : {'A','B','C'}
-            Connection type to search from.
-
-        Returns
-        -------
-        blockName : str
-            Name(s) of item blocks connected to the action block through the
-            specified type. Multiple items are separated in the string through
-            the delimiter '/'.
-
-        """
-        inLabel = connectionType + ' In'
-        inKeys = block[inLabel]
-        blockName = ''
-        for inKey in inKeys:
-            blockName += section['Objects'][inKey]['Name'] + '/'
-        if blockName != '':
-            blockName = blockName[:-1]
-        return blockName
-
-    def addDatatoTable(self):
-        """Add parameter values to table view column by column."""
-        self.c = 0
+        self.tableNames = []
         self.tabletoWorkflowIndex = []
-        for entryID in self.entriesWorkflow.keys():
-            self.entryID = entryID
-            entry = self.entriesWorkflow[entryID]
+        rowIndex = {}
+        parameterNames = self.getParameterNames()
+        tableEntries = {}
+        for c, entryID in enumerate(self.entriesWorkflow.keys()):
+            version = (self.entriesScene[entryID].blockVersion, self.lankey)
+            cached = self.tableEntries.get(entryID)
+            if cached is None or cached[0] != version:
+                entry = self.entriesWorkflow[entryID]
+                cached = [version, [tableEntry for tableEntry in
+                                    parameterNames.iterTableEntries(entry)]]
+            tableEntries[entryID] = cached
+
+            for [entryName, val, sectPath, objKey, ii] in cached[1]:
+                iTab = rowIndex.get(entryName)
+                if iTab is None:
+                    iTab = len(self.tableNames)
+                    rowIndex[entryName] = iTab
+                    self.tableNames.append(entryName)
+                self.tabletoWorkflowIndex.append(
+                    [c, iTab, entryID, sectPath, objKey, ii])
+        self.tableEntries = tableEntries
+        self.entryIDs = [entryID for entryID in self.entriesWorkflow.keys()]
+
+    def getParameterNames(self):
+        """Return table row name generator for the current language."""
+        if (self.parameterNames is None
+                or self.parameterNames.lankey != self.lankey):
+            self.parameterNames = uwl.ParameterNames(lankey=self.lankey)
+        return self.parameterNames
+
+
+class WorkflowTableModel(QAbstractTableModel):
+    """
+    Table model reading parameter values from workflow data on demand.
 
-            self.entrynames = []
-            self.tempCol = []
-            for ii in range(len(self.tableNames)):
-                self.tempCol.append(None)
+    Cells are mapped to the parameter value lists of workflow blocks, so no
+    cell data is copied into the table and edited cells are written straight
+    to the workflow.
 
-            self.addSectionDatatoCol(section=entry)
+    """
 
-            self.entriesTable.insert(self.c, entryID, self.tempCol)
-            self.c += 1
+    def __init__(self, parent=None):
+        QAbstractTableModel.__init__(self, parent)
+        self.rowNames = []
+        self.colNames = []
+        self.targets = {}
 
-    def addSectionDatatoCol(self, section, prevSectName='', prevSectPath=[]):
+    def setTable(self, rowNames, colNames, targets):
         """
-        Fill in table column data for the specified entry.
-
-        Iterate through sections in the workflow and fill in data into the
-        tempCol class attribute. Parameter names are constructed to mimic the
-        format specified in addSectionTableNames method.
+        Replace table layout and cell targets.
 
         Parameters
         ----------
-        section : dict
-            Work flow or section object containing action and / or item blocks.
-        prevSectName : str, optional
-            Name of previous section within section nesting. Section name
-            branches are labeled as [First Level] > [Second Level] > ... >
-            [Previous Level]. The default is ''.
-        prevSectPath : list, optional
-            List of previous section name strings within the current section
-            branch path. The default is [].
-
-        """
-        if section['Type'] == 'root':
-            sectName = ''
-        else:
-            sectName = prevSectName + section['Name'] + ' > '
-
-        for objKey in section['Objects'].keys():
-            block = section['Objects'][objKey]
-            blockName = block['Name'] + ' > '
-            if block['Type'] in ['Action', 'Item']:
-                try:
-                    blockName = babelFish[block['Type']
-                                          ][block['Name']][self.lankey]['Name']
-                except Exception as e:
-                    print(e)
-                    blockName = block['Name']
-                blockName = blockName + ' > '
-
-                for ii, param in enumerate(block['Parameters']):
-                    val = block['Values'][ii]
-
-                    try:
-                        param_type = babelFish[block['Type'] + ' Parameter']
-                        param = param_type[param][self.lankey]['Name']
-                    except Exception as e:
-                        print(e)
-                        param = param
-
-                    if block['Type'] == 'Action':
-                        actionMod = self.getActionModifier(section, block)
-                    else:
-                        actionMod = ''
-
-                    entryName = sectName + blockName + param + actionMod
-                    entryName = self.fixEntryNameDuplicates(entryName)
-
-                    iTab = self.entriesTable.index.get_loc(entryName)
-                    self.tempCol[iTab] = val
-
-                    self.tabletoWorkflowIndex.append(
-                        [self.c, iTab, self.entryID, prevSectPath, objKey, ii])
-
-            elif block['Type'] == 'Section':
-                sectPath = prevSectPath.copy()
-                sectPath.append(block['ID'])
-                self.addSectionDatatoCol(
-                    section=block, prevSectName=sectName,
-                    prevSectPath=sectPath)
+        rowNames : list
+            Parameter names of table rows.
+        colNames : list
+            Workflow names of table columns.
+        targets : dict
+            Cell targets in the format {(<row>, <column>): [<block values
+            list>, <parameter index>, <section path>, <block identifier>]}.
+            Cells without targets are empty.
+
+        """
+        self.beginResetModel()
+        self.rowNames = rowNames
+        self.colNames = colNames
+        self.targets = targets
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        """Return number of parameter rows."""
+        if parent.isValid():
+            return 0
+        return len(self.rowNames)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Return number of workflow columns."""
+        if parent.isValid():
+            return 0
+        return len(self.colNames)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Return parameter value for cell or gray background if empty."""
+        target = self.targets.get((index.row(), index.column()))
+        if role in [Qt.DisplayRole, Qt.EditRole]:
+            if target is None:
+                return None
+            values, ii_param = target[:2]
+            return values[ii_param]
+        if role == Qt.BackgroundRole and target is None:
+            return QColor(31, 32, 33)  # Gray out cells without existing data.
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Return workflow name for columns and parameter name for rows."""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.colNames[section]
+        return self.rowNames[section]
+
+    def flags(self, index):
+        """Allow editing of cells with existing data."""
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if (index.row(), index.column()) in self.targets:
+            flags = flags | Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Write edited cell value to workflow data."""
+        target = self.targets.get((index.row(), index.column()))
+        if role != Qt.EditRole or target is None:
+            return False
+        values, ii_param = target[:2]
+        if values[ii_param] == value:
+            return False
+        values[ii_param] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
 
-    def fixEntryNameDuplicates(self, tempname):
+    def setDataBatch(self, cellValues):
         """
-        Modify parameter name to ensure it has not been duplicated.
+        Write several cell values to workflow data at once.
 
-        Compare the entered parameter name with all the names in the table view
-        parameters column, and if a duplicate exists, add a modifier text
-        string with the format (1), (2), ... ([N]) corresponding to duplicate
-        1, duplicate 2, to duplicate [N] respectively.
+        A single dataChanged event is emitted for each column with changed
+        cells, spanning the changed rows of the column.
 
         Parameters
         ----------
-        tempname : str
-            Original parameter name.
+        cellValues : dict
+            New cell values in the format {(<row>, <column>): <value>}. Cells
+            without targets are skipped.
 
         Returns
         -------
-        tempname : str
-            Modified unique parameter name.
-
-        """
-        d = 1
-        while tempname in self.entrynames:
-            nameMod = ' (' + str(d) + ')'
-            if tempname + nameMod in self.entrynames:
-                d = d + 1
-            else:
-                tempname = tempname + nameMod
-
-        self.entrynames.append(tempname)
-        return tempname
-
-
-class TabTableController(QTableWidget):
-    """Table widget class used to control the 'Table' tab."""
-
-    def __init__(self, parent=None, lankey='en'):
-        QTableWidget.__init__(self, parent)
-        self.parent = parent
-        self.lankey = lankey
-
-        self.tabletoWorkflowIndex = []
-
-        data = pd.DataFrame([''], index=['Untitled'], columns=['Untitled'])
-        self.updateTable(data)
-        self.cellChanged.connect(self.onCellChange)
-
-    def updateTable(self, data):
-        """
-        Fill table values and refit cell dimensions.
-
-        Parameters
-        ----------
-        data : DataFrame
-            Data frame containing all table values.
+        changedCells : list
+            Cells with changed values in the format (<row>, <column>).
 
         """
-        cols = data.columns
-        rows = data.index
-
-        self.setColumnCount(len(cols))
-        self.setRowCount(len(rows))
-
-        self.setVerticalHeaderLabels(rows)
-        self.setHorizontalHeaderLabels(cols)
-
-        for n, key in enumerate(sorted(data.keys())):
-            for m, item in enumerate(data[key]):
-                newitem = QTableWidgetItem(item)
-                if item is None:  # Gray out cells without existing data.
-                    newitem.setBackground(QColor(31, 32, 33))
-                self.setItem(m, n, newitem)
-
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
-
-    def onCellChange(self):
-        """
-        Update work flow data if valid cell is changed.
-
-        Method connected to onChanged event.
-
-        """
-        col = self.currentColumn()
-        if col != -1:
-            self.pushDatatoWorkflows()
-
-    def pushDatatoWorkflows(self):
-        """Update work flow data with table view data values."""
-        if self.tabletoWorkflowIndex == []:
-            return
-
-        for [ii, jj, entry, sectionPath, item, ii_param
-             ] in self.tabletoWorkflowIndex:
-            workflow = self.parent.workflowTab.widget(ii).scene().mainEntry
-            self.assignValThroughSections(
-                workflow, ii, jj, entry, sectionPath, item, ii_param)
-
-    def assignValThroughSections(self, section, ii, jj, entry, sectionPath,
-                                 item, ii_param):
-        """
-        Update work flow data through sections with table data.
-
-        Parameters
-        ----------
-        section : dict
-            Section or work flow dictionary.
-        ii : int
-            Table row index.
-        jj : int
-            Table column index.
-        entry : int
-            Work flow entry index.
-        sectionPath : list
-            List of section branch path object identifiers.
-        item : str
-            Object identifier.
-        ii_param : int
-            Parameter index within the selected object.
-
-        """
-        if sectionPath == []:
-            section['Objects'][item]['Values'][ii_param] = self.item(
-                jj, ii).text()
-        else:
-            section = section['Objects'][sectionPath[0]]
-            sectionPath = sectionPath[1:].copy()
-            self.assignValThroughSections(
-                section, ii, jj, entry, sectionPath, item, ii_param)
-
-    def getPriorityList(self, workflow):
-        """
-        Generate a list of block IDs ordered in positional priority.
-
-        Object positional priority is based on object feature 'postion':(x, y).
-        Priority is first given by horizontal position from left to right, then
-        by vertical postion, from top to bottom.
-
-        Parameters
-        ----------
-        workflow : dict
-            Work flow or section object dictionary.
-
-        """
-        x = []
-        y = []
-        ID = []
-        for key in workflow['Objects'].keys():
-            ID.append(workflow['Objects'][key]['ID'])
-            x.append(workflow['Objects'][key]['position'][0])
-            y.append(workflow['Objects'][key]['position'][1])
+        changedCells = []
+        changedRows = {}
+        for cell, value in cellValues.items():
+            target = self.targets.get(cell)
+            if target is None:
+                continue
+            values, ii_param = target[:2]
+            if values[ii_param] == value:
+                continue
+            values[ii_param] = value
+            changedCells.append(cell)
+            changedRows.setdefault(cell[1], []).append(cell[0])
 
-        tempdict = {'ID': ID, 'X': x, 'Y': y}
-        df = pd.DataFrame(tempdict)
-        df = df.sort_values(by=['X', 'Y'])
-        priority = df.loc[:, 'ID'].tolist()
+        for col, rows in changedRows.items():
+            self.dataChanged.emit(self.index(min(rows), col),
+                                  self.index(max(rows), col),
+                                  [Qt.DisplayRole, Qt.EditRole])
+        return changedCells
 
-        return priority
 
+class TabTableController(QTableView):
+    """Table view class used to control the 'Table' tab."""
 
-class TabPlaintextController(QTabWidget):
-    """Manage plain written text protocol data view tab."""
+    sampleRows = 100
 
     def __init__(self, parent=None, lankey='en'):
-        QTabWidget.__init__(self, parent)
+        QTableView.__init__(self, parent)
         self.parent = parent
         self.lankey = lankey
 
-        try:
-            self.textconstlist = babelFish[
-                'ui'][self.lankey]['plain text const']
-        except Exception as e:
-            print(e)
-            self.textconstlist = ['' for ii in range(30)]
-
-        self.actionDict = babelFish['Action']
-        self.itemDict = babelFish['Item']
-
-        self.setTabsClosable(True)
-        self.setMovable(True)
+        self.columnScenes = []
 
-        plainTextTab = PlainTextClass(parent=self)
-        self.addTab(plainTextTab, 'Untitled')
+        self.tableModel = WorkflowTableModel(parent=self)
+        self.setModel(self.tableModel)
+        self.horizontalHeader().setResizeContentsPrecision(self.sampleRows)
+        self.tableModel.dataChanged.connect(self.onDataChanged)
+        self.tableModel.setTable(['Untitled'], ['Untitled'], {})
 
-        self.tabCloseRequested.connect(self.onClose)
-        self.tabBarClicked.connect(self.onTabChange)
-
-    def onTabChange(self, index):
+    def updateTable(self, rowNames, colNames, targets, columnScenes):
         """
-        Update work flow tab in remaining data views to current index.
+        Reset table layout and refit column widths.
 
-        Method is connected to tabBarClicked event.
+        Column widths are fit to the header and a sample of rows instead of
+        every cell.
 
         Parameters
         ----------
-        index : int
-            Current work flow tab index.
-
-        """
-        self.parent.subTabInd = index
-        self.parent.updateCurrentTab()
-        self.parent.parent.updateToolBars()
-
-    def onClose(self, ind):
-        """
-        Close work flow tab specified by index and update data views.
-
-        Parameters
-        ----------
-        ind : int
-            Index of closed work flow tab.
-
-        """
-        self.parent.workflowTab.onClose(ind)
-        self.removeTab(ind)
-        self.parent.updateEntries()
-
-    def updateFromWorkflows(self, entriesWorkflow):
-        """
-        Update plain text tabs from all open workflows.
-
-        Parameters
-        ----------
-        entriesWorkflow : dict
-            Dictionary of all workflow entry data.
-
-        """
-        self.clear()
-
-        for entryKey in entriesWorkflow.keys():
-            entryText = self.textFromWorkflow(entriesWorkflow[entryKey])
-            entryWidget = PlainTextClass(parent=self, text='')
-            entryWidget.textWidget.setPlainText(entryText)
-            self.addTab(entryWidget, entryKey)
-
-    def textFromWorkflow(self, workflow):
-        """
-        Generate full protocol text for a given workflow entry.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow data dictionary.
-
-        Returns
-        -------
-        text : str
-            Full protocol text for a given work flow.
-
-        """
-        try:
-            self.textconstlist = babelFish[
-                'ui'][self.lankey]['plain text const']
-            self.itemDict = babelFish['Item']
-            text = ''
-
-            # Base features
-            text = self.generateBaseText(text, workflow)
-
-            # Additional list
-            text = self.generateAbstractText(text, workflow)
-            text += '\n'
-
-            # Materials list
-            text = self.generateMaterialsText(text, workflow)
-            text += '\n'
-
-            # Equipment list
-            text = self.generateEquipmentText(text, workflow)
-            text += '\n'
-
-            # Protocol steps
-            text = self.generateProtocolText(text, workflow)
-
-        except Exception as e:
-            self.textconstlist = [' ' for ii in range(30)]
-            print(e)
-            text = '** ' + self.textconstlist[0] + ' **'
-
-        return text
-
-    def generateBaseText(self, text, workflow):
-        """
-        Add basic information and description text to full protocol.
-
-        Parameters
-        ----------
-        text : str
-            Current protocol text.
-        workflow : dict
-            Workflow entry data dictionary.
-
-        Returns
-        -------
-        text : str
-            Protocol text with base information appended.
-
-        """
-        try:
-            text += self.textconstlist[1] + ' ' + str(workflow['Name']) + '\n'
-            text += self.textconstlist[2] + ' ' + \
-                str(workflow['Description']) + '\n'
-        except Exception as e:
-            print(e)
-            text = text + '** ' + self.textconstlist[3] + ' **'
-        text = text + '\n'
-        return text
-
-    def generateAbstractText(self, text, workflow, sectName=''):
-        """
-        Add abstract item block data to protocol text.
-
-        Iterate through sections within the current workflow or section.
-
-        Parameters
-        ----------
-        text : str
-            Current protocol text.
-        workflow : dict
-            Workflow entry or section data dictionary.
-        sectName : str, optional
-            Current section branch path. Section levels are separated by ' > '.
-            The default is ''.
-
-        Returns
-        -------
-        text : str
-            Protocol text with abstract information appended.
-
-        """
-        try:
-            _tab = '   '
-            if sectName == '':
-                text = text + self.textconstlist[4] + ' \n'
-            itemNames = []
-            for key in workflow['Objects'].keys():
-                if workflow['Objects'][key]['Type'] == 'Section':
-                    newSectName = sectName + \
-                        workflow['Objects'][key]['Name'] + ' > '
-                    text = self.generateAbstractText(
-                        text, workflow['Objects'][key], newSectName)
-
-                elif workflow['Objects'][key]['Type'] != 'Item':
-                    continue
-
-                elif workflow['Objects'][key]['Subtype'] == 'Abstract':
-                    connected = self.checkItemForConnections(workflow, key)
-                    if connected:
-                        continue
-
-                    text = text + _tab + sectName
-                    itemName, itemNames = self.getUniqueItemName(
-                        workflow, key, itemNames)
-                    text = text + itemName
-                    text = self.addParamsList(workflow, text, key)
-                    text = self.addNoteText(workflow, text, key)
-                    text = text + '\n'
-
-        except Exception as e:
-            print(e)
-            text = text + '** ' + self.textconstlist[5] + ' **'
-        return text
-
-    def generateMaterialsText(self, text, workflow, sectName=''):
-        """
-        Add source item block data to protocol text.
-
-        Iterate through sections within the current workflow or section.
-
-        Parameters
-        ----------
-        text : str
-            Current protocol text.
-        workflow : dict
-            Workflow entry or section data dictionary.
-        sectName : str, optional
-            Current section branch path. Section levels are separated by ' > '.
-            The default is ''.
-
-        Returns
-        -------
-        text : str
-            Protocol text with materials information appended.
-
-        """
-        try:
-            _tab = '   '
-            if sectName == '':
-                text = text + self.textconstlist[6] + ' \n'
-            itemNames = []
-            for key in workflow['Objects'].keys():
-                if workflow['Objects'][key]['Type'] == 'Section':
-                    newSectName = sectName + \
-                        workflow['Objects'][key]['Name'] + ' > '
-                    text = self.generateMaterialsText(
-                        text, workflow['Objects'][key], newSectName)
-                elif workflow['Objects'][key]['Type'] != 'Item':
-                    continue
-
-                elif workflow['Objects'][key]['Subtype'] in ['Source']:
-                    text = text + _tab + sectName
-                    itemName, itemNames = self.getUniqueItemName(
-                        workflow, key, itemNames)
-                    text = text + itemName
-                    text = self.addParamsList(workflow, text, key)
-                    text = self.addNoteText(workflow, text, key)
-                    text = text + '\n'
-        except Exception as e:
-            print(e)
-            text = text + '** ' + self.textconstlist[7] + ' **'
-        return text
-
-    def checkItemForConnections(self, workflow, checkkey):
-        """
-        Check if action block is connected to any item.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow or section entry data dictionary.
-        checkkey : str
-            Identifier for the action block to check within workflow.
-
-        Returns
-        -------
-        bool
-            True if any item connection type is listed in the action block
-            data. False if no item connections are found.
-
-        """
-        for key in workflow['Objects'].keys():
-            testobject = workflow['Objects'][key]
-            if testobject['Type'] != 'Action':
-                continue
-            if checkkey in testobject['A In']:
-                return True
-            if checkkey in testobject['B In']:
-                return True
-            if checkkey in testobject['C In']:
-                return True
-        return False
-
-    def generateEquipmentText(self, text, workflow, sectName=''):
-        """
-        Add tool and container item block data to protocol text.
-
-        Iterate through sections within the current workflow or section.
-
-        Parameters
-        ----------
-        text : str
-            Current protocol text.
-        workflow : dict
-            Workflow entry or section data dictionary.
-        sectName : str, optional
-            Current section branch path. Section levels are separated by ' > '.
-            The default is ''.
-
-        Returns
-        -------
-        text : str
-            Protocol text with equipment information appended.
-
-        """
-        try:
-            _tab = '   '
-            if sectName == '':
-                text = text + self.textconstlist[8] + ' \n'
-            itemNames = []
-            for key in workflow['Objects'].keys():
-                if workflow['Objects'][key]['Type'] == 'Section':
-                    newSectName = sectName + \
-                        workflow['Objects'][key]['Name'] + ' > '
-                    text = self.generateEquipmentText(
-                        text, workflow['Objects'][key], newSectName)
-                elif workflow['Objects'][key]['Type'] != 'Item':
-                    continue
-
-                elif workflow['Objects'][key]['Subtype'] in ['Tool',
-                                                             'Container']:
-                    text = text + _tab + sectName
-                    itemName, itemNames = self.getUniqueItemName(
-                        workflow, key, itemNames)
-                    text = text + itemName
-                    text = self.addParamsList(workflow, text, key)
-                    text = self.addNoteText(workflow, text, key)
-                    text = text + '\n'
-        except Exception as e:
-            print(e)
-            text = text + '** ' + self.textconstlist[9] + ' **'
-        return text
-
-    def getUniqueItemName(self, workflow, key, itemNames):
-        """
-        Add unique modifier to current item.
-
-        Check if the item name identified through key is a unique name in
-        itemNames list. If it is not unique, add a modifier with the format
-        <Duplicate 1>, <Duplicate 2>, ... <Duplicate N> is represented by (1),
-        (2), ... (N), respectively.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow entry or section data dictionary.
-        key : str
-            Identifier for named block in workflow.
-        itemNames : list
-            List of all previously checked item names.
-
-        Returns
-        -------
-        itemName : str
-            Unique item name.
-        itemNames : list
-            List of all item names with unique name added.
-
-        """
-        try:
-            rootItemName_en = workflow['Objects'][key]['Name']
-            rootItemName = self.itemDict[rootItemName_en][self.lankey]['Name']
-        except Exception as e:
-            print(e)
-            rootItemName = workflow['Objects'][key]['Name']
-        itemName = rootItemName
-
-        d = 0
-        while itemName in itemNames:
-            d = d + 1
-            modName = ' (' + str(d) + ')'
-            itemName = rootItemName + modName
-
-        itemNames.append(itemName)
-        return itemName, itemNames
-
-    def generateProtocolText(self, text, workflow, level=1):
-        """
-        Add protocol steps data to protocol text.
-
-        Iterate through sections within the current workflow or section.
-
-        Parameters
-        ----------
-        text : str
-            Current protocol text.
-        workflow : dict
-            Workflow entry or section data dictionary.
-        level : int, optional
-            Current section level. The default is 1.
-
-        Returns
-        -------
-        text : str
-            Protocol text with protocol steps appended.
-
-        """
-        try:
-            if level == 1:
-                text = text + self.textconstlist[10] + ' \n'
-
-            itemPriority, actionPriority = self.getPriorityList(workflow)
-            _tab = '   '
-            c = 0
-            for key in actionPriority:
-                c = c + 1
-                try:
-                    if workflow['Objects'][key]['Type'] == 'Section':
-                        sectName = workflow['Objects'][key]['Name']
-                        text += _tab*level + str(c) + '. ' + sectName + '\n'
-                        sectLevel = level + 1
-                        text = self.generateProtocolText(
-                            text, workflow['Objects'][key], sectLevel)
-                        text += '\n'
-                    else:
-                        textline = self.generateTextLine(
-                            workflow, key, itemPriority)
-                        textline = self.addParamsList(workflow, textline, key)
-                        textline = self.addNoteText(workflow, textline, key)
-                        text = text + _tab*level + \
-                            str(c) + '. ' + textline + '.\n'
-                        text = self.addAbstractText(workflow, text, key)
-
-                except Exception as e:
-                    print(e)
-                    textline = '** ' + self.textconstlist[11] + ' **'
-
-        except Exception as e:
-            print(e)
-            text = text + '** ' + self.textconstlist[12] + ' **'
-        return text
-
-    def addAbstractText(self, workflow, text, key):
-        """
-        Add modifier text to current protocol step for abstract blocks.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow entry or section data dictionary.
-        text : str
-            Current protocol text.
-        key : str
-            Action block identifier.
-
-        Returns
-        -------
-        text : str
-            Protocol text with abstract modifier appended.
-
-        """
-        _tab = '   '
-        keyList = []
-        for mkey in workflow['Objects'][key]['A In']:
-            if workflow['Objects'][mkey]['Subtype'] == 'Abstract':
-                keyList.append(mkey)
-        for mkey in workflow['Objects'][key]['B In']:
-            if workflow['Objects'][mkey]['Subtype'] == 'Abstract':
-                keyList.append(mkey)
-        for mkey in workflow['Objects'][key]['C In']:
-            if workflow['Objects'][mkey]['Subtype'] == 'Abstract':
-                keyList.append(mkey)
-
-        for inKey in keyList:
-            if workflow['Objects'][inKey]['Parameters'] == []:
-                continue
-
-            text += _tab + _tab
-            text += '- ' + workflow['Objects'][inKey]['Name']
-            text = self.addParamsList(workflow, text, inKey)
-            text += '\n'
-
-        return text
-
-    def addNoteText(self, workflow, text, key):
-        """
-        Add note text to current protocol step for abstract blocks.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow entry or section data dictionary.
-        text : str
-            Current protocol text.
-        key : str
-            Action block identifier.
-
-        Returns
-        -------
-        text : str
-            Protocol text with note data appended.
-
-        """
-        if workflow['Objects'][key]['Notes'] != '':
-            text = text + ' (Note: ' + workflow['Objects'][key]['Notes'] + ')'
-        return text
-
-    def addParamsList(self, workflow, text, key):
-        """
-        Add action parameter text to current protocol step.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow entry or section data dictionary.
-        text : str
-            Current protocol text.
-        key : str
-            Action block identifier.
-
-        Returns
-        -------
-        text : str
-            Protocol text with action parameter data appended.
-
-        """
-        typeKey = workflow['Objects'][key]['Type'] + ' Parameter'
-        text = text + ': ['
-        for ii in range(len(workflow['Objects'][key]['Parameters'])):
-            param_en = str(workflow['Objects'][key]['Parameters'][ii])
-            try:
-                param = babelFish[typeKey][param_en][self.lankey]['Name']
-            except Exception as e:
-                print(e)
-                param = param_en
-            val = str(workflow['Objects'][key]['Values'][ii])
-            if val == '':
-                val = '###'
-            text = text + param + ' - ' + val + '; '
-        if text[-1] != '[':
-            text = text[:-2]
-        text = text + ']'
-        if text[-4:] == ': []':
-            text = text[:-4]
-        return text
-
-    def getPriorityList(self, workflow):
-        """
-        Generate action and item priority lists based on block positions.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow entry or section data dictionary.
-
-        Returns
-        -------
-        itemPriority : list
-            List of item block identifiers sorted by positional priority.
-        actionPriority : list
-            List of action block identifiers sorted by positional priority.
+        rowNames : list
+            Parameter names of table rows.
+        colNames : list
+            Workflow names of table columns.
+        targets : dict
+            Cell targets in the format {(<row>, <column>): [<block values
+            list>, <parameter index>, <section path>, <block identifier>]}.
+        columnScenes : list
+            Workflow scene of each table column.
+
+        """
+        self.columnScenes = columnScenes
+        self.tableModel.setTable(rowNames, colNames, targets)
+        self.resizeColumnsToContents()
 
+    def onDataChanged(self, topLeft, bottomRight):
         """
-        x = []
-        y = []
-        ID = []
-        for key in workflow['Objects'].keys():
-            ID.append(workflow['Objects'][key]['ID'])
-            x.append(workflow['Objects'][key]['position'][0])
-            y.append(workflow['Objects'][key]['position'][1])
-
-        tempdict = {'ID': ID, 'X': x, 'Y': y}
-        df = pd.DataFrame(tempdict)
-        df = df.sort_values(by=['X', 'Y'])
-        priority = df.loc[:, 'ID'].tolist()
-
-        actionPriority = priority.copy()
-        itemPriority = priority.copy()
-        for key in priority:
-            if workflow['Objects'][key]['Type'] not in ['Action', 'Section']:
-                actionPriority.remove(key)
-            if workflow['Objects'][key]['Type'] != 'Item':
-                itemPriority.remove(key)
-
-        return itemPriority, actionPriority
-
-    def getItemNouns(self, keys, workflow):
-        """
-        Generate grammatical series string for all item names from keys.
-
-        Returns noun string which follows english grammatical rules for
-        listing multiple items together (e.g. A, B, and C).
-
-        Parameters
-        ----------
-        keys : list
-            List of item block identifiers to convert to string.
-        workflow : dict
-            Workflow entry or section data dictionary.
+        Mark blocks of edited cells as changed in their workflows.
 
-        Returns
-        -------
-        nounStr : str
-            Series string for all listed objects.
-
-        """
-        #  TODO: Make multilingual
-        if len(keys) == 0:
-            nounStr = ''
-        elif len(keys) == 1:
-            nounStr = self.getTranslatedNoun(
-                workflow['Objects'][keys[0]]['Name'])
-        elif len(keys) == 2:
-            nounStr = self.getTranslatedNoun(
-                workflow['Objects'][keys[0]]['Name'])
-            nounStr += ' ' + self.textconstlist[14] + ' '
-            nounStr += self.getTranslatedNoun(
-                workflow['Objects'][keys[1]]['Name'])
-        elif len(keys) > 2:
-            nounStr = ''
-            for key in keys[:-1]:
-                nounStr += self.getTranslatedNoun(
-                    workflow['Objects'][key]['Name'])
-                nounStr += ', '
-            nounStr += self.textconstlist[14] + ' '
-            nounStr += self.getTranslatedNoun(
-                workflow['Objects'][keys[-1]]['Name'])
-        return nounStr
-
-    def getTranslatedNoun(self, noun):
-        """Return translated noun with bypass error handling."""
-        try:
-            noun_nat = self.itemDict[noun][self.lankey]['Name']
-        except Exception as e:
-            print(e)
-            noun_nat = noun
-        return noun_nat
+        Method connected to dataChanged event of the table model.
 
-    def generateTextLine(self, workflow, key, priority):
         """
-        Generate protocol step line for a given action item.
-
-        Parameters
-        ----------
-        workflow : dict
-            Workflow entry or section data dictionary.
-        key : str
-            Action block identifier.
-        priority : list
-            Item block priority list sorted by position.
+        for col in range(topLeft.column(), bottomRight.column() + 1):
+            for row in range(topLeft.row(), bottomRight.row() + 1):
+                target = self.tableModel.targets.get((row, col))
+                if target is not None:
+                    self.columnScenes[col].markBlockChanged(
+                        target[2], target[3])
 
-        Returns
-        -------
-        textline : str
-            Text line for a protocol step.
+    def onCopy(self):
+        """Copy selected cell values to clipboard as tab separated text."""
+        indexes = self.selectedIndexes()
+        if indexes == []:
+            return
+        rows = [index.row() for index in indexes]
+        cols = [index.column() for index in indexes]
+
+        lines = []
+        for row in range(min(rows), max(rows) + 1):
+            line = []
+            for col in range(min(cols), max(cols) + 1):
+                value = self.tableModel.data(self.tableModel.index(row, col))
+                if value is None:
+                    value = ''
+                line.append(str(value))
+            lines.append('\t'.join(line))
+        QApplication.clipboard().setText('\n'.join(lines))
 
+    def onPaste(self):
         """
-        self.actionDict = babelFish['Action']
+        Paste tab separated clipboard text into table cells.
 
-        actionName = workflow['Objects'][key]['Name']
-        actionParent = workflow['Objects'][key]['Subtype']
+        Multiple values are pasted as a block starting from the current cell.
+        A single value is pasted into all selected cells. All values are
+        written to workflow data in one batch.
 
-        aKeys = [aKey for aKey in workflow['Objects'][key]['A In']]
-        bKeys = [bKey for bKey in workflow['Objects'][key]['B In']]
-        cKeys = [cKey for cKey in workflow['Objects'][key]['C In']]
-
-        numAIns = len(aKeys)
-        numBIns = len(bKeys)
-        numCIns = len(cKeys)
-
-        aKeys = self.sortListbyPriority(aKeys, priority)
-        bKeys = self.sortListbyPriority(bKeys, priority)
-        cKeys = self.sortListbyPriority(cKeys, priority)
-
-        itemA = self.getItemNouns(aKeys, workflow)
-        itemB = self.getItemNouns(bKeys, workflow)
-        itemC = self.getItemNouns(cKeys, workflow)
-
-        errorMsg = '**' + self.textconstlist[13] + '**'
-        def errorFunc(a, b, c): return errorMsg
-        try:
-            if actionParent == 'Add':
-                if numBIns == 0 or numAIns == 0:
-                    tempfunc = errorFunc
-                elif numBIns > 0 and numCIns == 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['00']
-                elif numBIns > 0 and numCIns > 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['01']
-    
-            if actionParent == 'Remove':
-                if numBIns == 0 or numAIns == 0:
-                    tempfunc = errorFunc
-                elif numBIns > 0 and numCIns == 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['00']
-                elif numBIns > 0 and numCIns > 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['01']
-    
-            if actionParent == 'Modify':
-                if numBIns == 0 and numCIns == 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['00']
-                elif numBIns > 0 and numCIns == 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['01']
-                elif numBIns > 0 and numCIns > 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['02']
-                elif numBIns == 0 and numCIns > 0:
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['03']
-                else:  # Special case function handling
-                    tempfunc = self.actionDict[
-                        actionName][self.lankey]['Func']['S']
-        except Exception as e:
-            print(e)
-            tempfunc = errorFunc
+        """
+        text = QApplication.clipboard().text()
+        if text == '':
+            return
+        lines = text.replace('\r\n', '\n').rstrip('\n').split('\n')
+        pasteValues = [line.split('\t') for line in lines]
+
+        cellValues = {}
+        if len(pasteValues) == 1 and len(pasteValues[0]) == 1:
+            indexes = self.selectedIndexes()
+            if indexes == []:
+                indexes = [self.currentIndex()]
+            for index in indexes:
+                if index.isValid():
+                    cellValues[(index.row(), index.column())] = pasteValues[0][0]
+        else:
+            start = self.currentIndex()
+            if not start.isValid():
+                return
+            for ii, line in enumerate(pasteValues):
+                for jj, value in enumerate(line):
+                    cellValues[(start.row() + ii, start.column() + jj)] = value
+        self.tableModel.setDataBatch(cellValues)
 
-        textline = tempfunc(itemA, itemB, itemC)
-        return textline
 
-    def sortListbyPriority(self, keys, priority):
-        """Sort item keys by positional priority."""
-        newKeys = []
-        for key in priority:
-            if key in keys:
-                newKeys.append(key)
-        return newKeys
+class TabTextBase(QTabWidget):
+    """
+    Base class for data views displaying one text tab per workflow.
 
+    Text is generated lazily. While the data view is shown, only the current
+    tab is generated, and remaining tabs are generated when they are first
+    shown. Each tab widget keeps the version of the text it displays, so
+    tabs are only regenerated after their workflow has changed.
 
-class TabRawController(QTabWidget):
-    """Manage raw workflow data display widgets."""
+    """
 
     def __init__(self, parent=None, lankey='en'):
         QTabWidget.__init__(self, parent)
         self.parent = parent
         self.lankey = lankey
+        self.entriesWorkflow = {}
+        self.entriesVersion = None
 
         self.setTabsClosable(True)
         self.setMovable(True)
 
-        rawTextTab = PlainTextClass(parent=self)
-        self.addTab(rawTextTab, 'Untitled')
+        textTab = PlainTextClass(parent=self)
+        self.addTab(textTab, 'Untitled')
 
         self.tabCloseRequested.connect(self.onClose)
         self.tabBarClicked.connect(self.onTabChange)
+        self.currentChanged.connect(self.renderTab)
 
     def onTabChange(self, index):
-        """Update all data view tabs to current."""
+        """
+        Update work flow tab in remaining data views to current index.
+
+        Method is connected to tabBarClicked event.
+
+        Parameters
+        ----------
+        index : int
+            Current work flow tab index.
+
+        """
         self.parent.subTabInd = index
         self.parent.updateCurrentTab()
         self.parent.parent.updateToolBars()
 
     def onClose(self, ind):
-        """Remove closed tab from all data views."""
+        """
+        Close work flow tab specified by index and update data views.
+
+        Parameters
+        ----------
+        ind : int
+            Index of closed work flow tab.
+
+        """
         self.parent.workflowTab.onClose(ind)
         self.removeTab(ind)
         self.parent.updateEntries()
 
-    def updateFromWorkflows(self, entriesWorkflow):
-        """Update display data from all workflows."""
-        self.clear()
-        for entryKey in entriesWorkflow.keys():
-            entryText = self.formatEntry(entriesWorkflow[entryKey])
-            entryWidget = PlainTextClass(parent=self, text='')
-            entryWidget.textWidget.setPlainText(entryText)
-            self.addTab(entryWidget, entryKey)
+    def updateFromWorkflows(self, entriesWorkflow, entriesVersion=None):
+        """
+        Update text tabs from all open workflows.
+
+        Tab widgets are reused for workflows which are still open and only
+        the current tab is regenerated.
+
+        Parameters
+        ----------
+        entriesWorkflow : dict
+            Dictionary of all workflow entry data.
+        entriesVersion : dict, optional
+            Dictionary of workflow data versions with the same keys as
+            entriesWorkflow. The default is None, which regenerates text each
+            time a tab is shown.
+
+        """
+        self.entriesWorkflow = entriesWorkflow
+        self.entriesVersion = entriesVersion
+
+        entryKeys = [entryKey for entryKey in entriesWorkflow.keys()]
+        tabKeys = [self.tabText(ii) for ii in range(self.count())]
+        if tabKeys != entryKeys:
+            entryWidgets = {self.tabText(ii): self.widget(ii)
+                            for ii in range(self.count())}
+            self.blockSignals(True)
+            self.clear()
+            for entryKey in entryKeys:
+                entryWidget = entryWidgets.pop(entryKey, None)
+                if entryWidget is None:
+                    entryWidget = PlainTextClass(parent=self, text='')
+                self.addTab(entryWidget, entryKey)
+            self.blockSignals(False)
+            for entryWidget in entryWidgets.values():
+                entryWidget.deleteLater()
+
+        self.renderTab(self.currentIndex())
+
+    def renderTab(self, index):
+        """
+        Generate text for a tab if the data view is shown and text is stale.
+
+        Method is connected to currentChanged event.
+
+        Parameters
+        ----------
+        index : int
+            Work flow tab index.
+
+        """
+        if self.parent.currentWidget() is not self:
+            return
+        entryWidget = self.widget(index)
+        entryKey = self.tabText(index)
+        if entryWidget is None or entryKey not in self.entriesWorkflow:
+            return
+
+        version = self.getEntryVersion(entryKey)
+        if version is not None and entryWidget.version == version:
+            return
+        entryText = self.getEntryText(self.entriesWorkflow[entryKey])
+        entryWidget.textWidget.setPlainText(entryText)
+        entryWidget.version = version
+
+    def getEntryVersion(self, entryKey):
+        """Return version of displayed text for a workflow, or None."""
+        if self.entriesVersion is None:
+            return None
+        return self.entriesVersion[entryKey]
+
+    def getEntryText(self, entry):
+        """Return display text for a workflow entry, by default raw data."""
+        return self.formatEntry(entry)
 
     def formatEntry(self, entry):
         """
@@ -2357,6 +1601,64 @@ class TabRawController(QTabWidget):
         return text
 
 
+class TabPlaintextController(TabTextBase):
+    """Manage plain written text protocol data view tab."""
+
+    def __init__(self, parent=None, lankey='en'):
+        self.writer = None
+        TabTextBase.__init__(self, parent, lankey)
+
+    def getEntryVersion(self, entryKey):
+        """Return version of protocol text for a workflow, or None."""
+        if self.entriesVersion is None:
+            return None
+        return (self.entriesVersion[entryKey], self.lankey)
+
+    def getEntryText(self, entry):
+        """Return protocol text for a workflow entry."""
+        return self.textFromWorkflow(entry)
+
+    def textFromWorkflow(self, workflow):
+        """
+        Generate full protocol text for a given workflow entry.
+
+        The data wrapper of the workflow scene is used if the workflow is
+        open, so cached priority orders carry over between updates.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow data dictionary.
+
+        Returns
+        -------
+        text : str
+            Full protocol text for a given work flow.
+
+        """
+        section = None
+        scene = self.parent.entriesScene.get(workflow['Name'])
+        if scene is not None and scene.mainEntry is workflow:
+            section = scene.getWorkflow()
+        return self.getWriter().textFromWorkflow(workflow, section)
+
+    def getWriter(self):
+        """
+        Return protocol writer for the current language.
+
+        The writer is kept between updates so its cached protocol fragments
+        are reused and only edited steps and sections are transcribed again.
+
+        """
+        if self.writer is None or self.writer.lankey != self.lankey:
+            self.writer = uwl.ProtocolWriter(lankey=self.lankey)
+        return self.writer
+
+
+class TabRawController(TabTextBase):
+    """Manage raw workflow data display widgets."""
+
+
 class PlainTextClass(QWidget):
     """Display plain text with custom formatting."""
 
@@ -2364,6 +1666,7 @@ class PlainTextClass(QWidget):
         QWidget.__init__(self, parent)
 
         self.text = text
+        self.version = None
         self.layout = QVBoxLayout()
         self.layout.setAlignment(Qt.AlignTop)
         self.textWidget = QTextEdit(self.text)
@@ -2676,6 +1979,7 @@ class SectionWindow(QWidget):
         self.descriptionWidget.setText(self.data['Description'])
 
         self.graphicView.scene().mainEntry = self.data
+        self.graphicView.scene().parentScene = self.item.parent
         self.graphicView.scene().addBlocksEdgesFromData()
 
     def closeEvent(self, event):
@@ -2685,8 +1989,14 @@ class SectionWindow(QWidget):
 
     def updateData(self):
         """Push section data to parent workflow."""
-        self.data['Name'] = self.nameWidget.text()
-        self.data['Description'] = self.descriptionWidget.toPlainText()
+        name = self.nameWidget.text()
+        description = self.descriptionWidget.toPlainText()
+        if [self.data['Name'], self.data['Description']] != [
+                name, description]:
+            self.data['Name'] = name
+            self.data['Description'] = description
+            self.item.parent.getWorkflow().getSection(
+                self.data['ID']).markChanged([], layout=False)
         windowTitle = self.data['Name']
         if windowTitle == '':
             windowTitle = '(Untitled)'
@@ -2712,15 +2022,95 @@ class SceneClass(QGraphicsScene):
         self.lankey = lankey
         self.selectMemory = []
         self.temppos = []
-        self.mainEntry = {'Name': '',
-                          'language': self.lankey,
-                          'Type': 'root',
-                          'File': '',
-                          'Description': '',
-                          'Objects': {}
-                          }
+        self.mainEntry = uwl.Workflow(lankey=self.lankey).data
+        self.workflow = None
+        self.history = uwl.History()
+        self.tooltipRenderer = uwl.TooltipRenderer()
+        self.dragStart = []
+        self.parentScene = None
+        self.metaVersion = 0
 
         self.objectKeys = []
+        self.blockItems = {}
+
+    def getWorkflow(self):
+        """Return data wrapper for the current workflow or section entry."""
+        self.syncMainEntry()
+        return self.workflow
+
+    def syncMainEntry(self):
+        """
+        Replace the data wrapper if the mainEntry attribute was reassigned.
+
+        The wrapper and its edge index are kept between calls. Undo history
+        of the previous entry is cleared when the wrapper is replaced. Section
+        scenes use the nested section wrapper kept by the scene holding the
+        section, so both scenes share one edge index.
+
+        """
+        if self.workflow is not None and self.workflow.data is self.mainEntry:
+            return
+        workflow = None
+        if self.parentScene is not None:
+            workflow = self.parentScene.getWorkflow().findSection(
+                self.mainEntry)
+        if workflow is None:
+            workflow = uwl.Section(self.mainEntry)
+        self.workflow = workflow
+        self.history.clear()
+
+    @property
+    def blockVersion(self):
+        """
+        Data version of the blocks in the workflow or section entry.
+
+        Versions are drawn from a counter shared by all wrappers, so a version
+        number identifies a single state of a single entry. Data views store
+        the versions they last rendered and only recompute stale entries.
+
+        """
+        return self.getWorkflow().version
+
+    @property
+    def version(self):
+        """Data version of the entry including name, file and description."""
+        return max(self.blockVersion, self.metaVersion)
+
+    def markChanged(self, blocks=True):
+        """
+        Give the workflow or section entry a new data version.
+
+        Only needed for data changed outside the data wrapper, which versions
+        its own changes.
+
+        Parameters
+        ----------
+        blocks : bool, optional
+            False if only the entry name, file, or description changed, which
+            leaves block parameter data current. The default is True.
+
+        """
+        if blocks or self.parentScene is not None:
+            self.getWorkflow().markChanged()
+        else:
+            self.metaVersion = uwl.newVersion()
+
+    def markBlockChanged(self, sectionPath, key):
+        """
+        Give a block changed outside the data wrapper a new data version.
+
+        Parameters
+        ----------
+        sectionPath : list
+            Identifiers of the sections holding the block, outermost first.
+        key : str
+            Block identifier.
+
+        """
+        section = self.getWorkflow()
+        for sectionKey in sectionPath:
+            section = section.getSection(sectionKey)
+        section.markChanged([key], layout=False)
 
     def mouseMoveEvent(self, event):
         """Update saved mouse position and pass event forward."""
@@ -2852,6 +2242,28 @@ class SceneClass(QGraphicsScene):
         elif event.key() == Qt.Key_A and mods == Qt.ControlModifier:
             self.onSelectAll()
 
+        elif event.key() == Qt.Key_Z and mods == Qt.ControlModifier:
+            self.onUndo()
+
+        elif event.key() == Qt.Key_Y and mods == Qt.ControlModifier:
+            self.onRedo()
+
+        elif event.key() == Qt.Key_Z and mods == (
+                Qt.ShiftModifier | Qt.ControlModifier):
+            self.onRedo()
+
+    def onUndo(self):
+        """Undo most recent change to workflow and update scene."""
+        workflow = self.getWorkflow()
+        if self.history.undo(workflow):
+            self.addBlocksEdgesFromData()
+
+    def onRedo(self):
+        """Redo most recently undone change and update scene."""
+        workflow = self.getWorkflow()
+        if self.history.redo(workflow):
+            self.addBlocksEdgesFromData()
+
     def checkIfBlocksConnectable(self):
         """
         Return whether selected blocks are connectable.
@@ -2945,76 +2357,40 @@ class SceneClass(QGraphicsScene):
         if self.newdata['Type'] != 'Item':
             return
         if self.newdata['Link']:
-            linkID = self.newdata['Link ID']
             currInd = self.rootwindow.centralWidget().widget(0).currentIndex()
-            entry = self.rootwindow.centralWidget().widget(
-                0).widget(currInd).scene().mainEntry
-            entry = self.writeLinkedDatabySection(
-                entry, linkID)
-            self.rootwindow.centralWidget().widget(
-                0).widget(currInd).scene().mainEntry = entry
-
-    def writeLinkedDatabySection(self, section, linkID):
-        """
-        Check all blocks in workflow for current link and update linked data.
-
-        If current workflow or section contains another section, iterate method
-        through section.
-
-        Parameters
-        ----------
-        section : dict
-            Workflow or section data entry dictionary.
-        linkID : str
-            Link indentifier string.
-
-        Returns
-        -------
-        section : dict
-            Updated section or workflow data dictionary.
+            rootScene = self.rootwindow.centralWidget().widget(
+                0).widget(currInd).scene()
+            changes = rootScene.getWorkflow().writeLinkedData(self.newdata)
+            if changes != []:
+                self.history.push(uwl.EditBlockCommand(changes), merge=True)
 
+    def updateEdgeData(self):
         """
-        for key in section['Objects']:
-            if section['Objects'][key]['Type'] != 'Item':
-                continue
-            if not section['Objects'][key]['Link']:
-                continue
-            if section['Objects'][key]['Link ID'] == linkID:
-                oldpos = section['Objects'][key]['position'].copy()
-                section['Objects'][key] = self.newdata.copy()
-                section['Objects'][key]['position'] = oldpos
-                section['Objects'][key]['ID'] = key
-
-        for key in section['Objects']:
-            if section['Objects'][key]['Type'] == 'Section':
-                section['Objects'][key] = self.writeLinkedDatabySection(
-                    section['Objects'][key], linkID)
-        return section
+        Update workflow edge data to match the edges in the scene.
 
-    def updateEdgeData(self):
-        """Iterate through scene objects and add edge data to workflow."""
-        for ii in [*self.mainEntry['Objects']]:
-            if self.mainEntry['Objects'][ii]['Type'] == 'Action':
-                self.mainEntry['Objects'][ii]['A In'] = []
-                self.mainEntry['Objects'][ii]['B In'] = []
-                self.mainEntry['Objects'][ii]['C In'] = []
+        Only edges missing from either side are removed or added, so the
+        order of connection lists is kept.
 
+        """
+        workflow = self.getWorkflow()
+        sceneEdges = []
         for item in self.items():
             if str(type(item)) == "<class '__main__.Edge'>":
                 if item.edgeType == 'L':
                     continue
-                A_list = self.mainEntry['Objects'][item.destID]['A In']
-                B_list = self.mainEntry['Objects'][item.destID]['B In']
-                C_list = self.mainEntry['Objects'][item.destID]['C In']
-                if item.edgeType == 'A' and item.sourceID not in A_list:
-                    self.mainEntry['Objects'][item.destID]['A In'].append(
-                        item.sourceID)
-                elif item.edgeType == 'B' and item.sourceID not in B_list:
-                    self.mainEntry['Objects'][item.destID]['B In'].append(
-                        item.sourceID)
-                elif item.edgeType == 'C' and item.sourceID not in C_list:
-                    self.mainEntry['Objects'][item.destID]['C In'].append(
-                        item.sourceID)
+                sceneEdges.append((item.sourceID, item.destID, item.edgeType))
+
+        edgeIndex = workflow.getEdgeIndex()
+        dataEdges = [(sourceKey, destKey, edgeType)
+                     for destKey, types in edgeIndex.forward.items()
+                     for edgeType, sourceKeys in types.items()
+                     for sourceKey in sourceKeys]
+        sceneEdgeSet = set(sceneEdges)
+        for sourceKey, destKey, edgeType in dataEdges:
+            if (sourceKey, destKey, edgeType) not in sceneEdgeSet:
+                workflow.removeEdge(sourceKey, destKey, edgeType)
+        for sourceKey, destKey, edgeType in sceneEdges:
+            workflow.addEdge(sourceKey, destKey, edgeType)
 
     def getBlockKeys(self):
         """Get identifiers for all objects in current workflow or scene."""
@@ -3022,19 +2398,45 @@ class SceneClass(QGraphicsScene):
             self.objectKeys = [key for key in self.mainEntry['Objects'].keys()]
 
     def mousePressEvent(self, event):
-        """Update old data and position on mouse press then forward event."""
+        """Forward mouse press then save positions of selected blocks."""
         if event.button() == Qt.LeftButton:
             self.temppos = event.scenePos()
-            self.olddata = copy.deepcopy(self.mainEntry)
         QGraphicsScene.mousePressEvent(self, event)
+        if event.button() == Qt.LeftButton:
+            self.dragStart = self.getSelectedBlockPositions()
 
     def mouseReleaseEvent(self, event):
-        """Forward mouse release then update graphics data if changed."""
+        """Forward mouse release then record and update any block moves."""
         QGraphicsScene.mouseReleaseEvent(self, event)
         if event.button() == Qt.LeftButton:
-            if self.olddata != self.mainEntry:
+            moves = []
+            for block, oldpos in self.dragStart:
+                if block['position'] != oldpos:
+                    moves.append([block, oldpos, list(block['position'])])
+            self.dragStart = []
+            if moves != []:
+                self.history.push(uwl.MoveCommand(moves))
                 self.addBlocksEdgesFromData()
 
+    def getSelectedBlockPositions(self):
+        """
+        Return data and positions of all selected blocks and sections.
+
+        Returns
+        -------
+        positions : list
+            List of selected blocks in the format [<block data>,
+            <position>].
+
+        """
+        positions = []
+        for item in self.selectedItems():
+            blocktypestr = "<class '__main__.Block.<locals>.BlockBase'>"
+            if str(type(item)) in [blocktypestr,
+                                   "<class '__main__.Section'>"]:
+                positions.append([item.data, list(item.data['position'])])
+        return positions
+
     def mouseDoubleClickEvent(self, event):
         """Start object modification if graphic item selected."""
         if event.button() == Qt.LeftButton:
@@ -3094,6 +2496,13 @@ class SceneClass(QGraphicsScene):
 
     def onChangeEdgetoType(self, event, edge, edgeType):
         """Apply selected edge type change."""
+        if edgeType != edge.edgeType:
+            index = self.getWorkflow().getEdgePosition(
+                edge.source.data['ID'], edge.dest.data['ID'], edge.edgeType)
+            self.history.push(uwl.EdgeCommand(
+                added=[[edge.source.data, edge.dest.data, edgeType]],
+                removed=[[edge.source.data, edge.dest.data, edge.edgeType,
+                          index]]))
         edge.edgeType = edgeType
         self.updateEntryEdges()
         for item in self.selectedItems():
@@ -3119,25 +2528,22 @@ class SceneClass(QGraphicsScene):
                 elif item.data['Type'] == 'Action':
                     actionList.append(item)
 
+        workflow = self.getWorkflow()
+        added = []
         for item_in in actionList:
             for item_out in itemList:
                 itemID = item_out.data['ID']
                 actionID = item_in.data['ID']
-                connectIDs = []
-                for ID in self.mainEntry['Objects'][actionID]['A In']:
-                    connectIDs.append(ID)
-                for ID in self.mainEntry['Objects'][actionID]['B In']:
-                    connectIDs.append(ID)
-                for ID in self.mainEntry['Objects'][actionID]['C In']:
-                    connectIDs.append(ID)
-
-                edgeExists = (itemID in connectIDs)
+                edgeExists = workflow.hasEdge(itemID, actionID)
                 if not edgeExists:
                     edge = Edge(item_out, item_in, edgeType, self)
                     self.addItem(edge)
+                    added.append([item_out.data, item_in.data, edgeType])
 
         self.clearSelection()
         self.updateEntryEdges()
+        if added != []:
+            self.history.push(uwl.EdgeCommand(added=added))
 
         self.updateBlockPositionData()
 
@@ -3150,35 +2556,51 @@ class SceneClass(QGraphicsScene):
         """Delete all selected graphics items."""
         if len(self.selectedItems()) > 0:
             itemlist = self.selectedItems()
+            workflow = self.getWorkflow()
+            blocks = []
             for item in itemlist:
                 blocktypestr = "<class '__main__.Block.<locals>.BlockBase'>"
-                if str(type(item)) == blocktypestr:
-                    for edge in item.edges:
-                        self.removeItem(edge)
-                    del self.mainEntry['Objects'][str(item.data['ID'])]
-                    self.removeItem(item)
-                elif str(type(item)) == "<class '__main__.Section'>":
-                    del self.mainEntry['Objects'][str(item.data['ID'])]
-                    self.removeItem(item)
+                if str(type(item)) in [blocktypestr,
+                                       "<class '__main__.Section'>"]:
+                    blocks.append(
+                        self.mainEntry['Objects'][str(item.data['ID'])])
+                    self.removeBlockItem(item)
+            deleteCommand = uwl.DeleteBlocksCommand(blocks)
+            deleteCommand.redo(workflow)
 
             itemlist = self.selectedItems()
+            removed = []
             for item in itemlist:
                 if str(type(item)) == "<class '__main__.Edge'>":
-                    self.deleteEdgeData(item)
-                self.removeItem(item)
+                    index = workflow.getEdgePosition(
+                        item.source.data['ID'], item.dest.data['ID'],
+                        item.edgeType)
+                    edgeType = self.deleteEdgeData(item)
+                    if edgeType is not None:
+                        removed.append([item.source.data, item.dest.data,
+                                        edgeType, index])
+                    self.removeEdgeItem(item)
+                else:
+                    self.removeItem(item)
+
+            if blocks != [] or removed != []:
+                self.history.push(uwl.CommandGroup(
+                    [deleteCommand, uwl.EdgeCommand(removed=removed)]))
             self.addBlocksEdgesFromData()
 
     def deleteEdgeData(self, item):
-        """Delete data of selected edge from workflow data."""
+        """
+        Delete data of selected edge from workflow data.
+
+        Returns
+        -------
+        edgeType : {'A','B','C'} or None
+            Type of the removed connection. None if no connection was found.
+
+        """
         outID = item.source.data['ID']
         inID = item.dest.data['ID']
-
-        if outID in self.mainEntry['Objects'][inID]['A In']:
-            self.mainEntry['Objects'][inID]['A In'].remove(outID)
-        elif outID in self.mainEntry['Objects'][inID]['B In']:
-            self.mainEntry['Objects'][inID]['B In'].remove(outID)
-        elif outID in self.mainEntry['Objects'][inID]['C In']:
-            self.mainEntry['Objects'][inID]['C In'].remove(outID)
+        return self.getWorkflow().removeEdge(outID, inID, item.edgeType)
 
     def transferWindowData(self, data):
         """Update block data in workflow on window close."""
@@ -3190,8 +2612,14 @@ class SceneClass(QGraphicsScene):
         self.blockdata = self.newdata
         entryID = self.blockdata['ID']
 
+        olddata = self.mainEntry['Objects'].get(entryID)
         tempdata = self.blockdata.copy()
-        self.mainEntry['Objects'][entryID] = tempdata
+        self.getWorkflow().addBlock(tempdata)
+        if olddata is None:
+            self.history.push(uwl.AddBlocksCommand([tempdata]))
+        elif tempdata['Type'] != 'Section':
+            self.history.push(uwl.EditBlockCommand(
+                [[self.mainEntry, olddata, tempdata]]))
         self.addBlocksEdgesFromData()
         self.updateEdgeData()
         self.updateEntryEdges()
@@ -3203,32 +2631,36 @@ class SceneClass(QGraphicsScene):
 
     def updateBlockPositionData(self):
         """Update workflow block positions from graphics scene."""
-        for item in self.items():
-            if str(type(item)) in [
-                    "<class '__main__.Block.<locals>.BlockBase'>",
-                    "<class '__main__.Section'>"]:
-                ID = item.data['ID']
-                self.mainEntry['Objects'][ID]['position'] = [
-                    int(item.pos().x()), int(item.pos().y())]
-                item.data['position'] = [
-                    int(item.pos().x()), int(item.pos().y())]
-
-                if item.data['Type'] == 'Action':
-                    workflow = copy.deepcopy(self.mainEntry)
-                    key = item.data['ID']
-                    tooltiptext = self.getTooltipLine(key, workflow)
-                    item.setToolTipText(tooltiptext)
-
-    def getTooltipLine(self, key, workflow):
+        workflow = self.getWorkflow()
+        for item in self.blockItems.values():
+            position = [int(item.pos().x()), int(item.pos().y())]
+            workflow.setBlockPosition(item.data['ID'], position)
+            item.data['position'] = position
+
+        itemRanks = workflow.getItemPriorityRanks()
+        for item in self.blockItems.values():
+            if item.data['Type'] == 'Action':
+                key = item.data['ID']
+                tooltiptext = self.getTooltipLine(
+                    key, self.mainEntry, itemRanks)
+                item.setToolTipText(tooltiptext)
+
+    def getTooltipLine(self, key, workflow, itemRanks=None):
         """
         Return tooltip text for the current protocol step.
 
+        Steps are cached per block and only transcribed again when the
+        connections of the action or the language change.
+
         Parameters
         ----------
         key : str
             Action block identifier.
         workflow : dict
             Workflow or section entry data dictionary.
+        itemRanks : dict, optional
+            Item block positional ranks from Section.getItemPriorityRanks. The
+            default is None, which looks up the ranks of the workflow.
 
         Returns
         -------
@@ -3236,39 +2668,23 @@ class SceneClass(QGraphicsScene):
             Protocol step for the specified action.
 
         """
-        itemPriority, actionPriority = TabPlaintextController(
-            lankey=self.lankey).getPriorityList(workflow)
-        textline = TabPlaintextController(
-            lankey=self.lankey).generateTextLine(workflow, key, itemPriority)
-        block = workflow['Objects'][key]
-        if block['A In'] == [] and block['B In'] == [] and block['C In'] == []:
-            speciallist = ['Wait']
-            if workflow['Objects'][key]['Name'] not in speciallist:
-                textline = ''
-        return textline
+        return self.tooltipRenderer.getTooltipLine(
+            workflow, key, self.lankey, itemRanks)
 
     def normalizeBlockPositions(self):
         """Shift all blocks so that the top left is at position (100,100)."""
         minX = 99999999
         minY = 99999999
-        for item in self.items():
-            isBlock = str(
-                type(item)) == "<class '__main__.Block.<locals>.BlockBase'>"
-            isSection = str(type(item)) == "<class '__main__.Section'>"
-            if isBlock or isSection:
-                if item.pos().x() < minX:
-                    minX = item.pos().x()
-                if item.pos().y() < minY:
-                    minY = item.pos().y()
-        for item in self.items():
-            isBlock = str(
-                type(item)) == "<class '__main__.Block.<locals>.BlockBase'>"
-            isSection = str(type(item)) == "<class '__main__.Section'>"
-            if isBlock or isSection:
-                ID = item.data['ID']
-                self.mainEntry['Objects'][ID]['position'] = [
-                    int(item.pos().x() - minX + 100),
-                    int(item.pos().y() - minY + 100)]
+        for item in self.blockItems.values():
+            if item.pos().x() < minX:
+                minX = item.pos().x()
+            if item.pos().y() < minY:
+                minY = item.pos().y()
+        workflow = self.getWorkflow()
+        for item in self.blockItems.values():
+            workflow.setBlockPosition(item.data['ID'], [
+                int(item.pos().x() - minX + 100),
+                int(item.pos().y() - minY + 100)])
 
     def onSave(self, filename):
         """
@@ -3287,6 +2703,7 @@ class SceneClass(QGraphicsScene):
         tabname = os.path.splitext(tabname)[0]
         self.mainEntry['Name'] = tabname
         self.mainEntry['File'] = filename
+        self.markChanged(blocks=False)
         self.parent.parent.parent.updateEntries()
         savejson(self.mainEntry, filename)
         self.lastSaveEntry = copy.deepcopy(self.mainEntry)
@@ -3309,6 +2726,7 @@ class SceneClass(QGraphicsScene):
         tabname = os.path.splitext(tabname)[0]
         self.mainEntry['Name'] = tabname
         self.mainEntry['File'] = filename
+        self.markChanged(blocks=False)
         self.parent.parent.parent.updateEntries()
 
         savejson(self.mainEntry, filename)
@@ -3349,13 +2767,9 @@ class SceneClass(QGraphicsScene):
         clipboard = {'ID': 'root',
                      'Objects': {}}
 
-        for item in self.items():
-            isBlock = (str(type(item)) ==
-                       "<class '__main__.Block.<locals>.BlockBase'>")
-            isSection = (str(type(item)) == "<class '__main__.Section'>")
-            if isBlock or isSection:
-                if item.isSelected():
-                    clipboard['Objects'][item.data['ID']] = item.data
+        for item in self.blockItems.values():
+            if item.isSelected():
+                clipboard['Objects'][item.data['ID']] = item.data
         print(clipboard)
         clipboard = self.normalizeClipboard(clipboard)
         print(clipboard)
@@ -3420,13 +2834,14 @@ class SceneClass(QGraphicsScene):
 
 
         if self.mainEntry['Objects'] == {}:
-            self.mainEntry['Objects'] = importData['Objects']
             newKeys = [k for k in importData['Objects'].keys()]
         else:
             importData = self.removeDislocatedEdges(importData)
             importData, newKeys = self.replaceImportDataKeys(importData)
-            self.appendImportData(importData)
+        self.appendImportData(importData)
 
+        self.history.push(uwl.AddBlocksCommand(
+            [self.mainEntry['Objects'][key] for key in newKeys]))
         self.addBlocksEdgesFromData()
 
         # TODO: Highlight on import broken. Keys get shuffled with new blocks.
@@ -3466,82 +2881,27 @@ class SceneClass(QGraphicsScene):
 
     def removeDislocatedEdges(self, importData):
         """Delete all edges with missing source or destination block."""
-        keys = [k for k in importData['Objects'].keys()]
-        for key in keys:
-            if importData['Objects'][key]['Type'] != 'Action':
-                continue
-            for cKey in importData['Objects'][key]['C In']:
-                if cKey not in keys:
-                    importData['Objects'][key]['C In'].remove(cKey)
-            for bKey in importData['Objects'][key]['B In']:
-                if bKey not in keys:
-                    importData['Objects'][key]['B In'].remove(bKey)
-            for aKey in importData['Objects'][key]['A In']:
-                if aKey not in keys:
-                    importData['Objects'][key]['A In'].remove(aKey)
+        uwl.Section(importData).removeDislocatedEdges()
         return importData
 
     def replaceImportDataKeys(self, importData):
         """Update import block keys to ensure unique values."""
-        mainData = self.mainEntry
-        mainKeys = [k for k in mainData['Objects'].keys()]
-        mainKeysint = [int(k) for k in mainKeys]
-
-        importKeys = [k for k in importData['Objects'].keys()]
-        for importKey in importKeys:
-            importData = self.replaceAllKeyInstances(
-                importData, importKey, importKey + 'n')
-
-        importKeys = [k for k in importData['Objects'].keys()]
-        importKeys_new = []
-        for importKey in importKeys:
-            newImportKey = str(max(mainKeysint)+1)
-            mainKeysint.append(int(newImportKey))
-            importData = self.replaceAllKeyInstances(
-                importData, importKey, newImportKey)
-            importKeys_new.append(newImportKey)
-
-        return importData, importKeys_new
-
-    def replaceAllKeyInstances(self, data, oldKey, newKey):
-        """Replace old block key values with new key values."""
-        newData = copy.deepcopy(data)
-
-        # Replace all instances of keys within object dictionary items
-        for dataKey in data['Objects'].keys():
-            if data['Objects'][dataKey]['ID'] == oldKey:
-                newData['Objects'][dataKey]['ID'] = newKey
-
-            if data['Objects'][dataKey]['Type'] != 'Action':
-                continue
-
-            for ii in range(len(data['Objects'][dataKey]['A In'])):
-                if data['Objects'][dataKey]['A In'][ii] == oldKey:
-                    newData['Objects'][dataKey]['A In'][ii] = newKey
-
-            for ii in range(len(data['Objects'][dataKey]['B In'])):
-                if data['Objects'][dataKey]['B In'][ii] == oldKey:
-                    newData['Objects'][dataKey]['B In'][ii] = newKey
-
-            for ii in range(len(data['Objects'][dataKey]['C In'])):
-                if data['Objects'][dataKey]['C In'][ii] == oldKey:
-                    newData['Objects'][dataKey]['C In'][ii] = newKey
+        mainKeysint = [int(k) for k in self.mainEntry['Objects'].keys()]
+        nextKey = max(mainKeysint) + 1
 
-        # Replace keys in object dictionary
-        mainKeys = [k for k in data['Objects'].keys()]
-        for dataKey in mainKeys:
-            if dataKey == oldKey:
-                newData['Objects'][newKey] = newData['Objects'][oldKey]
-                del newData['Objects'][oldKey]
+        keyMap = {}
+        for ii, importKey in enumerate(importData['Objects'].keys()):
+            keyMap[importKey] = str(nextKey + ii)
+        uwl.Section(importData).swapKeys(keyMap)
+        importKeys_new = [k for k in keyMap.values()]
 
-        return newData
+        return importData, importKeys_new
 
     def appendImportData(self, importData):
         """Add imported data to full workflow data."""
-        importKeys = [k for k in importData['Objects'].keys()]
-        for importKey in importKeys:
-            self.mainEntry[
-                'Objects'][importKey] = importData['Objects'][importKey]
+        workflow = self.getWorkflow()
+        for blockData in importData['Objects'].values():
+            workflow.addBlock(blockData)
 
     def onOpen(self, filename):
         """Open .json file as new workflow entry."""
@@ -3555,217 +2915,208 @@ class SceneClass(QGraphicsScene):
         self.addBlocksEdgesFromData()
 
     def addBlocksEdgesFromData(self):
-        """Rebuild all blocks and edges in workflow."""
-        self.clearScene()
+        """
+        Reconcile all blocks and edges in scene with workflow data.
+
+        Graphics items already in the scene are matched to workflow blocks
+        through their identifiers and updated in place. Only blocks and edges
+        which were added, removed, or changed type are created or deleted.
+
+        """
         self.forceUniqueBlockIDs()
+        self.renumberBlockItems()
 
         newdata = self.mainEntry
         self.getBlockKeys()
 
-        self.buildBlockGridIndex(newdata)
-        self.setBlockPosfromGridIndex(newdata)
-
-        for ii in newdata['Objects'].keys():
-            if newdata['Objects'][ii]['Type'] != 'Action':
-                continue
-            item_in = self.getBlockItemFromKey(ii)
-            for outlet in newdata['Objects'][ii]['A In']:
-                for blockKey in self.objectKeys:
-                    if outlet == blockKey:
-                        item_out = self.getBlockItemFromKey(outlet)
-                        edge = Edge(item_out, item_in, 'A', self)
-                        self.addItem(edge)
-
-            for outlet in newdata['Objects'][ii]['B In']:
-                for blockKey in self.objectKeys:
-                    if outlet == blockKey:
-                        item_out = self.getBlockItemFromKey(outlet)
-                        edge = Edge(item_out, item_in, 'B', self)
-                        self.addItem(edge)
-
-            for outlet in newdata['Objects'][ii]['C In']:
-                for blockKey in self.objectKeys:
-                    if outlet == blockKey:
-                        item_out = self.getBlockItemFromKey(outlet)
-                        edge = Edge(item_out, item_in, 'C', self)
-                        self.addItem(edge)
+        self.reconcileBlocks(newdata)
+        self.reconcileEdges(newdata)
 
         self.updateBlockPositionData()
-        self.updateSequenceEdges(newdata)
 
-    def clearScene(self):
-        """Remove all graphics items in scene."""
-        for item in self.items():
-            self.removeItem(item)
+    def renumberBlockItems(self):
+        """
+        Rekey block item registry to match updated block identifiers.
 
-    def forceUniqueBlockIDs(self):
-        """Force all blocks to have unique IDs throughout workflow."""
-        if self.mainEntry['Type'] != 'root':
-            return
-        data = copy.deepcopy(self.mainEntry)
-        newdata, nBlocks = self.forceUniqueBlockIDsbySection(data)
-        self.mainEntry = newdata
+        Block items are moved to their new identifiers in the blockItems class
+        attribute with the blockKeyMap class attribute. Block items without a
+        new identifier are removed from the scene.
+
+        """
+        oldBlockItems = self.blockItems
+        self.blockItems = {}
+        for oldKey, item in oldBlockItems.items():
+            if item.scene() is not self:
+                continue
+            if oldKey in self.blockKeyMap:
+                self.blockItems[self.blockKeyMap[oldKey]] = item
+            else:
+                self.removeBlockItem(item)
 
-    def forceUniqueBlockIDsbySection(self, section, indx=-1):
+    def reconcileBlocks(self, data):
         """
-        Rewrite block identifiers to always be unique.
+        Add, remove, and update block graphics items to match workflow data.
 
         Parameters
         ----------
-        section : dict
-            Workflow or section data entry.
-        indx : int, optional
-            Most recent block identifier index. The default is -1.
-
-        Returns
-        -------
-        newsection : dict
-            Updated workflow or section entry.
-        indx : int
-            Updated most recent block identifier index.
+        data : dict
+            Workflow or section data entry dictionary.
 
         """
-        newsection = copy.deepcopy(section)
-        prioritylist = self.getPriorityList(newsection)
-        keypairs = []
-        for key in prioritylist:
-            indx += 1
-            keypairs.append([key, str(indx)])
-        newsection = self.swapKeyPairsinSection(newsection, keypairs)
-
-        for key in newsection['Objects'].keys():
-            if newsection['Objects'][key]['Type'] == 'Section':
-                newsection[
-                    'Objects'][key], indx = self.forceUniqueBlockIDsbySection(
-                        newsection['Objects'][key], indx)
-
-        return newsection, indx
-
-    def getPriorityList(self, workflow):
-        """
-        Return list of all block identifiers in position order.
+        for key in [*self.blockItems]:
+            item = self.blockItems[key]
+            if key not in data['Objects']:
+                self.removeBlockItem(item)
+            elif item.blockType != data['Objects'][key]['Type']:
+                self.removeBlockItem(item)
 
-        Parameters
-        ----------
-        workflow : dict
-            Workflow or section data entry.
+        for key in data['Objects'].keys():
+            blockData = data['Objects'][key]
+            if key in self.blockItems:
+                self.updateBlockItem(self.blockItems[key], blockData)
+            else:
+                self.createBlockItem(blockData)
+
+    def createBlockItem(self, blockData):
+        """Create, position, and add graphics item for block data."""
+        blockType = blockData['Type']
+        position = blockData['position']
+        if blockType in ['Action', 'Item']:
+            block = Block(blockType=blockType, data=blockData,
+                          parent=self, lankey=self.lankey)
+        elif blockType == 'Section':
+            block = Section(parent=self, data=blockData)
+        self.addItem(block)
+        block.setPos(QPoint(position[0], position[1]))
+        self.blockItems[blockData['ID']] = block
+        return block
+
+    def updateBlockItem(self, item, blockData):
+        """Point existing graphics item to block data and refresh display."""
+        position = blockData['position']
+        item.data = blockData
+        if item.blockType == 'Section':
+            text = blockData['Name']
+        else:
+            item.lankey = self.lankey
+            text = item.convertBlockDatatoText(blockData)
+            item.setBorderPen()
+
+        if text != item.text:
+            item.text = text
+            item.textItem.changeText(text)
+
+        if [item.pos().x(), item.pos().y()] != position:
+            item.setPos(position[0], position[1])
+
+    def removeBlockItem(self, item):
+        """Remove block graphics item and all connected edges from scene."""
+        for edge in item.edges.copy():
+            self.removeEdgeItem(edge)
+        if item.scene() is self:
+            self.removeItem(item)
+        if self.blockItems.get(item.data['ID']) is item:
+            del self.blockItems[item.data['ID']]
 
-        Returns
-        -------
-        priority : list
-            List of block identifiers in position order.
+    def removeEdgeItem(self, edge):
+        """Remove edge graphics item from scene and from connected blocks."""
+        edge.source.removeEdge(edge)
+        edge.dest.removeEdge(edge)
+        if edge.scene() is self:
+            self.removeItem(edge)
 
+    def reconcileEdges(self, data):
         """
-        x = []
-        y = []
-        ID = []
-        for key in workflow['Objects'].keys():
-            ID.append(workflow['Objects'][key]['ID'])
-            x.append(workflow['Objects'][key]['position'][0])
-            y.append(workflow['Objects'][key]['position'][1])
-
-        tempdict = {'ID': ID, 'X': x, 'Y': y}
-        df = pd.DataFrame(tempdict)
-        df = df.sort_values(by=['X', 'Y'])
-        priority = df.loc[:, 'ID'].tolist()
-
-        return priority
-
-    def swapKeyPairsinSection(self, section, keypairs):
-        """
-        Update section block keys with new keys.
+        Add and remove edge graphics items to match workflow data.
+
+        Edges are identified by source block, destination block, and edge
+        type. Existing edges which are still listed in the workflow data are
+        kept and repositioned.
 
         Parameters
         ----------
-        section : dict
-            Workflow entry data dictionary.
-        keypairs : list
-            List of block key pairs to replace in workflow. Key pairs are in
-            the format [<old_key>, <new_key>].
-
-        Returns
-        -------
-        newsection : dict
-            Updated workflow entry data dictionary.
+        data : dict
+            Workflow or section data entry dictionary.
 
         """
-        tempsection = copy.deepcopy(section)
-        linkTypes = ['A In', 'B In', 'C In']
-        for keypair in keypairs:
-            for key in section['Objects'].keys():
-                if section['Objects'][key]['Type'] != 'Action':
-                    continue
-                for linkType in linkTypes:
-                    for ii, link in enumerate(
-                            section['Objects'][key][linkType]):
-                        if link == keypair[0]:
-                            tempsection[
-                                'Objects'][key][linkType][ii] = keypair[1]+'n'
-
-        for keypair in keypairs:
-            tempsection['Objects'][keypair[1] + 'n'
-                                   ] = tempsection['Objects'].pop(keypair[0])
-
-        newsection = copy.deepcopy(tempsection)
-        for key in tempsection['Objects'].keys():
-            if tempsection['Objects'][key]['Type'] != 'Action':
+        edgeKeys = []
+        for key in data['Objects'].keys():
+            if data['Objects'][key]['Type'] != 'Action':
                 continue
-            for linkType in linkTypes:
-                for ii, link in enumerate(
-                        tempsection['Objects'][key][linkType]):
-                    newsection['Objects'][key][linkType][ii] = tempsection[
-                        'Objects'][key][linkType][ii][:-1]
+            for edgeType in ['A', 'B', 'C']:
+                for outlet in data['Objects'][key][edgeType + ' In']:
+                    if outlet in self.blockItems:
+                        edgeKeys.append((outlet, key, edgeType))
+        edgeKeys += self.getSequenceEdgeKeys(data)
+
+        existingEdges = {}
+        for item in self.blockItems.values():
+            for edge in item.edges.copy():
+                if edge.scene() is not self:
+                    item.removeEdge(edge)
+                    continue
+                edgeKey = (edge.source.data['ID'], edge.dest.data['ID'],
+                           edge.edgeType)
+                if edgeKey in existingEdges:
+                    if existingEdges[edgeKey] is not edge:
+                        self.removeEdgeItem(edge)
+                    continue
+                existingEdges[edgeKey] = edge
+
+        for edgeKey in set(existingEdges) - set(edgeKeys):
+            self.removeEdgeItem(existingEdges.pop(edgeKey))
 
-        for key in tempsection['Objects'].keys():
-            newsection['Objects'][key[:-1]] = newsection['Objects'].pop(key)
-            newsection['Objects'][key[:-1]]['ID'] = key[:-1]
+        for edgeKey in edgeKeys:
+            if edgeKey in existingEdges:
+                edge = existingEdges[edgeKey]
+                edge.sourceID = edgeKey[0]
+                edge.destID = edgeKey[1]
+                edge.adjust()
+            else:
+                edge = Edge(self.getBlockItemFromKey(edgeKey[0]),
+                            self.getBlockItemFromKey(edgeKey[1]),
+                            edgeKey[2], self)
+                self.addItem(edge)
+                existingEdges[edgeKey] = edge
+
+    def forceUniqueBlockIDs(self):
+        """
+        Force all blocks to have unique IDs throughout workflow.
 
-        return newsection
+        The mapping of top level block identifiers from before to after the
+        update is stored in the blockKeyMap class attribute.
 
-    def buildBlockGridIndex(self, data):
         """
-        Build key table to provide position for all blocks in workflow.
+        if self.mainEntry['Type'] != 'root':
+            self.blockKeyMap = {
+                key: key for key in self.mainEntry['Objects'].keys()}
+            return
+        self.blockKeyMap, nBlocks = self.getWorkflow().forceUniqueBlockIDs()
 
-        Key table is listed under class attribute gridIndices under the format
-        [[<key>, <x-postion>, <y-postion>],...].
+    def getSequenceEdgeKeys(self, data):
+        """
+        Return guideline edge keys between action blocks to show sequence.
 
         Parameters
         ----------
         data : dict
             Workflow or section data entry dictionary.
 
+        Returns
+        -------
+        edgeKeys : list
+            List of edge keys in the format (<source key>, <destination key>,
+            'L') between consecutive action and section blocks.
+
         """
-        objdata = data['Objects']
-        self.gridIndices = []
-        for key in objdata.keys():
-            self.gridIndices.append([int(key), objdata[key]['position'][0],
-                                     objdata[key]['position'][1]])
-
-    def setBlockPosfromGridIndex(self, data):
-        """Add and position all blocks in workflow data."""
-        for gridIndex in self.gridIndices:
-            tempdata = data['Objects'][str(gridIndex[0])]
-            blockType = tempdata['Type']
-
-            if blockType in ['Action', 'Item']:
-                block = Block(blockType=blockType, data=tempdata,
-                              parent=self, lankey=self.lankey)
-            elif blockType == 'Section':
-                block = Section(parent=self, data=tempdata)
-            self.addItem(block)
-            block.setPos(QPoint(gridIndex[1], gridIndex[2]))
-
-    def updateSequenceEdges(self, data):
-        """Add guideline edges between action blocks to indicate sequence."""
-        itemPriority, actionPriority = TabPlaintextController(
-            lankey=self.lankey).getPriorityList(data)
-        if len(actionPriority) < 2:
-            return
+        section = self.getWorkflow().findSection(data)
+        if section is None:
+            section = uwl.Section(data)
+        itemPriority, actionPriority = section.getItemActionPriorityLists()
+        edgeKeys = []
         for ii, key in enumerate(actionPriority[1:]):
-            item_in = self.getBlockItemFromKey(actionPriority[ii])
-            item_out = self.getBlockItemFromKey(key)
-            edge = Edge(item_in, item_out, 'L', self)
-            self.addItem(edge)
+            edgeKeys.append((actionPriority[ii], key, 'L'))
+        return edgeKeys
 
     def getBlockItemFromKey(self, key):
         """
@@ -3779,16 +3130,11 @@ class SceneClass(QGraphicsScene):
         Returns
         -------
         item : QGraphicsItem
-            Graphics item associated with the selected key.
+            Graphics item associated with the selected key. None if no item
+            is registered with the key.
 
         """
-        for item in self.items():
-            cond1 = (str(type(item)) ==
-                     "<class '__main__.Block.<locals>.BlockBase'>")
-            cond2 = (str(type(item)) == "<class '__main__.Section'>")
-            if cond1 or cond2:
-                if key == item.data['ID']:
-                    return item
+        return self.blockItems.get(key)
 
 
 def Block(blockType='Action', rect=QRectF(-50, -50, 100, 100), parent=None,
@@ -3835,11 +3181,17 @@ def Block(blockType='Action', rect=QRectF(-50, -50, 100, 100), parent=None,
                           QGraphicsItem.ItemSendsGeometryChanges |
                           QGraphicsItem.ItemIsSelectable)
 
-            Text(parent=self, text=self.text)
+            self.textItem = Text(parent=self, text=self.text)
+
+            self.setBorderPen()
+
+            self.setBrush(self.colorMain)
 
+        def setBorderPen(self):
+            """Set block border to dashed line if item block is linked."""
             self.pen = QPen(QColor(255, 255, 255))
             self.pen.setWidthF(3.5)
-            if blockType == 'Item':
+            if self.blockType == 'Item':
                 if self.data['Link']:
                     self.pen.setDashPattern([0.5, 3.25])
                 else:
@@ -3848,8 +3200,6 @@ def Block(blockType='Action', rect=QRectF(-50, -50, 100, 100), parent=None,
                 self.pen.setStyle(Qt.NoPen)
             self.setPen(self.pen)
 
-            self.setBrush(self.colorMain)
-
         def setToolTipText(self, text):
             """Set block tooltip to input text."""
             if text == '':  # Set tooltip to placeholder method if empty.
@@ -3872,7 +3222,9 @@ def Block(blockType='Action', rect=QRectF(-50, -50, 100, 100), parent=None,
                 snapX = round(self.scenePos().x()/snapsize)*snapsize
                 snapY = round(self.scenePos().y()/snapsize)*snapsize
                 self.setPos(snapX, snapY)
-                self.data['position'] = [snapX, snapY]
+                if self.data['position'] != [snapX, snapY]:
+                    self.data['position'] = [snapX, snapY]
+                    self.parent.getWorkflow().markChanged([self.data['ID']])
                 for edge in self.edges:
                     edge.adjust()
 
@@ -3913,10 +3265,15 @@ def Block(blockType='Action', rect=QRectF(-50, -50, 100, 100), parent=None,
             """
             self.edges.append(edge)
 
+        def removeEdge(self, edge):
+            """Remove edge item from current block if connected."""
+            if edge in self.edges:
+                self.edges.remove(edge)
+
         def hoverEnterEvent(self, event):
             """Update context workflow on hover over if action block."""
             if self.blockType == 'Action':
-                self.parent.rootwindow.updateContextText(data['Name'])
+                self.parent.rootwindow.updateContextText(self.data['Name'])
 
     return BlockBase(rect=rect, parent=parent, data=data)
 
@@ -3929,6 +3286,7 @@ class Section(QGraphicsRectItem):
         QGraphicsRectItem.__init__(self, rect)
 
         self.parent = parent
+        self.blockType = 'Section'
         self.data = data
 
         self.data['position'] = [self.pos().x(), self.pos().y()]
@@ -3969,7 +3327,9 @@ class Section(QGraphicsRectItem):
             snapX = round(self.scenePos().x()/snapsize)*snapsize
             snapY = round(self.scenePos().y()/snapsize)*snapsize
             self.setPos(snapX, snapY)
-            self.data['position'] = [snapX, snapY]
+            if self.data['position'] != [snapX, snapY]:
+                self.data['position'] = [snapX, snapY]
+                self.parent.getWorkflow().markChanged([self.data['ID']])
             for edge in self.edges:
                 edge.adjust()
 
@@ -3984,6 +3344,11 @@ class Section(QGraphicsRectItem):
         """
         self.edges.append(edge)
 
+    def removeEdge(self, edge):
+        """Remove edge graphics object from section block if connected."""
+        if edge in self.edges:
+            self.edges.remove(edge)
+
 
 class Text(QGraphicsSimpleTextItem):
     """Custom text style graphics item."""
@@ -4428,8 +3793,7 @@ class NewBlockWindow(QWidget):
 
     def getLinkData(self, linkID):
         """Write link data in workflow from current link identifier."""
-        self.olddata = self.findLinkDatainSection(
-            copy.deepcopy(self.alldata), linkID)
+        self.olddata = uwl.Section(self.alldata).findLinkData(linkID)
 
         if self.item != []:
             self.olddata['position'] = self.item.data['position']
@@ -4438,23 +3802,6 @@ class NewBlockWindow(QWidget):
 
         self.prefillData(self.olddata)
 
-    def findLinkDatainSection(self, section, linkID):
-        """Get link data in workflow from current link identifier."""
-        for key in section['Objects'].keys():
-            if section['Objects'][key]['Type'] != 'Item':
-                continue
-            if not section['Objects'][key]['Link']:
-                continue
-            if section['Objects'][key]['Link ID'] == linkID:
-                return copy.deepcopy(section['Objects'][key])
-
-        for key in section['Objects'].keys():
-            if section['Objects'][key]['Type'] == 'Section':
-                linkData = self.findLinkDatainSection(
-                    section['Objects'][key], linkID)
-                if linkData is not None:
-                    return linkData
-
     def onMsgNo(self):
         """Cancel data overwrite and revert link identifier value."""
         if self.olddata == []:
@@ -4468,33 +3815,13 @@ class NewBlockWindow(QWidget):
 
     def getLinkIDList(self):
         """Get list of all link identifiers in workflow."""
-        linkIDs = self.getNestedLinkIDs(self.alldata)
+        linkIDs = uwl.Section(self.alldata).getLinkIDs()
         if linkIDs != []:
             self.linkIDs = [c for c in linkIDs]
             self.linkIDs.sort()
         else:
             self.linkIDs = []
 
-    def getNestedLinkIDs(self, data, linkIDs=[]):
-        """Iterate through nested sections and return link identifier list."""
-        for key in data['Objects'].keys():
-            if data['Objects'][key]['Type'] != 'Item':
-                continue
-            if not data['Objects'][key]['Link']:
-                continue
-            if data['Objects'][key]['Link ID'] == '':
-                continue
-            linkID = data['Objects'][key]['Link ID']
-            if linkID not in linkIDs:
-                linkIDs.append(linkID)
-
-        for key in data['Objects'].keys():
-            if data['Objects'][key]['Type'] == 'Section':
-                linkIDs = self.getNestedLinkIDs(
-                    data['Objects'][key], linkIDs=linkIDs)
-
-        return linkIDs
-
     def onSubtypeChange(self):
         """Update name completer when subtype selection changes."""
         subtype = self.subtypeWidget.currentText()
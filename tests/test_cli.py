@@ -0,0 +1,31 @@
+"""
+Tests for command line argument checks of the batch interface.
+
+"""
+import os
+
+import pytest
+
+from uwl.cli import main
+
+exampledir = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'Example Workflows')
+
+
+def test_jobs_must_be_positive(capsys):
+    with pytest.raises(SystemExit) as e:
+        main([exampledir, '-j', '0'])
+    assert e.value.code == 2
+    assert 'number of jobs' in capsys.readouterr().err
+
+
+def test_table_takes_single_language(capsys):
+    with pytest.raises(SystemExit):
+        main([exampledir, '-l', 'en,de', '-t', 'out.csv'])
+    assert 'single language' in capsys.readouterr().err
+
+
+def test_table_unwritable_path(tmp_path, capsys):
+    outpath = str(tmp_path / 'missing' / 'out.csv')
+    assert main([exampledir, '-t', outpath]) == 1
+    assert not os.path.exists(outpath)
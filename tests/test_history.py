@@ -0,0 +1,145 @@
+"""
+Round trip tests for undo and redo commands.
+
+Each test applies a change, then checks that undo restores the section data
+exactly, connection list order included, and that redo restores the changed
+data.
+
+"""
+import copy
+
+import pytest
+
+import uwl
+
+from test_workflow import (assertIndexCurrent, makeAction, makeItem,
+                           makeSection)
+
+
+def roundTrip(section, apply):
+    """
+    Apply a change, then undo and redo it and compare section data.
+
+    Block identifiers are renumbered after each step, as the workflow scenes
+    do after every change.
+
+    """
+    section.forceUniqueBlockIDs()
+    before = copy.deepcopy(section.data)
+    history = uwl.History()
+    history.push(apply())
+    section.forceUniqueBlockIDs()
+    after = copy.deepcopy(section.data)
+    assert after != before
+
+    assert history.undo(section)
+    section.forceUniqueBlockIDs()
+    assert section.data == before
+    assertIndexCurrent(section)
+    assert history.redo(section)
+    section.forceUniqueBlockIDs()
+    assert section.data == after
+    assertIndexCurrent(section)
+    assert history.undo(section)
+    section.forceUniqueBlockIDs()
+    assert section.data == before
+
+
+def test_command_is_abstract():
+    with pytest.raises(TypeError):
+        uwl.Command()
+
+
+def test_move_round_trip():
+    section = makeSection()
+    block = section.data['Objects']['2']
+
+    def apply():
+        section.setBlockPosition('2', [300, 60])
+        return uwl.MoveCommand([[block, [90, 0], [300, 60]]])
+    roundTrip(section, apply)
+
+
+def test_add_blocks_round_trip():
+    section = makeSection()
+
+    def apply():
+        blocks = [makeItem('4', [0, 180]),
+                  makeAction('5', [270, 0], A=['4', '0'])]
+        for block in blocks:
+            section.addBlock(block)
+        return uwl.AddBlocksCommand(blocks)
+    roundTrip(section, apply)
+
+
+def test_delete_blocks_round_trip():
+    section = makeSection()
+    objects = section.data['Objects']
+    objects['3']['A In'] = ['0', '1']
+
+    def apply():
+        command = uwl.DeleteBlocksCommand([objects['1'], objects['2']])
+        command.redo(section)
+        return command
+    roundTrip(section, apply)
+    assert list(objects.keys()) == ['0', '1', '2', '3']
+    assert objects['3']['A In'] == ['0', '1']
+
+
+def test_edge_removal_restores_list_order():
+    section = makeSection()
+    objects = section.data['Objects']
+    objects['2']['A In'] = ['0', '1']
+
+    def apply():
+        index = section.getEdgePosition('0', '2', 'A')
+        section.removeEdge('0', '2', 'A')
+        return uwl.EdgeCommand(
+            removed=[[objects['0'], objects['2'], 'A', index]])
+    roundTrip(section, apply)
+    assert objects['2']['A In'] == ['0', '1']
+
+
+def test_edge_type_change_round_trip():
+    section = makeSection()
+    objects = section.data['Objects']
+    objects['2']['A In'] = ['0', '1']
+
+    def apply():
+        index = section.getEdgePosition('0', '2', 'A')
+        section.removeEdge('0', '2', 'A')
+        section.addEdge('0', '2', 'C')
+        return uwl.EdgeCommand(
+            added=[[objects['0'], objects['2'], 'C']],
+            removed=[[objects['0'], objects['2'], 'A', index]])
+    roundTrip(section, apply)
+
+
+def test_edit_round_trip():
+    section = makeSection()
+    nested = makeSection().data
+    nested.update({'Type': 'Section', 'ID': '4', 'position': [270, 0]})
+    section.addBlock(nested)
+
+    def apply():
+        oldBlock = list(nested['Objects'].values())[3]
+        newBlock = copy.deepcopy(oldBlock)
+        newBlock['A In'] = [list(nested['Objects'].keys())[0]]
+        newBlock['Notes'] = 'edited'
+        section.getSection('4').addBlock(newBlock)
+        return uwl.EditBlockCommand([[nested, oldBlock, newBlock]])
+    roundTrip(section, apply)
+
+
+def test_grouped_delete_round_trip():
+    section = makeSection()
+    objects = section.data['Objects']
+
+    def apply():
+        deleteCommand = uwl.DeleteBlocksCommand([objects['3']])
+        deleteCommand.redo(section)
+        index = section.getEdgePosition('1', '2', 'B')
+        section.removeEdge('1', '2', 'B')
+        return uwl.CommandGroup([deleteCommand, uwl.EdgeCommand(
+            removed=[[objects['1'], objects['2'], 'B', index]])])
+    roundTrip(section, apply)
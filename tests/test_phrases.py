@@ -0,0 +1,25 @@
+"""
+Tests for action phrase templates.
+
+"""
+import pytest
+
+import uwl
+
+
+def test_template_fills_slots():
+    template = uwl.PhraseTemplate('Add {a} to {b}{c}')
+    assert template('water', 'the beaker', '') == 'Add water to the beaker'
+    assert template('{b}', "it's", '') == "Add {b} to it's"
+
+
+def test_template_keeps_literal_braces():
+    assert uwl.PhraseTemplate('Heat {{a}} {a}')('x', '', '') == 'Heat {a} x'
+    assert uwl.PhraseTemplate('')('x', 'y', 'z') == ''
+
+
+@pytest.mark.parametrize('text', ['Add {x}', 'Add {a:>9}', 'Add {a!r}',
+                                  'Add {a.upper}', 'Add {0}', 'Add {a'])
+def test_invalid_template_raises_key_error(text):
+    with pytest.raises(KeyError):
+        uwl.PhraseTemplate(text)('water', '', '')
@@ -0,0 +1,30 @@
+"""
+Tests for protocol fragment caching by section and block versions.
+
+"""
+import uwl
+
+from test_workflow import makeSection
+
+
+def render(section, writer=None):
+    if writer is None:
+        writer = uwl.ProtocolWriter(cacheLimit=0)
+    return writer.textFromWorkflow(section.data, section)
+
+
+def test_cached_protocol_follows_block_versions():
+    section = makeSection()
+    writer = uwl.ProtocolWriter()
+    render(section, writer)
+    nCached = len(writer.fragmentCache)
+    assert render(section, writer) == render(section)
+    assert len(writer.fragmentCache) == nCached
+
+    section.data['Objects']['0']['Name'] = 'Ethanol'
+    section.markChanged(['0'], layout=False)
+    assert render(section, writer) == render(section)
+    assert 'Ethanol' in render(section, writer)
+
+    section.setBlockPosition('1', [270, 90])
+    assert render(section, writer) == render(section)
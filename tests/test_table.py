@@ -0,0 +1,72 @@
+"""
+Tests for parameter value parsing and the cross-workflow parameter store.
+
+"""
+import math
+
+import numpy as np
+import pytest
+
+import uwl
+
+
+@pytest.mark.parametrize('value, magnitude, unit', [
+    ('6.8 g', 6.8, 'g'),
+    ('-5 C', -5.0, 'C'),
+    ('+3', 3.0, ''),
+    ('.5 mL', 0.5, 'mL'),
+    ('1e-3 M', 0.001, 'M'),
+    ('2.5E+2 rpm', 250.0, 'rpm'),
+    ('28%', 28.0, '%'),
+    ('1.5 C/min', 1.5, 'C/min'),
+    ('25 °C', 25.0, '°C'),
+    (' 10 ', 10.0, ''),
+])
+def test_parse_value(value, magnitude, unit):
+    assert uwl.parseValue(value) == (pytest.approx(magnitude), unit)
+
+
+@pytest.mark.parametrize('value', ['', 'room temperature', '5 g 2 h', '1-2 h',
+                                   'e5', '1,000', '3,5 g', '2 /min', None])
+def test_parse_value_not_numeric(value):
+    magnitude, unit = uwl.parseValue(value)
+    assert math.isnan(magnitude)
+    assert unit is None
+
+
+def makeWorkflow(value):
+    return {'Type': 'root', 'Name': '', 'Description': '', 'Objects': {
+        '0': {'Type': 'Item', 'ID': '0', 'Name': 'Water',
+              'Subtype': 'Chemical', 'position': [0, 0], 'Link': False,
+              'Link ID': '', 'Parameters': ['Mass'], 'Values': [value],
+              'Notes': ''}}}
+
+
+@pytest.fixture
+def store():
+    values = {'a': '5 g', 'b': '12 g', 'c': '8 mg', 'd': 'some', 'e': '20 g'}
+    return uwl.ParameterStore.fromWorkflows(
+        {name: makeWorkflow(value) for name, value in values.items()})
+
+
+def test_range_query(store):
+    rowName = store.rowNames[0]
+    mask = store.rangeQuery(rowName, low=5, high=12, unit='g')
+    assert store.getWorkflowNames(mask) == ['a', 'b']
+    mask = store.rangeQuery(rowName, low=8)
+    assert store.getWorkflowNames(mask) == ['b', 'c', 'e']
+    mask = store.rangeQuery(rowName, unit='kg')
+    assert store.getWorkflowNames(mask) == []
+
+
+def test_summarize(store):
+    summary = store.summarize(unit='g')
+    assert summary['count'][0] == 3
+    assert summary['min'][0] == 5
+    assert summary['max'][0] == 20
+    assert summary['mean'][0] == pytest.approx(37 / 3)
+
+    summary = store.summarize(unit='L')
+    assert summary['count'][0] == 0
+    assert np.isnan([summary['min'][0], summary['max'][0],
+                     summary['mean'][0]]).all()
@@ -0,0 +1,146 @@
+"""
+Tests for the section data wrapper and its connection index.
+
+"""
+import uwl
+
+
+def makeAction(key, position, A=None, B=None, C=None):
+    return {'Type': 'Action', 'ID': key, 'Name': 'Add', 'Subtype': 'Add',
+            'position': list(position), 'A In': list(A or []),
+            'B In': list(B or []), 'C In': list(C or []), 'Parameters': [],
+            'Values': [], 'Notes': ''}
+
+
+def makeItem(key, position, name='Water'):
+    return {'Type': 'Item', 'ID': key, 'Name': name, 'Subtype': 'Chemical',
+            'position': list(position), 'Link': False, 'Link ID': '',
+            'Parameters': [], 'Values': [], 'Notes': ''}
+
+
+def makeSection():
+    data = {'Type': 'root', 'Name': 'Test', 'Description': '', 'Objects': {
+        '0': makeItem('0', [0, 0]),
+        '1': makeItem('1', [0, 90]),
+        '2': makeAction('2', [90, 0], A=['0'], B=['1']),
+        '3': makeAction('3', [180, 0], A=['1'])}}
+    return uwl.Section(data)
+
+
+def assertIndexCurrent(section):
+    """Check that the kept index matches an index built from the data."""
+    def edges(index):
+        return sorted((source, dest, edgeType)
+                      for dest, types in index.forward.items()
+                      for edgeType, sources in types.items()
+                      for source in sources)
+    assert edges(section.getEdgeIndex()) == edges(uwl.EdgeIndex(section.data))
+    for nested in section.getSections():
+        assertIndexCurrent(nested)
+
+
+def test_edges_kept_in_index():
+    section = makeSection()
+    assert section.getEdgeIndex().getDestinationKeys('1') == {'2', '3'}
+    assert section.addEdge('0', '3', 'C')
+    assert not section.addEdge('0', '3', 'C')
+    assert section.removeEdge('1', '2') == 'B'
+    assert section.data['Objects']['2']['B In'] == []
+    assertIndexCurrent(section)
+
+
+def test_add_edge_at_index():
+    section = makeSection()
+    section.addEdge('1', '2', 'A', 0)
+    assert section.data['Objects']['2']['A In'] == ['1', '0']
+    assertIndexCurrent(section)
+
+
+def test_remove_block_removes_connections():
+    section = makeSection()
+    index = section.getEdgeIndex()
+    section.removeBlock('1')
+    assert section.data['Objects']['2']['B In'] == []
+    assert section.data['Objects']['3']['A In'] == []
+    assert section.getEdgeIndex() is index
+    section.removeBlock('2')
+    assert index.getDestinationKeys('0') == set()
+    assertIndexCurrent(section)
+
+
+def test_add_block_replaces_connections():
+    section = makeSection()
+    section.getEdgeIndex()
+    section.addBlock(makeAction('3', [180, 0], C=['0']))
+    section.addBlock(makeAction('4', [270, 0], A=['1']))
+    assert section.getEdgeIndex().getDestinationKeys('1') == {'2', '4'}
+    assertIndexCurrent(section)
+
+
+def test_swap_keys_remaps_index():
+    section = makeSection()
+    section.getEdgeIndex()
+    section.swapKeys({'3': '0', '2': '1', '1': '2', '0': '3'})
+    assert section.data['Objects']['1']['A In'] == ['3']
+    assert section.hasEdge('2', '0', 'A')
+    assertIndexCurrent(section)
+
+
+def test_nested_sections_keep_wrappers():
+    section = makeSection()
+    nested = makeSection().data
+    nested.update({'Type': 'Section', 'ID': '4', 'position': [270, 0]})
+    section.addBlock(nested)
+    inner = section.getSection('4')
+    assert section.getSections() == [inner]
+    assert section.findSection(nested) is inner
+    inner.removeEdge('0', '2')
+    assert nested['Objects']['2']['A In'] == []
+    assertIndexCurrent(section)
+
+
+def test_remove_dislocated_edges():
+    section = makeSection()
+    objects = section.data['Objects']
+    section.getEdgeIndex()
+    del objects['0']
+    del objects['3']
+    section.removeDislocatedEdges()
+    assert objects['2']['A In'] == []
+    assert section.getEdgeIndex().getDestinationKeys('1') == {'2'}
+    assertIndexCurrent(section)
+
+
+def test_version_changes_only_with_data():
+    section = makeSection()
+    version = section.version
+    assert not section.addEdge('0', '2', 'A')
+    assert section.removeEdge('0', '3', 'A') is None
+    assert not section.setBlockPosition('2', [90, 0])
+    section.addBlock(makeAction('2', [90, 0], A=['0'], B=['1']))
+    section.forceUniqueBlockIDs()
+    assert section.version == version
+
+    assert section.setBlockPosition('2', [90, 30])
+    assert section.version != version
+
+
+def test_nested_changes_update_parent_version():
+    section = makeSection()
+    nested = makeSection().data
+    nested.update({'Type': 'Section', 'ID': '4', 'position': [270, 0]})
+    section.addBlock(nested)
+    version = section.version
+    section.getSection('4').removeEdge('0', '2')
+    assert section.version != version
+
+
+def test_priority_order_follows_layout_version():
+    section = makeSection()
+    order = section.getPriorityOrder()
+    assert order[0] == ['0', '1', '2', '3']
+    section.addEdge('0', '3', 'C')
+    assert section.getPriorityOrder() is order
+    section.setBlockPosition('0', [270, 0])
+    assert section.getPriorityList() == ['1', '2', '3', '0']
+    assert section.getItemPriorityRanks() == {'1': 0, '0': 1}
@@ -0,0 +1,21 @@
+"""
+Universal Workflow Language data model.
+
+Headless workflow, section, and block logic shared by the graphical
+interface and command line tools.
+
+"""
+from uwl.fileio import savejson, loadjson
+from uwl.language import getBabelFish, getLanguageKeys, getNounTable
+from uwl.phrases import PhraseTemplate
+from uwl.naming import NameAllocator
+from uwl.priority import PriorityOrder
+from uwl.workflow import Block, EdgeIndex, Section, Workflow, newVersion
+from uwl.emitter import ProtocolEmitter
+from uwl.protocol import (ProtocolWriter, TooltipRenderer, renderLanguages,
+                          renderProtocols, exportProtocol)
+from uwl.table import (ParameterNames, ParameterStore, parseValue,
+                       exportTable)
+from uwl.history import (History, Command, CommandGroup, MoveCommand,
+                         AddBlocksCommand, DeleteBlocksCommand, EdgeCommand,
+                         EditBlockCommand)
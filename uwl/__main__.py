@@ -0,0 +1,10 @@
+"""
+Entry point for python -m uwl.
+
+"""
+import sys
+
+from uwl.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,409 @@
+"""
+Command line tools for batch processing UWL files.
+
+Example
+-------
+Render English and German protocols for every workflow in a folder::
+
+    python -m uwl "Example Workflows" -l en -o protocols
+    python -m uwl "Example Workflows/*.json" -l de -j 4
+
+Render a protocol in several languages, or in every language, at once::
+
+    python -m uwl "Example Workflows/Science.json" -l en,de,fr,ja -j 4
+    python -m uwl "Example Workflows/Science.json" -l all -o protocols
+
+Write Markdown or HTML protocols instead of plain text::
+
+    python -m uwl "Example Workflows" -l en --format html -o protocols
+
+Export the parameter table of every workflow in a folder::
+
+    python -m uwl "Example Workflows" --table parameters.csv
+
+"""
+import argparse
+import contextlib
+import glob
+import logging
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from uwl.fileio import loadjson
+from uwl.language import getBabelFish, getLanguageKeys
+from uwl.protocol import exportProtocol
+from uwl.table import exportTable
+
+
+class WarningCollector(logging.Handler):
+    """Logging handler keeping unique uwl warning messages in order."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        message = record.getMessage()
+        if message not in self.messages:
+            self.messages.append(message)
+
+
+@contextlib.contextmanager
+def collectWarnings():
+    """
+    Collect uwl warnings, such as missing translations, instead of printing.
+
+    Yields
+    ------
+    messages : list
+        Unique warning messages logged while the context is open.
+
+    """
+    collector = WarningCollector()
+    logger = logging.getLogger('uwl')
+    logger.addHandler(collector)
+    try:
+        yield collector.messages
+    finally:
+        logger.removeHandler(collector)
+
+
+def findWorkflowFiles(paths):
+    """
+    Expand directories and glob patterns into a list of .json files.
+
+    Parameters
+    ----------
+    paths : list
+        File paths, directory paths, or glob patterns.
+
+    Returns
+    -------
+    filepaths : list
+        Sorted .json file paths without duplicates.
+
+    """
+    filepaths = []
+    for path in paths:
+        if os.path.isdir(path):
+            matches = glob.glob(os.path.join(path, '*.json'))
+        elif os.path.isfile(path):
+            matches = [path]
+        else:
+            matches = glob.glob(path, recursive=True)
+        for match in sorted(matches):
+            if match.endswith('.json') and match not in filepaths:
+                filepaths.append(match)
+    return filepaths
+
+
+extensions = {'text': '.txt', 'markdown': '.md', 'html': '.html'}
+
+
+def getOutputPath(filepath, lankey, outdir=None, fmt='text'):
+    """
+    Return protocol file path for a workflow file and language.
+
+    Parameters
+    ----------
+    filepath : str
+        Workflow .json file path.
+    lankey : str
+        Language key of the rendered protocol.
+    outdir : str, optional
+        Output directory. The default is None, which writes next to the
+        workflow file.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Protocol format, selecting the .txt, .md, or .html extension. The
+        default is 'text'.
+
+    Returns
+    -------
+    outpath : str
+        Output file path in the format <outdir>/<file name>.<lankey>.<ext>.
+
+    """
+    if outdir is None:
+        outdir = os.path.dirname(filepath)
+    filename = os.path.splitext(os.path.basename(filepath))[0]
+    return os.path.join(outdir, filename + '.' + lankey + extensions[fmt])
+
+
+def renderProtocolFile(filepath, lankey, outpath, fmt='text'):
+    """
+    Render protocol for one workflow file and write it to disk.
+
+    Parameters
+    ----------
+    filepath : str
+        Workflow .json file path.
+    lankey : str
+        Language key of the rendered protocol.
+    outpath : str
+        Output file path.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Protocol format. The default is 'text'.
+
+    Returns
+    -------
+    result : dict
+        Keys 'file', 'output', 'time', 'error', and 'warnings'. 'error' is
+        None if the protocol was written successfully.
+
+    """
+    result = renderProtocolGroup(filepath, [lankey], [outpath], fmt)
+    if result['output'] is not None:
+        result['output'] = result['output'][0]
+    return result
+
+
+def renderProtocolGroup(filepath, lankeys, outpaths, fmt='text'):
+    """
+    Render protocols for one workflow file in several languages.
+
+    The workflow is loaded once for all languages. Each protocol is streamed
+    to its file while it is generated, so large protocols are never held in
+    memory as a whole.
+
+    Parameters
+    ----------
+    filepath : str
+        Workflow .json file path.
+    lankeys : list
+        Language keys of the rendered protocols.
+    outpaths : list
+        Output file path for each language key.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Protocol format. The default is 'text'.
+
+    Returns
+    -------
+    result : dict
+        Keys 'file', 'output', 'time', 'error', and 'warnings'. 'output' is
+        the list of written file paths. 'error' is None if all protocols were
+        written successfully. 'warnings' lists unique warning messages, such
+        as missing translations.
+
+    """
+    start = time.perf_counter()
+    error = None
+    with collectWarnings() as warnings:
+        try:
+            workflow = loadjson(filepath)
+            if workflow.get('Name', '') == '':
+                workflow['Name'] = os.path.splitext(
+                    os.path.basename(filepath))[0]
+            for lankey, outpath in zip(lankeys, outpaths):
+                exportProtocol(workflow, outpath, lankey, fmt)
+        except Exception as e:
+            error = repr(e)
+            outpaths = None
+
+    return {'file': filepath,
+            'output': outpaths,
+            'time': time.perf_counter() - start,
+            'error': error,
+            'warnings': warnings}
+
+
+def runProtocolBatch(filepaths, lankey='en', outdir=None, workers=None,
+                     callback=None, fmt='text'):
+    """
+    Render protocols for all workflow files across a process pool.
+
+    Protocols are written to disk by the worker processes as each file
+    finishes, so memory use does not grow with the number of files. When
+    there are fewer files than workers, the languages of each file are split
+    into groups rendered by separate workers.
+
+    Parameters
+    ----------
+    filepaths : list
+        Workflow .json file paths.
+    lankey : str or list, optional
+        Language key or list of language keys of the rendered protocols. The
+        default is 'en'.
+    outdir : str, optional
+        Output directory. The default is None, which writes next to each
+        workflow file.
+    workers : int, optional
+        Number of worker processes. The default is None, which uses the
+        number of processors on the machine.
+    callback : function, optional
+        Called with each result dictionary as files finish.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Protocol format. The default is 'text'.
+
+    Returns
+    -------
+    results : list
+        Result dictionaries in order of completion, one per file and
+        language group.
+
+    """
+    if outdir is not None:
+        os.makedirs(outdir, exist_ok=True)
+    if isinstance(lankey, str):
+        lankeys = [lankey]
+    else:
+        lankeys = list(lankey)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    nGroups = max(1, min(len(lankeys),
+                         math.ceil(workers / max(1, len(filepaths)))))
+    groups = [lankeys[ii::nGroups] for ii in range(nGroups)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=getBabelFish) as executor:
+        futures = [executor.submit(
+            renderProtocolGroup, filepath, group,
+            [getOutputPath(filepath, key, outdir, fmt) for key in group], fmt)
+            for filepath in filepaths for group in groups]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if callback is not None:
+                callback(result)
+    return results
+
+
+def printResult(result, showWarnings=False):
+    """
+    Print timing or failure line for a single result.
+
+    Parameters
+    ----------
+    result : dict
+        Result dictionary from renderProtocolGroup.
+    showWarnings : bool, optional
+        Print each warning message below the result line. The default is
+        False, which only prints the number of warnings.
+
+    """
+    warnings = result.get('warnings', [])
+    if result['error'] is None:
+        output = result['output']
+        if not isinstance(output, str):
+            output = ', '.join(output)
+        line = 'ok     %8.3fs  %s -> %s' % (
+            result['time'], result['file'], output)
+    else:
+        line = 'FAILED %8.3fs  %s: %s' % (
+            result['time'], result['file'], result['error'])
+    if len(warnings) > 0:
+        line += ' (%d warning(s))' % len(warnings)
+    print(line)
+    if showWarnings:
+        for message in warnings:
+            print('       ' + message)
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    """
+    Run the batch protocol command line interface.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments. The default is None, which reads sys.argv.
+
+    Returns
+    -------
+    int
+        Exit status. 1 if any file failed, otherwise 0.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m uwl',
+        description='Render written protocols for UWL workflow files.')
+    parser.add_argument(
+        'paths', nargs='*',
+        help='workflow .json files, directories, or glob patterns')
+    parser.add_argument(
+        '-l', '--language', default='en',
+        help='language key from the multilingual dictionary, comma separated '
+        'keys, or "all" (default: en)')
+    parser.add_argument(
+        '-o', '--outdir', default=None,
+        help='output directory (default: next to each workflow file)')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='number of worker processes (default: processor count)')
+    parser.add_argument(
+        '-f', '--format', choices=list(extensions.keys()), default='text',
+        help='protocol file format (default: text)')
+    parser.add_argument(
+        '-w', '--warnings', action='store_true',
+        help='print warnings, such as missing translations, for each file')
+    parser.add_argument(
+        '--list-languages', action='store_true',
+        help='list available language keys and exit')
+    parser.add_argument(
+        '-t', '--table', default=None, metavar='OUTPATH',
+        help='export the parameter table in a single language to a .csv or '
+        '.parquet file instead of rendering protocols')
+    parser.add_argument(
+        '--layout', choices=['wide', 'long'], default='wide',
+        help='table layout: one row per workflow or one row per parameter '
+        '(default: wide)')
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('number of jobs must be at least 1')
+
+    if args.list_languages:
+        languages = getBabelFish()['languages']
+        for lankey in getLanguageKeys():
+            print(lankey + '\t' + languages[lankey]['Menu label'])
+        return 0
+
+    if args.language == 'all':
+        lankeys = getLanguageKeys()
+    else:
+        lankeys = [key.strip() for key in args.language.split(',')]
+    for lankey in lankeys:
+        if lankey not in getLanguageKeys():
+            parser.error('unknown language key: ' + lankey)
+    if args.table is not None and len(lankeys) > 1:
+        parser.error('--table takes a single language key')
+
+    filepaths = findWorkflowFiles(args.paths)
+    if filepaths == []:
+        parser.error('no .json workflow files found')
+
+    start = time.perf_counter()
+    if args.table is not None:
+        try:
+            with collectWarnings() as warnings:
+                nRows = exportTable(filepaths, args.table,
+                                    lankey=lankeys[0], layout=args.layout)
+        except (ImportError, ValueError, OSError) as e:
+            print(e)
+            return 1
+        if args.warnings:
+            for message in warnings:
+                print(message)
+        print('%d file(s), %d row(s) written to %s, %d warning(s), '
+              '%.3fs total' % (len(filepaths), nRows, args.table,
+                               len(warnings), time.perf_counter() - start))
+        return 0
+
+    results = runProtocolBatch(filepaths, lankey=lankeys,
+                               outdir=args.outdir, workers=args.jobs,
+                               callback=lambda result: printResult(
+                                   result, args.warnings),
+                               fmt=args.format)
+    failed = set(result['file'] for result in results
+                 if result['error'] is not None)
+    nWarnings = sum(len(result['warnings']) for result in results)
+    print('%d file(s), %d language(s), %d failed, %d warning(s), '
+          '%.3fs total' % (len(filepaths), len(lankeys), len(failed),
+                           nWarnings, time.perf_counter() - start))
+
+    if len(failed) > 0:
+        return 1
+    return 0
@@ -0,0 +1,284 @@
+"""
+Protocol fragment buffer with plain text, Markdown, and HTML output.
+
+The protocol writer walks a workflow once and records each part of the
+protocol as a fragment. Fragments are only joined into a document when they
+are rendered, so the same walk can be rendered in several formats. An emitter
+given an output file streams instead, writing rendered fragments to the file
+whenever its buffer fills, so memory use does not grow with protocol length.
+
+"""
+import html
+
+formats = ['text', 'markdown', 'html']
+
+
+class ProtocolEmitter():
+    """
+    Buffer of protocol fragments.
+
+    Each fragment is stored as [<kind>, <level>, <text>, <value>], where kind
+    is one of 'heading', 'field', 'entry', 'step', 'detail', 'error', or
+    'blank'. Value holds the number of a step or the value of a field.
+
+    Parameters
+    ----------
+    outfile : file, optional
+        Open text file to stream the rendered protocol to. The default is
+        None, which keeps all fragments in memory.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Output format of the streamed protocol. The default is 'text'.
+    bufferSize : int, optional
+        Number of fragments buffered before they are written to outfile. The
+        default is 1000.
+
+    """
+
+    _tab = '   '
+
+    def __init__(self, outfile=None, fmt='text', bufferSize=1000):
+        if fmt not in formats:
+            raise ValueError('unknown protocol format: ' + str(fmt))
+        self.fragments = []
+        self.outfile = outfile
+        self.fmt = fmt
+        self.bufferSize = bufferSize
+        self.flushed = 0  # Number of fragments already written to outfile
+        self.lists = []  # Open HTML lists of the streamed protocol
+
+    def heading(self, text):
+        """Add protocol part heading, such as the materials list heading."""
+        self.add(['heading', 0, text, None])
+
+    def field(self, label, value):
+        """Add labeled base information line."""
+        self.add(['field', 0, label, value])
+
+    def entry(self, text):
+        """Add line to the abstract, materials, or equipment lists."""
+        self.add(['entry', 1, text, None])
+
+    def step(self, level, number, text):
+        """Add numbered protocol step at a section level."""
+        self.add(['step', level, text, number])
+
+    def detail(self, level, text):
+        """Add detail line below a protocol step at a section level."""
+        self.add(['detail', level, text, None])
+
+    def error(self, text):
+        """Add transcription error message."""
+        self.add(['error', 0, text, None])
+
+    def blank(self):
+        """Add empty line between protocol parts."""
+        self.add(['blank', 0, '', None])
+
+    def add(self, fragment):
+        """Add fragment, writing the buffer to outfile if it is full."""
+        self.fragments.append(fragment)
+        if self.outfile is not None and len(
+                self.fragments) >= self.bufferSize:
+            self.flush()
+
+    def extend(self, fragments):
+        """Add list of fragments, such as cached protocol parts."""
+        for fragment in fragments:
+            self.add(fragment)
+
+    def tell(self):
+        """Return number of fragments added, including written fragments."""
+        return self.flushed + len(self.fragments)
+
+    def getFragments(self, start):
+        """
+        Return fragments added since a position returned by tell.
+
+        Returns None if some of the fragments were already written to
+        outfile.
+
+        """
+        if start < self.flushed:
+            return None
+        return self.fragments[start - self.flushed:]
+
+    def truncate(self, start):
+        """
+        Remove fragments added since a position returned by tell.
+
+        Fragments already written to outfile can not be removed.
+
+        """
+        del self.fragments[max(0, start - self.flushed):]
+
+    def clear(self):
+        """Remove all fragments."""
+        self.fragments = []
+
+    def flush(self):
+        """Write buffered fragments to outfile and remove them."""
+        if self.outfile is None:
+            return
+        if self.fmt == 'html':
+            pieces = self.iterRenderHTML(self.fragments, self.lists, False)
+        else:
+            pieces = self.iterRender(self.fmt)
+        self.outfile.write(''.join(pieces))
+        self.flushed += len(self.fragments)
+        self.fragments = []
+
+    def beginDocument(self, title=''):
+        """Write HTML document head to outfile for the 'html' format."""
+        if self.outfile is None:
+            return
+        if self.fmt == 'html':
+            self.outfile.write(
+                '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                '<title>' + html.escape(title) + '</title>\n</head>\n<body>\n')
+
+    def endDocument(self):
+        """Write remaining fragments and document footer to outfile."""
+        if self.outfile is None:
+            return
+        self.flush()
+        if self.fmt == 'html':
+            self.outfile.write(''.join(self.closeLists(self.lists, 0)))
+            self.outfile.write('</body>\n</html>\n')
+
+    def render(self, fmt='text'):
+        """
+        Join all fragments into a protocol document.
+
+        Parameters
+        ----------
+        fmt : {'text', 'markdown', 'html'}, optional
+            Output format. The default is 'text'.
+
+        Returns
+        -------
+        str
+            Rendered protocol.
+
+        """
+        return ''.join(self.iterRender(fmt))
+
+    def iterRender(self, fmt='text'):
+        """
+        Iterate through rendered protocol pieces in order.
+
+        Joining the pieces gives the output of render, so large protocols can
+        be written to a file piece by piece.
+
+        """
+        if fmt == 'text':
+            renderFunc = self.renderText
+        elif fmt == 'markdown':
+            renderFunc = self.renderMarkdown
+        elif fmt == 'html':
+            yield from self.iterRenderHTML(self.fragments)
+            return
+        else:
+            raise ValueError('unknown protocol format: ' + str(fmt))
+
+        for fragment in self.fragments:
+            yield renderFunc(*fragment)
+
+    def renderText(self, kind, level, text, value):
+        """Return plain text for a single fragment."""
+        if kind == 'heading':
+            return text + ' \n'
+        elif kind == 'field':
+            return text + ' ' + value + '\n'
+        elif kind == 'entry':
+            return self._tab + text + '\n'
+        elif kind == 'step':
+            return self._tab*level + str(value) + '. ' + text + '\n'
+        elif kind == 'detail':
+            return self._tab + self._tab + '- ' + text + '\n'
+        elif kind == 'error':
+            return '** ' + text + ' **'
+        return '\n'
+
+    def renderMarkdown(self, kind, level, text, value):
+        """Return Markdown for a single fragment."""
+        _indent = '    '
+        if kind == 'heading':
+            return '### ' + text + '\n\n'
+        elif kind == 'field':
+            return '**' + text + '** ' + value + '  \n'
+        elif kind == 'entry':
+            return '- ' + text + '\n'
+        elif kind == 'step':
+            return _indent*(level - 1) + str(value) + '. ' + text + '\n'
+        elif kind == 'detail':
+            return _indent*level + '- ' + text + '\n'
+        elif kind == 'error':
+            return '\n**' + text + '**\n'
+        return '\n'
+
+    def closeLists(self, lists, depth):
+        """Iterate through HTML closing open lists down to a depth."""
+        while len(lists) > depth:
+            tag, itemOpen = lists.pop()
+            if itemOpen:
+                yield '</li>'
+            yield '</' + tag + '>\n'
+
+    def openItem(self, lists, tag, depth, attributes=''):
+        """Return HTML opening a list item, opening lists up to depth."""
+        pieces = ''
+        if len(lists) >= depth and lists[depth - 1][0] != tag:
+            pieces += ''.join(self.closeLists(lists, depth - 1))
+        pieces += ''.join(self.closeLists(lists, depth))
+        while len(lists) < depth:
+            if lists != [] and not lists[-1][1]:
+                pieces += '<li>'
+                lists[-1][1] = True
+            pieces += '<' + tag + '>\n'
+            lists.append([tag, False])
+        if lists[-1][1]:
+            pieces += '</li>\n'
+        lists[-1][1] = True
+        return pieces + '<li' + attributes + '>'
+
+    def iterRenderHTML(self, fragments, lists=None, close=True):
+        """
+        Iterate through HTML pieces with nested lists for steps.
+
+        Parameters
+        ----------
+        fragments : list
+            Fragments to render.
+        lists : list, optional
+            Open lists in the format [<tag>, <item open>], kept up to date so
+            rendering can continue with later fragments. The default is None,
+            which starts with no open lists.
+        close : bool, optional
+            Close all open lists after the last fragment. The default is True.
+
+        """
+        if lists is None:
+            lists = []
+
+        for kind, level, text, value in fragments:
+            if kind == 'entry':
+                yield self.openItem(lists, 'ul', 1) + html.escape(text)
+            elif kind == 'step':
+                yield self.openItem(lists, 'ol', level,
+                                    ' value="' + str(value) + '"'
+                                    ) + html.escape(text)
+            elif kind == 'detail':
+                yield self.openItem(lists, 'ul', level + 1) + html.escape(text)
+            elif kind == 'blank':
+                continue
+            else:
+                yield from self.closeLists(lists, 0)
+                if kind == 'heading':
+                    yield '<h3>' + html.escape(text) + '</h3>\n'
+                elif kind == 'field':
+                    yield '<p><b>' + html.escape(text) + '</b> ' + \
+                        html.escape(value) + '</p>\n'
+                elif kind == 'error':
+                    yield '<p><b>' + html.escape(text) + '</b></p>\n'
+        if close:
+            yield from self.closeLists(lists, 0)
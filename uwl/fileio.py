@@ -0,0 +1,38 @@
+"""
+File read and write utilities for UWL workflow and dictionary files.
+
+"""
+import json
+
+
+def savejson(entry, filepath):
+    """
+    Save dictionary as .json file.
+
+    Parameters
+    ----------
+    entry : dict
+    filepath : str
+
+    """
+    with open(filepath, 'w') as outfile:
+        json.dump(entry, outfile)
+
+
+def loadjson(filepath):
+    """
+    Import .json file as dictionary.
+
+    Parameters
+    ----------
+    filepath : str
+
+    Returns
+    -------
+    data : dict
+
+    """
+    with open(filepath) as loadfile:
+        data = json.load(loadfile)
+        return data
+
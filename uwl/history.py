@@ -0,0 +1,348 @@
+"""
+Undo and redo history for workflow and section edits.
+
+Commands keep references to block data dictionaries rather than block
+identifiers. Identifiers are renumbered whenever block positions change, but
+block dictionaries keep their identity through renumbering, so a command can
+always find its blocks through their current 'ID' value.
+
+"""
+import abc
+import collections
+
+from uwl.workflow import Section
+
+
+class Command(abc.ABC):
+    """Reversible change to workflow or section data."""
+
+    @abc.abstractmethod
+    def undo(self, section):
+        """Revert change in Section wrapper data."""
+
+    @abc.abstractmethod
+    def redo(self, section):
+        """Apply change to Section wrapper data."""
+
+
+class CommandGroup(Command):
+    """Several commands undone and redone as a single step."""
+
+    def __init__(self, commands):
+        self.commands = commands
+
+    def undo(self, section):
+        """Undo commands in reverse order."""
+        for command in reversed(self.commands):
+            command.undo(section)
+
+    def redo(self, section):
+        """Redo commands in order."""
+        for command in self.commands:
+            command.redo(section)
+
+
+class MoveCommand(Command):
+    """
+    Block position change.
+
+    Parameters
+    ----------
+    moves : list
+        List of block moves in the format [<block data>, <old position>,
+        <new position>].
+
+    """
+
+    def __init__(self, moves):
+        self.moves = moves
+
+    def undo(self, section):
+        """Move blocks back to their old positions."""
+        for block, oldpos, newpos in self.moves:
+            section.setBlockPosition(block['ID'], oldpos)
+
+    def redo(self, section):
+        """Move blocks to their new positions."""
+        for block, oldpos, newpos in self.moves:
+            section.setBlockPosition(block['ID'], newpos)
+
+
+class AddBlocksCommand(Command):
+    """
+    Blocks added to a section, such as new, pasted, or imported blocks.
+
+    Parameters
+    ----------
+    blocks : list
+        Block data dictionaries which are in the section when the command is
+        pushed.
+
+    """
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.connections = []
+        self.indices = None
+
+    def undo(self, section):
+        """Remove blocks and store their connections."""
+        self.connections, self.indices = detachBlocks(section, self.blocks)
+
+    def redo(self, section):
+        """Restore blocks and their connections."""
+        attachBlocks(section, self.blocks, self.connections, self.indices)
+
+
+class DeleteBlocksCommand(AddBlocksCommand):
+    """
+    Blocks deleted from a section.
+
+    The command is created before the deletion and the deletion is carried
+    out through redo.
+
+    """
+
+    def undo(self, section):
+        """Restore blocks and their connections."""
+        attachBlocks(section, self.blocks, self.connections, self.indices)
+
+    def redo(self, section):
+        """Remove blocks and store their connections."""
+        self.connections, self.indices = detachBlocks(section, self.blocks)
+
+
+class EdgeCommand(Command):
+    """
+    Connections added to or removed from action blocks.
+
+    Removed connections are put back at their old position in the connection
+    list of the action, so undo restores the order of the list.
+
+    Parameters
+    ----------
+    added : list, optional
+        Added connections in the format [<item block data>, <action block
+        data>, <connection type>], in the order they were added. The default
+        is None.
+    removed : list, optional
+        Removed connections in the format [<item block data>, <action block
+        data>, <connection type>, <list index>], in the order they were
+        removed. List index is the position of the connection in the
+        connection list before it was removed, or None to restore the
+        connection at the end of the list. The default is None.
+
+    """
+
+    def __init__(self, added=None, removed=None):
+        self.added = added or []
+        self.removed = removed or []
+
+    def undo(self, section):
+        """Remove added connections and restore removed connections."""
+        for source, dest, edgeType in reversed(self.added):
+            section.removeEdge(source['ID'], dest['ID'], edgeType)
+        for source, dest, edgeType, ii in reversed(self.removed):
+            section.addEdge(source['ID'], dest['ID'], edgeType, ii)
+
+    def redo(self, section):
+        """Remove removed connections and restore added connections."""
+        for source, dest, edgeType, ii in self.removed:
+            section.removeEdge(source['ID'], dest['ID'], edgeType)
+        for source, dest, edgeType in self.added:
+            section.addEdge(source['ID'], dest['ID'], edgeType)
+
+
+class EditBlockCommand(Command):
+    """
+    Block data replaced by edited block data.
+
+    Parameters
+    ----------
+    changes : list
+        List of replacements in the format [<section data>, <old block data>,
+        <new block data>]. Section data is the workflow or section dictionary
+        holding the block, which may differ from the section of the history.
+
+    """
+
+    def __init__(self, changes):
+        self.changes = changes
+
+    def undo(self, section):
+        """Put old block data back in place of the edited data."""
+        for sectionData, oldBlock, newBlock in reversed(self.changes):
+            swapBlockData(section, sectionData, newBlock, oldBlock)
+
+    def redo(self, section):
+        """Put edited block data back in place of the old data."""
+        for sectionData, oldBlock, newBlock in self.changes:
+            swapBlockData(section, sectionData, oldBlock, newBlock)
+
+
+class History():
+    """
+    Bounded undo and redo stacks of commands.
+
+    Parameters
+    ----------
+    limit : int, optional
+        Maximum number of undo steps kept. The oldest steps are discarded
+        first. The default is 100.
+
+    """
+
+    def __init__(self, limit=100):
+        self.undoStack = collections.deque(maxlen=limit)
+        self.redoStack = []
+
+    def push(self, command, merge=False):
+        """
+        Add an already applied command to the history.
+
+        Parameters
+        ----------
+        command : Command
+            Applied command.
+        merge : bool, optional
+            Add the command to the most recent step so both are undone
+            together. The default is False.
+
+        """
+        self.redoStack = []
+        if merge and len(self.undoStack) > 0:
+            lastCommand = self.undoStack.pop()
+            if not isinstance(lastCommand, CommandGroup):
+                lastCommand = CommandGroup([lastCommand])
+            lastCommand.commands.append(command)
+            command = lastCommand
+        self.undoStack.append(command)
+
+    def undo(self, section):
+        """Undo most recent step. Return False if nothing to undo."""
+        if len(self.undoStack) == 0:
+            return False
+        command = self.undoStack.pop()
+        command.undo(section)
+        self.redoStack.append(command)
+        return True
+
+    def redo(self, section):
+        """Redo most recently undone step. Return False if nothing to redo."""
+        if len(self.redoStack) == 0:
+            return False
+        command = self.redoStack.pop()
+        command.redo(section)
+        self.undoStack.append(command)
+        return True
+
+    def clear(self):
+        """Remove all undo and redo steps."""
+        self.undoStack.clear()
+        self.redoStack = []
+
+
+def detachBlocks(section, blocks):
+    """
+    Remove blocks from section along with their connections.
+
+    Parameters
+    ----------
+    section : Section
+        Section wrapper holding the blocks.
+    blocks : list
+        Block data dictionaries to remove.
+
+    Returns
+    -------
+    connections : list
+        Removed connections in the format [<item block data>, <action block
+        data>, <connection type>, <list index>], in list index order.
+    indices : list
+        Index of each block in the section objects dictionary. Restoring the
+        order keeps ties in positional priority resolved the same way.
+
+    """
+    objects = section.data['Objects']
+    objectKeys = {key: ii for ii, key in enumerate(objects.keys())}
+    indices = [objectKeys[block['ID']] for block in blocks]
+    edgeIndex = section.getEdgeIndex()
+    connections = []
+    found = set()
+    for block in blocks:
+        key = block['ID']
+        pairs = []
+        for edgeType, destKeys in edgeIndex.reverse.get(key, {}).items():
+            pairs += [(key, destKey, edgeType) for destKey in destKeys]
+        for edgeType, sourceKeys in edgeIndex.forward.get(key, {}).items():
+            pairs += [(sourceKey, key, edgeType) for sourceKey in sourceKeys]
+        for sourceKey, destKey, edgeType in pairs:
+            if (sourceKey, destKey, edgeType) in found:
+                continue
+            if sourceKey not in objects or destKey not in objects:
+                continue
+            found.add((sourceKey, destKey, edgeType))
+            inKeys = objects[destKey][edgeType + ' In']
+            connections.append([objects[sourceKey], objects[destKey],
+                                edgeType, inKeys.index(sourceKey)])
+    connections.sort(key=lambda connection: connection[3])
+
+    for source, dest, edgeType, ii in connections:
+        section.removeEdge(source['ID'], dest['ID'], edgeType)
+    for block in blocks:
+        section.removeBlock(block['ID'])
+    return connections, indices
+
+
+def attachBlocks(section, blocks, connections, indices=None):
+    """
+    Add blocks to section with new identifiers and restore connections.
+
+    Parameters
+    ----------
+    section : Section
+        Section wrapper to add blocks to.
+    blocks : list
+        Block data dictionaries to add.
+    connections : list
+        Connections returned by detachBlocks.
+    indices : list, optional
+        Block indices returned by detachBlocks. The default is None, which
+        adds blocks at the end of the section.
+
+    """
+    if indices is None:
+        nObjects = len(section.data['Objects'])
+        indices = [nObjects + ii for ii in range(len(blocks))]
+    section.insertBlocks(blocks, indices)
+
+    for source, dest, edgeType, ii in connections:
+        section.addEdge(source['ID'], dest['ID'], edgeType, ii)
+
+
+def swapBlockData(section, sectionData, oldBlock, newBlock):
+    """
+    Replace block data in section, keeping identifier and position.
+
+    Parameters
+    ----------
+    section : Section
+        Section wrapper of the history, holding sectionData directly or in a
+        nested section.
+    sectionData : dict
+        Workflow or section dictionary holding the block.
+    oldBlock : dict
+        Block data to replace.
+    newBlock : dict
+        Replacement block data.
+
+    """
+    key = oldBlock['ID']
+    if sectionData['Objects'].get(key) is not oldBlock:
+        return
+    newBlock['ID'] = key
+    newBlock['position'] = oldBlock['position']
+    target = section.findSection(sectionData)
+    if target is None:
+        target = Section(sectionData)
+    target.addBlock(newBlock)
@@ -0,0 +1,74 @@
+"""
+Access to the multilingual babelFish dictionary.
+
+The dictionary is built by azure_preprocessing.py and holds the translated
+interface text, block names, parameter names, and step phrase templates for
+every supported language.
+
+"""
+import os
+
+from uwl.fileio import loadjson
+from uwl.phrases import compileTemplates
+
+
+preprocessingdir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'preprocessing')
+filepath = os.path.join(preprocessingdir, 'babelfish.json')
+
+_babelFish = None
+_nounTables = {}
+
+
+def getBabelFish():
+    """
+    Return the babelFish dictionary, loading it on first use.
+
+    Step phrase templates are compiled once while loading.
+
+    Returns
+    -------
+    babelFish : dict
+        Multilingual dictionary keyed by 'languages', 'ui', 'Action',
+        'Item', 'Action Parameter', and 'Item Parameter'.
+
+    """
+    global _babelFish
+    if _babelFish is None:
+        _babelFish = compileTemplates(loadjson(filepath))
+    return _babelFish
+
+
+def getLanguageKeys():
+    """Return list of all language keys available in babelFish."""
+    return [key for key in getBabelFish()['languages'].keys()]
+
+
+def getNounTable(lankey):
+    """
+    Return translated item names for a language, building them on first use.
+
+    Parameters
+    ----------
+    lankey : str
+        Language key of the translations.
+
+    Returns
+    -------
+    nounTable : dict
+        Translated item names keyed by English item name. Items without a
+        translation in the language are left out. Shared between callers and
+        must not be changed.
+
+    """
+    if lankey not in _nounTables:
+        nounTable = {}
+        for noun, languages in getBabelFish()['Item'].items():
+            try:
+                nounTable[noun] = languages[lankey]['Name']
+            except Exception:
+                continue
+        _nounTables[lankey] = nounTable
+    return _nounTables[lankey]
+
@@ -0,0 +1,54 @@
+"""
+Unique name allocation for duplicate block and parameter names.
+
+"""
+
+
+class NameAllocator():
+    """
+    Allocate unique names by adding a modifier to duplicate names.
+
+    Duplicates of a name receive the modifiers (1), (2), ... (N), using the
+    lowest number which gives a name that has not been issued. The last
+    number used for each name is kept, so repeated duplicates do not search
+    from (1) again.
+
+    """
+
+    def __init__(self):
+        self.issued = set()
+        self.counters = {}
+
+    def __contains__(self, name):
+        return name in self.issued
+
+    def __len__(self):
+        return len(self.issued)
+
+    def getUniqueName(self, name):
+        """
+        Return unique version of name and record it as issued.
+
+        Parameters
+        ----------
+        name : str
+            Original name.
+
+        Returns
+        -------
+        uniqueName : str
+            Name with a modifier in the format ' (<N>)' if the original name
+            has already been issued.
+
+        """
+        uniqueName = name
+        if uniqueName in self.issued:
+            d = self.counters.get(name, 1)
+            uniqueName = name + ' (' + str(d) + ')'
+            while uniqueName in self.issued:
+                d = d + 1
+                uniqueName = name + ' (' + str(d) + ')'
+            self.counters[name] = d
+
+        self.issued.add(uniqueName)
+        return uniqueName
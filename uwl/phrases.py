@@ -0,0 +1,113 @@
+"""
+Action phrase templates for protocol step sentences.
+
+Step sentences are stored as format strings with the slots {a}, {b}, and {c}
+for the item series connected to an action through A, B, and C connections,
+e.g. 'Add {a} to {b}'. Templates are checked once and rendered with
+str.format, and are called like step functions, template(itemA, itemB,
+itemC).
+
+"""
+import string
+
+slotNames = ['a', 'b', 'c']
+
+
+class PhraseTemplate():
+    """
+    Action phrase template called like a step function.
+
+    The template is checked on first use, so loading a dictionary only
+    prepares the templates of the languages in use. Templates with slots
+    other than {a}, {b}, and {c}, such as mistranslated slot names, raise
+    KeyError when called.
+
+    Parameters
+    ----------
+    template : str
+        Format string with slots {a}, {b}, and {c}.
+
+    """
+
+    def __init__(self, template):
+        self.template = template
+        self.render = self.prepareRender
+
+    def __call__(self, a, b, c):
+        """Return step sentence with item series a, b, and c in the slots."""
+        return self.render(a, b, c)
+
+    def __repr__(self):
+        return 'PhraseTemplate(' + repr(self.template) + ')'
+
+    def prepareRender(self, a, b, c):
+        """Prepare template, then render with the prepared function."""
+        self.render = getRender(self.template)
+        return self.render(a, b, c)
+
+
+def getRender(template):
+    """
+    Return function rendering a phrase template.
+
+    The template is split into literal text and slots once and joined again
+    as a format string with the positional fields {0}, {1}, and {2}, so
+    rendering is a single str.format call. Slots with format specifications,
+    conversions, attributes, or indices are rejected, so templates can only
+    insert the item series as they are.
+
+    Parameters
+    ----------
+    template : str
+        Format string with slots {a}, {b}, and {c}.
+
+    Returns
+    -------
+    render : function
+        Function of the item series a, b, and c returning the step sentence.
+
+    """
+    pieces = []
+    try:
+        for literal, field, spec, conversion in string.Formatter().parse(
+                template):
+            pieces.append(literal.replace('{', '{{').replace('}', '}}'))
+            if field is None:
+                continue
+            if field not in slotNames or spec != '' or conversion is not None:
+                return getInvalidRender(field)
+            pieces.append('{' + str(slotNames.index(field)) + '}')
+    except ValueError as e:
+        return getInvalidRender(str(e))
+    return ''.join(pieces).format
+
+
+def getInvalidRender(slot):
+    """Return function raising KeyError for an invalid template slot."""
+    def render(a, b, c):
+        raise KeyError(slot)
+    return render
+
+
+def compileTemplates(babelFish):
+    """
+    Replace action phrase template strings with PhraseTemplate objects.
+
+    Parameters
+    ----------
+    babelFish : dict
+        Multilingual dictionary with template strings in the format
+        babelFish['Action'][<action>][<lankey>]['Func'][<variant>].
+
+    Returns
+    -------
+    babelFish : dict
+        Dictionary with PhraseTemplate objects in place of the strings.
+
+    """
+    for languages in babelFish['Action'].values():
+        for entry in languages.values():
+            funcs = entry.get('Func', {})
+            for variant in funcs.keys():
+                funcs[variant] = PhraseTemplate(funcs[variant])
+    return babelFish
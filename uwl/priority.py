@@ -0,0 +1,91 @@
+"""
+Cached positional priority ordering of section blocks.
+
+Block priority is given by horizontal position from left to right, then by
+vertical position from top to bottom. Rendering, renumbering, and sequence
+line drawing all ask for the same order many times between block moves, so
+each section wrapper keeps its order and only sorts again when its layout
+version changes, which happens when a block position, identifier, or type
+changes.
+
+"""
+import numpy as np
+
+
+class PriorityOrder():
+    """
+    Positional priority lists of a section, cached by layout version.
+
+    Looking up a cached order only compares the layout version, so it does
+    not depend on the number of blocks in the section.
+
+    """
+
+    # Sections with at least this many blocks are sorted with numpy.lexsort
+    lexsortSize = 1000
+
+    def __init__(self):
+        self.version = None
+        self.order = None
+
+    def getLayout(self, data):
+        """Return tuple of block identifiers, positions, and types."""
+        return tuple((block['ID'], block['position'][0],
+                      block['position'][1], block['Type'])
+                     for block in data['Objects'].values())
+
+    def sortLayout(self, layout):
+        """
+        Return block identifiers of a layout in position order.
+
+        Blocks with equal positions keep their order in the section.
+
+        """
+        if len(layout) >= self.lexsortSize:
+            x = np.array([block[1] for block in layout], dtype=float)
+            y = np.array([block[2] for block in layout], dtype=float)
+            return [layout[ii][0] for ii in np.lexsort((y, x))]
+        order = sorted(range(len(layout)),
+                       key=lambda ii: (layout[ii][1], layout[ii][2]))
+        return [layout[ii][0] for ii in order]
+
+    def getOrder(self, data, version):
+        """
+        Return cached priority lists of a section, sorting if needed.
+
+        Parameters
+        ----------
+        data : dict
+            Workflow entry or section data dictionary.
+        version : int
+            Layout version of the section data. Lists are sorted again when
+            it differs from the version of the cached lists.
+
+        Returns
+        -------
+        order : list
+            Priority lists and item ranks in the format [<all blocks>,
+            <item blocks>, <action and section blocks>, <item ranks>], where
+            item ranks map item identifiers to their index in the item list.
+            Order data is shared with the cache and must not be changed.
+
+        """
+        if self.order is not None and self.version == version:
+            return self.order
+
+        layout = self.getLayout(data)
+        priority = self.sortLayout(layout)
+        types = {block[0]: block[3] for block in layout}
+        itemPriority = [ID for ID in priority if types[ID] == 'Item']
+        actionPriority = [ID for ID in priority
+                          if types[ID] in ['Action', 'Section']]
+        itemRanks = {ID: ii for ii, ID in enumerate(itemPriority)}
+        self.order = [priority, itemPriority, actionPriority, itemRanks]
+        self.version = version
+        return self.order
+
+    def clear(self):
+        """Remove cached order."""
+        self.version = None
+        self.order = None
+
@@ -0,0 +1,1009 @@
+"""
+Written protocol generation from workflow data.
+
+"""
+import collections
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from uwl.emitter import ProtocolEmitter
+from uwl.language import getBabelFish, getNounTable
+from uwl.naming import NameAllocator
+from uwl.workflow import Section, connectionTypes
+
+logger = logging.getLogger(__name__)
+
+
+class ProtocolWriter():
+    """
+    Generate translated plain text protocols from workflow data.
+
+    Protocol fragments are cached by the data version of the block or section
+    they were generated from, as kept by the Section wrapper. A writer given
+    the same wrapper between edits only transcribes the steps and sections
+    that changed and reuses every other fragment.
+
+    Parameters
+    ----------
+    lankey : str, optional
+        Language key of the protocol. The default is 'en'.
+    cacheLimit : int, optional
+        Maximum number of cached sections and steps. The least recently used
+        entries are discarded first. 0 turns off caching, e.g. for a single
+        export of a large protocol. The default is 10000.
+
+    """
+
+    def __init__(self, lankey='en', cacheLimit=10000):
+        self.lankey = lankey
+        self.cacheLimit = cacheLimit
+        self.fragmentCache = collections.OrderedDict()
+        babelFish = getBabelFish()
+
+        try:
+            self.textconstlist = babelFish[
+                'ui'][self.lankey]['plain text const']
+        except Exception as e:
+            logger.warning('No protocol text for language %s: %r',
+                           self.lankey, e)
+            self.textconstlist = ['' for ii in range(30)]
+
+        self.actionDict = babelFish['Action']
+        self.itemDict = babelFish['Item']
+        self.nounTable = getNounTable(self.lankey)
+        self.paramDict = {'Action Parameter': babelFish['Action Parameter'],
+                          'Item Parameter': babelFish['Item Parameter']}
+
+    def textFromWorkflow(self, workflow, section=None):
+        """
+        Generate full protocol text for a given workflow entry.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow data dictionary.
+        section : Section, optional
+            Data wrapper of the workflow. The default is None, which wraps
+            the workflow for this call only.
+
+        Returns
+        -------
+        text : str
+            Full protocol text for a given work flow.
+
+        """
+        return self.emitWorkflow(workflow, section=section).render('text')
+
+    def renderWorkflow(self, workflow, fmt='text'):
+        """
+        Generate full protocol for a given workflow entry in a format.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow data dictionary.
+        fmt : {'text', 'markdown', 'html'}, optional
+            Output format. The default is 'text'.
+
+        Returns
+        -------
+        str
+            Full protocol in the selected format.
+
+        """
+        return self.emitWorkflow(workflow).render(fmt)
+
+    def emitWorkflow(self, workflow, emitter=None, section=None):
+        """
+        Add full protocol fragments for a given workflow entry to an emitter.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow data dictionary.
+        emitter : ProtocolEmitter, optional
+            Fragment buffer to add to. The default is None, which creates a
+            new buffer.
+        section : Section, optional
+            Data wrapper of the workflow. Cached fragments are only reused
+            while the same wrapper is passed, and wrappers kept between calls
+            also keep the positional priority order of each section. The
+            default is None, which wraps the workflow for this call only.
+
+        Returns
+        -------
+        emitter : ProtocolEmitter
+            Fragment buffer holding the protocol.
+
+        """
+        if emitter is None:
+            emitter = ProtocolEmitter()
+        start = emitter.tell()
+        try:
+            self.textconstlist = getBabelFish()[
+                'ui'][self.lankey]['plain text const']
+            if section is None:
+                section = Section(workflow)
+
+            # Base features
+            self.generateBaseText(emitter, workflow)
+
+            # Additional list
+            self.emitCached(emitter, self.generateAbstractText, section)
+            emitter.blank()
+
+            # Materials list
+            self.emitCached(emitter, self.generateMaterialsText, section)
+            emitter.blank()
+
+            # Equipment list
+            self.emitCached(emitter, self.generateEquipmentText, section)
+            emitter.blank()
+
+            # Protocol steps
+            self.emitCached(emitter, self.generateProtocolText, section, 1)
+
+        except Exception as e:
+            self.textconstlist = [' ' for ii in range(30)]
+            logger.warning('Protocol transcription failed: %r', e)
+            emitter.truncate(start)
+            emitter.error(self.textconstlist[0])
+
+        return emitter
+
+    def getCached(self, cacheKey):
+        """Return cached value and mark it as recently used, or None."""
+        value = self.fragmentCache.get(cacheKey)
+        if value is not None:
+            self.fragmentCache.move_to_end(cacheKey)
+        return value
+
+    def setCached(self, cacheKey, value):
+        """Add value to cache, discarding the oldest entries over the limit."""
+        self.fragmentCache[cacheKey] = value
+        while len(self.fragmentCache) > self.cacheLimit:
+            self.fragmentCache.popitem(last=False)
+
+    def emitCached(self, emitter, generate, section, *args):
+        """
+        Add fragments of a protocol part for a workflow or section.
+
+        Fragments are reused from the cache if the section version is
+        unchanged, otherwise they are generated and cached.
+
+        Parameters
+        ----------
+        emitter : ProtocolEmitter
+            Protocol fragment buffer.
+        generate : function
+            Generate method of the protocol part, called with emitter,
+            section, and args.
+        section : Section
+            Workflow entry or section data wrapper.
+        *args
+            Remaining arguments of the generate method, such as the section
+            branch path or section level.
+
+        """
+        if self.cacheLimit == 0:
+            generate(emitter, section, *args)
+            return
+        cacheKey = (generate.__name__, section.version) + args
+        fragments = self.getCached(cacheKey)
+        if fragments is None:
+            start = emitter.tell()
+            generate(emitter, section, *args)
+            fragments = emitter.getFragments(start)
+            # Parts partly written to a streamed file are not cached
+            if fragments is not None:
+                self.setCached(cacheKey, fragments)
+        else:
+            emitter.extend(fragments)
+
+    def generateBaseText(self, emitter, workflow):
+        """
+        Add basic information and description text to full protocol.
+
+        Parameters
+        ----------
+        emitter : ProtocolEmitter
+            Protocol fragment buffer.
+        workflow : dict
+            Workflow entry data dictionary.
+
+        """
+        try:
+            emitter.field(self.textconstlist[1], str(workflow['Name']))
+            emitter.field(self.textconstlist[2], str(workflow['Description']))
+        except Exception as e:
+            logger.warning('Base information transcription failed: %r', e)
+            emitter.error(self.textconstlist[3])
+        emitter.blank()
+
+    def generateAbstractText(self, emitter, section, sectName=''):
+        """
+        Add abstract item block data to protocol text.
+
+        Iterate through sections within the current workflow or section.
+
+        Parameters
+        ----------
+        emitter : ProtocolEmitter
+            Protocol fragment buffer.
+        section : Section
+            Workflow entry or section data wrapper.
+        sectName : str, optional
+            Current section branch path. Section levels are separated by ' > '.
+            The default is ''.
+
+        """
+        try:
+            if sectName == '':
+                emitter.heading(self.textconstlist[4])
+            workflow = section.data
+            itemNames = NameAllocator()
+            for key in workflow['Objects'].keys():
+                if workflow['Objects'][key]['Type'] == 'Section':
+                    newSectName = sectName + \
+                        workflow['Objects'][key]['Name'] + ' > '
+                    self.emitCached(
+                        emitter, self.generateAbstractText,
+                        section.getSection(key), newSectName)
+
+                elif workflow['Objects'][key]['Type'] != 'Item':
+                    continue
+
+                elif workflow['Objects'][key]['Subtype'] == 'Abstract':
+                    connected = section.checkItemForConnections(key)
+                    if connected:
+                        continue
+
+                    emitter.entry(self.getItemLine(
+                        workflow, key, itemNames, sectName))
+
+        except Exception as e:
+            logger.warning('Abstract transcription failed: %r', e)
+            emitter.error(self.textconstlist[5])
+
+    def generateMaterialsText(self, emitter, section, sectName=''):
+        """
+        Add source item block data to protocol text.
+
+        Iterate through sections within the current workflow or section.
+
+        Parameters
+        ----------
+        emitter : ProtocolEmitter
+            Protocol fragment buffer.
+        section : Section
+            Workflow entry or section data wrapper.
+        sectName : str, optional
+            Current section branch path. Section levels are separated by ' > '.
+            The default is ''.
+
+        """
+        try:
+            if sectName == '':
+                emitter.heading(self.textconstlist[6])
+            workflow = section.data
+            itemNames = NameAllocator()
+            for key in workflow['Objects'].keys():
+                if workflow['Objects'][key]['Type'] == 'Section':
+                    newSectName = sectName + \
+                        workflow['Objects'][key]['Name'] + ' > '
+                    self.emitCached(
+                        emitter, self.generateMaterialsText,
+                        section.getSection(key), newSectName)
+                elif workflow['Objects'][key]['Type'] != 'Item':
+                    continue
+
+                elif workflow['Objects'][key]['Subtype'] in ['Source']:
+                    emitter.entry(self.getItemLine(
+                        workflow, key, itemNames, sectName))
+        except Exception as e:
+            logger.warning('Materials transcription failed: %r', e)
+            emitter.error(self.textconstlist[7])
+
+    def generateEquipmentText(self, emitter, section, sectName=''):
+        """
+        Add tool and container item block data to protocol text.
+
+        Iterate through sections within the current workflow or section.
+
+        Parameters
+        ----------
+        emitter : ProtocolEmitter
+            Protocol fragment buffer.
+        section : Section
+            Workflow entry or section data wrapper.
+        sectName : str, optional
+            Current section branch path. Section levels are separated by ' > '.
+            The default is ''.
+
+        """
+        try:
+            if sectName == '':
+                emitter.heading(self.textconstlist[8])
+            workflow = section.data
+            itemNames = NameAllocator()
+            for key in workflow['Objects'].keys():
+                if workflow['Objects'][key]['Type'] == 'Section':
+                    newSectName = sectName + \
+                        workflow['Objects'][key]['Name'] + ' > '
+                    self.emitCached(
+                        emitter, self.generateEquipmentText,
+                        section.getSection(key), newSectName)
+                elif workflow['Objects'][key]['Type'] != 'Item':
+                    continue
+
+                elif workflow['Objects'][key]['Subtype'] in ['Tool',
+                                                             'Container']:
+                    emitter.entry(self.getItemLine(
+                        workflow, key, itemNames, sectName))
+        except Exception as e:
+            logger.warning('Equipment transcription failed: %r', e)
+            emitter.error(self.textconstlist[9])
+
+    def getItemLine(self, workflow, key, itemNames, sectName=''):
+        """
+        Return abstract, materials, or equipment list line for an item.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow entry or section data dictionary.
+        key : str
+            Item block identifier.
+        itemNames : NameAllocator
+            Allocator holding all previously listed item names.
+        sectName : str, optional
+            Current section branch path. The default is ''.
+
+        Returns
+        -------
+        textline : str
+            Item name with parameter and note data.
+
+        """
+        itemName, itemNames = self.getUniqueItemName(workflow, key, itemNames)
+        textline = sectName + itemName
+        textline = self.addParamsList(workflow, textline, key)
+        textline = self.addNoteText(workflow, textline, key)
+        return textline
+
+    def getUniqueItemName(self, workflow, key, itemNames):
+        """
+        Add unique modifier to current item.
+
+        Check if the item name identified through key is a unique name in
+        itemNames list. If it is not unique, add a modifier with the format
+        <Duplicate 1>, <Duplicate 2>, ... <Duplicate N> is represented by (1),
+        (2), ... (N), respectively.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow entry or section data dictionary.
+        key : str
+            Identifier for named block in workflow.
+        itemNames : NameAllocator
+            Allocator holding all previously checked item names.
+
+        Returns
+        -------
+        itemName : str
+            Unique item name.
+        itemNames : NameAllocator
+            Allocator with unique name added.
+
+        """
+        rootItemName = self.getTranslatedNoun(workflow['Objects'][key]['Name'])
+        itemName = itemNames.getUniqueName(rootItemName)
+        return itemName, itemNames
+
+    def generateProtocolText(self, emitter, section, level=1):
+        """
+        Add protocol steps data to protocol text.
+
+        Iterate through sections within the current workflow or section.
+
+        Parameters
+        ----------
+        emitter : ProtocolEmitter
+            Protocol fragment buffer.
+        section : Section
+            Workflow entry or section data wrapper.
+        level : int, optional
+            Current section level. The default is 1.
+
+        """
+        try:
+            if level == 1:
+                emitter.heading(self.textconstlist[10])
+
+            workflow = section.data
+            itemPriority, actionPriority = section.getItemActionPriorityLists()
+            itemRanks = section.getItemPriorityRanks()
+            c = 0
+            for key in actionPriority:
+                c = c + 1
+                try:
+                    if workflow['Objects'][key]['Type'] == 'Section':
+                        sectName = workflow['Objects'][key]['Name']
+                        emitter.step(level, c, sectName)
+                        sectLevel = level + 1
+                        self.emitCached(
+                            emitter, self.generateProtocolText,
+                            section.getSection(key), sectLevel)
+                        emitter.blank()
+                    else:
+                        textline, abstractLines = self.getStepLines(
+                            section, key, itemRanks)
+                        emitter.step(level, c, textline + '.')
+                        for abstractLine in abstractLines:
+                            emitter.detail(level, abstractLine)
+
+                except Exception as e:
+                    logger.warning('Step %s transcription failed: %r', key, e)
+                    textline = '** ' + self.textconstlist[11] + ' **'
+
+        except Exception as e:
+            logger.warning('Protocol steps transcription failed: %r', e)
+            emitter.error(self.textconstlist[12])
+
+    def getStepLines(self, section, key, itemRanks):
+        """
+        Return protocol step line and abstract modifier lines of an action.
+
+        Lines are cached by the block versions of the action and its
+        connected blocks, and by the positional order of the connected items.
+
+        Parameters
+        ----------
+        section : Section
+            Workflow entry or section data wrapper.
+        key : str
+            Action block identifier.
+        itemRanks : dict
+            Item block positional ranks from Section.getItemPriorityRanks.
+
+        Returns
+        -------
+        textline : str
+            Protocol step line with parameter and note data.
+        abstractLines : list
+            Abstract block names with parameter data.
+
+        """
+        workflow = section.data
+        objects = workflow['Objects']
+        cacheKey = None
+        if self.cacheLimit > 0:
+            cacheKey = ['step', section.getBlockVersion(key)]
+            for connectionType in connectionTypes:
+                inKeys = objects[key][connectionType + ' In']
+                cacheKey.append(tuple(section.getBlockVersion(inKey)
+                                      for inKey in inKeys if inKey in objects))
+                cacheKey.append(tuple(self.sortListbyPriority(
+                    inKeys, itemRanks)))
+            cacheKey = tuple(cacheKey)
+            lines = self.getCached(cacheKey)
+            if lines is not None:
+                return lines
+
+        textline = self.generateTextLine(workflow, key, itemRanks)
+        textline = self.addParamsList(workflow, textline, key)
+        textline = self.addNoteText(workflow, textline, key)
+        abstractLines = self.getAbstractLines(workflow, key)
+        if cacheKey is not None:
+            self.setCached(cacheKey, (textline, abstractLines))
+        return textline, abstractLines
+
+    def getAbstractLines(self, workflow, key):
+        """
+        Return modifier lines of abstract blocks connected to an action.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow entry or section data dictionary.
+        key : str
+            Action block identifier.
+
+        Returns
+        -------
+        textlines : list
+            Abstract block names with parameter data.
+
+        """
+        keyList = []
+        for mkey in workflow['Objects'][key]['A In']:
+            if workflow['Objects'][mkey]['Subtype'] == 'Abstract':
+                keyList.append(mkey)
+        for mkey in workflow['Objects'][key]['B In']:
+            if workflow['Objects'][mkey]['Subtype'] == 'Abstract':
+                keyList.append(mkey)
+        for mkey in workflow['Objects'][key]['C In']:
+            if workflow['Objects'][mkey]['Subtype'] == 'Abstract':
+                keyList.append(mkey)
+
+        textlines = []
+        for inKey in keyList:
+            if workflow['Objects'][inKey]['Parameters'] == []:
+                continue
+
+            textline = workflow['Objects'][inKey]['Name']
+            textline = self.addParamsList(workflow, textline, inKey)
+            textlines.append(textline)
+
+        return textlines
+
+    def addNoteText(self, workflow, text, key):
+        """
+        Add note text to current protocol step for abstract blocks.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow entry or section data dictionary.
+        text : str
+            Current protocol line.
+        key : str
+            Action block identifier.
+
+        Returns
+        -------
+        text : str
+            Protocol text with note data appended.
+
+        """
+        if workflow['Objects'][key]['Notes'] != '':
+            text = text + ' (Note: ' + workflow['Objects'][key]['Notes'] + ')'
+        return text
+
+    def addParamsList(self, workflow, text, key):
+        """
+        Add block parameter text to a protocol line.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow entry or section data dictionary.
+        text : str
+            Current protocol line.
+        key : str
+            Block identifier.
+
+        Returns
+        -------
+        text : str
+            Protocol line with parameter data appended. Unchanged if the block
+            has no parameters.
+
+        """
+        typeKey = workflow['Objects'][key]['Type'] + ' Parameter'
+        params = []
+        for ii in range(len(workflow['Objects'][key]['Parameters'])):
+            param_en = str(workflow['Objects'][key]['Parameters'][ii])
+            try:
+                param = self.paramDict[typeKey][param_en][self.lankey]['Name']
+            except Exception as e:
+                logger.warning('Missing %s parameter translation: %r',
+                               self.lankey, e)
+                param = param_en
+            val = str(workflow['Objects'][key]['Values'][ii])
+            if val == '':
+                val = '###'
+            params.append(param + ' - ' + val)
+        if params == []:
+            return text
+        return text + ': [' + '; '.join(params) + ']'
+
+    def getItemNouns(self, keys, workflow):
+        """
+        Generate grammatical series string for all item names from keys.
+
+        Returns noun string which follows english grammatical rules for
+        listing multiple items together (e.g. A, B, and C).
+
+        Parameters
+        ----------
+        keys : list
+            List of item block identifiers to convert to string.
+        workflow : dict
+            Workflow entry or section data dictionary.
+
+        Returns
+        -------
+        nounStr : str
+            Series string for all listed objects.
+
+        """
+        #  TODO: Make multilingual
+        nouns = [self.getTranslatedNoun(workflow['Objects'][key]['Name'])
+                 for key in keys]
+        if len(nouns) == 0:
+            nounStr = ''
+        elif len(nouns) == 1:
+            nounStr = nouns[0]
+        elif len(nouns) == 2:
+            nounStr = nouns[0] + ' ' + self.textconstlist[14] + ' ' + nouns[1]
+        else:
+            nounStr = ', '.join(nouns[:-1]) + ', ' + \
+                self.textconstlist[14] + ' ' + nouns[-1]
+        return nounStr
+
+    def getTranslatedNoun(self, noun):
+        """Return translated noun with bypass error handling."""
+        try:
+            return self.nounTable[noun]
+        except Exception as e:
+            logger.warning('Missing %s noun translation: %r', self.lankey, e)
+            return noun
+
+    def generateTextLine(self, workflow, key, priority):
+        """
+        Generate protocol step line for a given action item.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow entry or section data dictionary.
+        key : str
+            Action block identifier.
+        priority : dict or list
+            Item block positional ranks from Section.getItemPriorityRanks, or
+            item block priority list sorted by position.
+
+        Returns
+        -------
+        textline : str
+            Text line for a protocol step.
+
+        """
+        actionName = workflow['Objects'][key]['Name']
+        actionParent = workflow['Objects'][key]['Subtype']
+
+        aKeys = [aKey for aKey in workflow['Objects'][key]['A In']]
+        bKeys = [bKey for bKey in workflow['Objects'][key]['B In']]
+        cKeys = [cKey for cKey in workflow['Objects'][key]['C In']]
+
+        numAIns = len(aKeys)
+        numBIns = len(bKeys)
+        numCIns = len(cKeys)
+
+        aKeys = self.sortListbyPriority(aKeys, priority)
+        bKeys = self.sortListbyPriority(bKeys, priority)
+        cKeys = self.sortListbyPriority(cKeys, priority)
+
+        itemA = self.getItemNouns(aKeys, workflow)
+        itemB = self.getItemNouns(bKeys, workflow)
+        itemC = self.getItemNouns(cKeys, workflow)
+
+        errorMsg = '**' + self.textconstlist[13] + '**'
+        def errorFunc(a, b, c): return errorMsg
+        try:
+            if actionParent == 'Add':
+                if numBIns == 0 or numAIns == 0:
+                    tempfunc = errorFunc
+                elif numBIns > 0 and numCIns == 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['00']
+                elif numBIns > 0 and numCIns > 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['01']
+
+            if actionParent == 'Remove':
+                if numBIns == 0 or numAIns == 0:
+                    tempfunc = errorFunc
+                elif numBIns > 0 and numCIns == 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['00']
+                elif numBIns > 0 and numCIns > 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['01']
+
+            if actionParent == 'Modify':
+                if numBIns == 0 and numCIns == 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['00']
+                elif numBIns > 0 and numCIns == 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['01']
+                elif numBIns > 0 and numCIns > 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['02']
+                elif numBIns == 0 and numCIns > 0:
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['03']
+                else:  # Special case function handling
+                    tempfunc = self.actionDict[
+                        actionName][self.lankey]['Func']['S']
+        except Exception as e:
+            logger.warning('Missing %s action phrase: %r', self.lankey, e)
+            tempfunc = errorFunc
+
+        textline = tempfunc(itemA, itemB, itemC)
+        return textline
+
+    def sortListbyPriority(self, keys, priority):
+        """
+        Sort item keys by positional priority.
+
+        Parameters
+        ----------
+        keys : list
+            Item block identifiers to sort.
+        priority : dict or list
+            Item block positional ranks from Section.getItemPriorityRanks, or
+            item block priority list sorted by position.
+
+        Returns
+        -------
+        newKeys : list
+            Keys found in priority without duplicates, in positional order.
+
+        """
+        if not isinstance(priority, dict):
+            priority = {key: ii for ii, key in enumerate(priority)}
+        newKeys = [key for key in set(keys) if key in priority]
+        newKeys.sort(key=priority.__getitem__)
+        return newKeys
+
+    def getTooltipLine(self, workflow, key, itemRanks=None):
+        """
+        Return protocol step text for an action block tooltip.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow or section entry data dictionary.
+        key : str
+            Action block identifier.
+        itemRanks : dict, optional
+            Item block positional ranks from Section.getItemPriorityRanks. The
+            default is None, which looks up the ranks of the workflow.
+
+        Returns
+        -------
+        textline : str
+            Protocol step for the specified action. Empty if the action has
+            no connections and is not a special case action.
+
+        """
+        if itemRanks is None:
+            itemRanks = Section(workflow).getItemPriorityRanks()
+        textline = self.generateTextLine(workflow, key, itemRanks)
+        block = workflow['Objects'][key]
+        if block['A In'] == [] and block['B In'] == [] and block['C In'] == []:
+            speciallist = ['Wait']
+            if workflow['Objects'][key]['Name'] not in speciallist:
+                textline = ''
+        return textline
+
+
+def renderLanguages(workflow, lankeys, fmt='text', writers=None,
+                    section=None):
+    """
+    Render protocols of a workflow in several languages in this process.
+
+    One data wrapper is shared by the writers of all languages, so
+    positional priority lists are sorted once and block versions are read
+    once. Only translation and formatting run once per language.
+
+    Parameters
+    ----------
+    workflow : dict
+        Workflow data dictionary.
+    lankeys : list
+        Language keys of the protocols.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Output format. The default is 'text'.
+    writers : dict, optional
+        ProtocolWriter objects by language key. Missing writers are added.
+        The default is None, which uses new writers.
+    section : Section, optional
+        Data wrapper of the workflow. Passing the same wrapper and writers
+        between calls carries cached fragments over. The default is None,
+        which wraps the workflow for this call only.
+
+    Returns
+    -------
+    protocols : dict
+        Protocols by language key.
+
+    """
+    if writers is None:
+        writers = {}
+    if section is None:
+        section = Section(workflow)
+    protocols = {}
+    for lankey in lankeys:
+        if lankey not in writers:
+            writers[lankey] = ProtocolWriter(lankey=lankey)
+        emitter = writers[lankey].emitWorkflow(workflow, section=section)
+        protocols[lankey] = emitter.render(fmt)
+    return protocols
+
+
+def renderProtocols(workflow, lankeys, fmt='text', workers=1):
+    """
+    Render protocols of a workflow in several languages across processes.
+
+    Languages are split into one group per worker process. Each worker
+    traverses the workflow once and formats every language of its group
+    through renderLanguages.
+
+    Parameters
+    ----------
+    workflow : dict
+        Workflow data dictionary.
+    lankeys : list
+        Language keys of the protocols.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Output format. The default is 'text'.
+    workers : int, optional
+        Number of worker processes. None uses the number of processors on
+        the machine. The default is 1, which renders in this process.
+
+    Returns
+    -------
+    protocols : dict
+        Protocols by language key, in the order of lankeys.
+
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(lankeys))
+    if workers <= 1:
+        return renderLanguages(workflow, lankeys, fmt)
+
+    groups = [lankeys[ii::workers] for ii in range(workers)]
+    protocols = {}
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=getBabelFish) as executor:
+        for groupProtocols in executor.map(
+                renderLanguages, [workflow]*workers, groups, [fmt]*workers):
+            protocols.update(groupProtocols)
+    return {lankey: protocols[lankey] for lankey in lankeys}
+
+
+exportFormats = {'.txt': 'text', '.md': 'markdown', '.html': 'html',
+                 '.htm': 'html'}
+
+
+def exportProtocol(workflow, outpath, lankey='en', fmt=None,
+                   bufferSize=1000):
+    """
+    Write the protocol of a workflow to a file while it is generated.
+
+    Fragments are rendered and written every bufferSize fragments, and the
+    writer keeps no fragment cache, so memory use does not grow with the
+    length of the protocol.
+
+    Parameters
+    ----------
+    workflow : dict
+        Workflow data dictionary.
+    outpath : str
+        Output file path.
+    lankey : str, optional
+        Language key of the protocol. The default is 'en'.
+    fmt : {'text', 'markdown', 'html'}, optional
+        Output format. The default is None, which selects the format from the
+        file extension, .txt, .md, .html, or .htm.
+    bufferSize : int, optional
+        Number of fragments buffered between writes. The default is 1000.
+
+    Returns
+    -------
+    outpath : str
+        Written file path.
+
+    """
+    if fmt is None:
+        extension = os.path.splitext(outpath)[1].lower()
+        if extension not in exportFormats:
+            raise ValueError('unknown protocol file extension: ' + extension)
+        fmt = exportFormats[extension]
+
+    writer = ProtocolWriter(lankey=lankey, cacheLimit=0)
+    with open(outpath, 'w', encoding='utf-8') as outfile:
+        emitter = ProtocolEmitter(outfile, fmt, bufferSize)
+        emitter.beginDocument(workflow.get('Name', ''))
+        writer.emitWorkflow(workflow, emitter)
+        emitter.endDocument()
+    return outpath
+
+
+class TooltipRenderer():
+    """
+    Protocol step text for action block tooltips, cached per block.
+
+    A step only depends on the action, the language, and the names and
+    positional order of the connected items. Each block identifier keeps the
+    text generated for its last combination of these, so blocks whose
+    connections did not change are not transcribed again.
+
+    """
+
+    def __init__(self):
+        self.writers = {}
+        self.steps = {}  # Format {<ID>: (<step key>, <text>)}
+
+    def getWriter(self, lankey):
+        """Return ProtocolWriter for language, creating it on first use."""
+        if lankey not in self.writers:
+            self.writers[lankey] = ProtocolWriter(lankey=lankey)
+        return self.writers[lankey]
+
+    def getStepKey(self, workflow, key, lankey, itemRanks):
+        """
+        Return tuple of all data the step text of an action depends on.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow or section entry data dictionary.
+        key : str
+            Action block identifier.
+        lankey : str
+            Language key of the step text.
+        itemRanks : dict
+            Item block positional ranks from Section.getItemPriorityRanks.
+
+        Returns
+        -------
+        stepKey : tuple
+            Language, action name and subtype, and for each connection type
+            the number of connections and the names of connected items in
+            positional order.
+
+        """
+        writer = self.getWriter(lankey)
+        block = workflow['Objects'][key]
+        stepKey = [lankey, block['Name'], block['Subtype']]
+        for connectionType in connectionTypes:
+            inKeys = block[connectionType + ' In']
+            sortedKeys = writer.sortListbyPriority(inKeys, itemRanks)
+            stepKey.append((len(inKeys), tuple(
+                workflow['Objects'][inKey]['Name'] for inKey in sortedKeys)))
+        return tuple(stepKey)
+
+    def getTooltipLine(self, workflow, key, lankey='en', itemRanks=None):
+        """
+        Return protocol step text for an action block tooltip.
+
+        Parameters
+        ----------
+        workflow : dict
+            Workflow or section entry data dictionary.
+        key : str
+            Action block identifier.
+        lankey : str, optional
+            Language key of the step text. The default is 'en'.
+        itemRanks : dict, optional
+            Item block positional ranks from Section.getItemPriorityRanks. The
+            default is None, which looks up the ranks of the workflow.
+
+        Returns
+        -------
+        textline : str
+            Protocol step for the specified action.
+
+        """
+        if itemRanks is None:
+            itemRanks = Section(workflow).getItemPriorityRanks()
+        stepKey = self.getStepKey(workflow, key, lankey, itemRanks)
+        cached = self.steps.get(key)
+        if cached is not None and cached[0] == stepKey:
+            return cached[1]
+        textline = self.getWriter(lankey).getTooltipLine(
+            workflow, key, itemRanks)
+        self.steps[key] = (stepKey, textline)
+        return textline
+
+    def clear(self):
+        """Remove all cached steps."""
+        self.steps = {}
@@ -0,0 +1,772 @@
+"""
+Cross-workflow parameter tables.
+
+Parameter names follow the rules of the interface 'Table' tab, so tables
+built or exported here line up with the rows shown in the interface.
+
+"""
+import csv
+import logging
+import os
+import re
+
+import numpy as np
+
+from uwl.fileio import loadjson
+from uwl.language import getBabelFish
+from uwl.naming import NameAllocator
+
+logger = logging.getLogger(__name__)
+
+
+class ParameterNames():
+    """
+    Generate table row names for workflow parameters.
+
+    Row names have the format [Section branch] > [Block name] > [Parameter
+    name] [Action modifier], translated to the selected language. Names are
+    unique within a single workflow.
+
+    Parameters
+    ----------
+    lankey : str, optional
+        Language key of the row names. The default is 'en'.
+
+    """
+
+    def __init__(self, lankey='en'):
+        self.lankey = lankey
+        self.babelFish = getBabelFish()
+        self.translatedNames = {}
+        self.actionModifiers = {}
+        self.entrynames = NameAllocator()
+
+    def iterTableEntries(self, entry):
+        """
+        Iterate through table parameter entries of a workflow.
+
+        Parameters
+        ----------
+        entry : dict
+            Work flow dictionary data.
+
+        Yields
+        ------
+        list
+            Parameter entry in the format [<table name>, <value>, <section
+            path>, <object identifier>, <parameter index>]. Table names are
+            unique within the workflow.
+
+        """
+        self.entrynames = NameAllocator()
+        yield from self.iterSectionTableEntries(section=entry)
+
+    def iterSectionTableEntries(self, section, prevSectName='',
+                                prevSectPath=[]):
+        """
+        Iterate through table parameter entries of a section.
+
+        Table names of parameters within the action and item blocks of the
+        section are built with associated relationship branching. If a section
+        within the current section is found, recursively iterate through the
+        nested section.
+
+        Parameters
+        ----------
+        section : dict
+            Work flow or section object containing action and / or item blocks.
+        prevSectName : str, optional
+            Name of previous section within section nesting. Section name
+            branches are labeled as [First Level] > [Second Level] > ... >
+            [Previous Level]. The default is ''.
+        prevSectPath : list, optional
+            List of previous section identifiers within the current section
+            branch path. The default is [].
+
+        Yields
+        ------
+        list
+            Parameter entry in the format described in iterTableEntries.
+
+        """
+        if section['Type'] == 'root':
+            sectName = ''
+        else:
+            sectName = prevSectName + section['Name'] + ' > '
+
+        for objKey in section['Objects'].keys():
+            block = section['Objects'][objKey]
+            if block['Type'] in ['Action', 'Item']:
+                blockName = self.getTranslatedName(
+                    block['Type'], block['Name']) + ' > '
+                if block['Type'] == 'Action':
+                    actionMod = self.getActionModifier(section, block)
+                else:
+                    actionMod = ''
+
+                for ii, param in enumerate(block['Parameters']):
+                    param = self.getTranslatedName(
+                        block['Type'] + ' Parameter', param)
+                    entryName = sectName + blockName + param + actionMod
+                    entryName = self.fixEntryNameDuplicates(entryName)
+                    yield [entryName, block['Values'][ii], prevSectPath,
+                           objKey, ii]
+
+            elif block['Type'] == 'Section':
+                sectPath = prevSectPath.copy()
+                sectPath.append(block['ID'])
+                yield from self.iterSectionTableEntries(
+                    section=block, prevSectName=sectName,
+                    prevSectPath=sectPath)
+
+    def getTranslatedName(self, nameType, name):
+        """
+        Return translated block or parameter name.
+
+        Translations are cached by language, so each name is only looked up
+        once. Names without a translation are returned unchanged.
+
+        Parameters
+        ----------
+        nameType : str
+            Translation dictionary type, such as 'Action' or 'Item Parameter'.
+        name : str
+            Block or parameter name.
+
+        Returns
+        -------
+        str
+            Translated name.
+
+        """
+        key = (self.lankey, nameType, name)
+        if key not in self.translatedNames:
+            try:
+                translatedName = self.babelFish[
+                    nameType][name][self.lankey]['Name']
+            except Exception as e:
+                logger.warning('Missing %s name translation: %r',
+                               self.lankey, e)
+                translatedName = name
+            self.translatedNames[key] = translatedName
+        return self.translatedNames[key]
+
+    def getActionModifier(self, section, block):
+        """
+        Return descriptive text for an action block.
+
+        Action block modifier text is used to add context to an action block
+        parameter. In most cases, action block names are not unique, so the
+        modifier text will display next to the name to add specificity. For
+        example:
+            Add > Mass [Potassium chloride to beaker]
+
+        Modifiers are cached by language, subtype, and connected item names,
+        so cached text is replaced whenever connections or item names change.
+
+        Parameters
+        ----------
+        section : dict
+            Work flow or section dictionary data.
+        block : dict
+            Dictionary data for an action block object.
+
+        Returns
+        -------
+        actionMod : str
+            Descriptive text to add context to action block parameters.
+
+        """
+        try:
+            subtype = block['Subtype']
+            if subtype not in ['Add', 'Remove', 'Modify']:
+                return ''
+            ABlockName = self.getConnectionBlockName(section, block, 'A')
+            BBlockName = ''
+            if subtype != 'Modify':
+                BBlockName = self.getConnectionBlockName(section, block, 'B')
+        except Exception as e:
+            logger.warning('Action modifier failed: %r', e)
+            return ''
+
+        key = (self.lankey, subtype, ABlockName, BBlockName)
+        if key not in self.actionModifiers:
+            self.actionModifiers[key] = self.formatActionModifier(
+                subtype, ABlockName, BBlockName)
+        return self.actionModifiers[key]
+
+    def formatActionModifier(self, subtype, ABlockName, BBlockName):
+        """
+        Return action modifier text from connected item block names.
+
+        Parameters
+        ----------
+        subtype : {'Add', 'Remove', 'Modify'}
+            Action block subtype.
+        ABlockName : str
+            Name(s) of A-type connected item blocks.
+        BBlockName : str
+            Name(s) of B-type connected item blocks. Not used for 'Modify'.
+
+        Returns
+        -------
+        actionMod : str
+            Translated action modifier text.
+
+        """
+        try:
+            ABlockName = self.babelFish['Item'][ABlockName][self.lankey]['Name']
+            if subtype != 'Modify':
+                BBlockName = self.babelFish[
+                    'Item'][BBlockName][self.lankey]['Name']
+        except Exception as e:
+            logger.warning('Missing %s modifier translation: %r',
+                           self.lankey, e)
+
+        if subtype == 'Add':
+            actionMod = ' [' + BBlockName + ' to ' + ABlockName + '] '
+        elif subtype == 'Remove':
+            actionMod = ' [' + BBlockName + ' from ' + ABlockName + '] '
+        else:
+            actionMod = ' [' + ABlockName + '] '
+        return actionMod
+
+    def getConnectionBlockName(self, section, block, connectionType):
+        """
+        Return name of item block(s) connected to an action block.
+
+        Parameters
+        ----------
+        section : dict
+            Work flow or section dictionary data.
+        block : dict
+            Action block used to search for connections.
+        connectionType : {'A','B','C'}
+            Connection type to search from.
+
+        Returns
+        -------
+        blockName : str
+            Name(s) of item blocks connected to the action block through the
+            specified type. Multiple items are separated in the string through
+            the delimiter '/'.
+
+        """
+        inLabel = connectionType + ' In'
+        inKeys = block[inLabel]
+        blockName = ''
+        for inKey in inKeys:
+            blockName += section['Objects'][inKey]['Name'] + '/'
+        if blockName != '':
+            blockName = blockName[:-1]
+        return blockName
+
+    def fixEntryNameDuplicates(self, tempname):
+        """
+        Modify parameter name to ensure it has not been duplicated.
+
+        Compare the entered parameter name with the names already issued for
+        the current workflow, and if a duplicate exists, add a modifier text
+        string with the format (1), (2), ... ([N]) corresponding to duplicate
+        1, duplicate 2, to duplicate [N] respectively. Names are allocated
+        through the shared uwl.NameAllocator counters.
+
+        Parameters
+        ----------
+        tempname : str
+            Original parameter name.
+
+        Returns
+        -------
+        tempname : str
+            Modified unique parameter name.
+
+        """
+        return self.entrynames.getUniqueName(tempname)
+
+
+valuePattern = re.compile(
+    r'^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+    r'\s*([A-Za-z%°µμ]\S*)?\s*$')
+
+
+def parseValue(value):
+    """
+    Split parameter value string into magnitude and unit.
+
+    Parameters
+    ----------
+    value : str
+        Parameter value, such as '6.8 g', '28%', or '1.5 C/min'.
+
+    Returns
+    -------
+    magnitude : float
+        Numeric value. NaN if the value does not start with a number followed
+        by at most a single unit word starting with a letter, %, or °.
+        Numbers with thousands or decimal commas, such as '1,000', are not
+        numeric.
+    unit : str
+        Unit text, '' for unitless numbers, or None if the value is not
+        numeric.
+
+    """
+    match = valuePattern.match(str(value))
+    if match is None:
+        return np.nan, None
+    unit = match.group(2)
+    if unit is None:
+        unit = ''
+    return float(match.group(1)), unit
+
+
+class ParameterStore():
+    """
+    Columnar store of parameter values across workflows.
+
+    Rows are table parameter names and columns are workflows. Values are
+    split into float magnitudes and integer unit codes, so parameters can be
+    compared, filtered, and aggregated across workflows with array
+    operations.
+
+    Workflows are added with addWorkflow and converted to arrays together
+    with build, or loaded in one step with fromWorkflows or fromFiles.
+
+    Parameters
+    ----------
+    lankey : str, optional
+        Language key of the row names. The default is 'en'.
+
+    Attributes
+    ----------
+    rowNames : list
+        Parameter names of rows.
+    colNames : list
+        Workflow names of columns.
+    values : numpy.ndarray
+        Raw parameter values. None where a workflow lacks the parameter.
+    magnitudes : numpy.ndarray
+        Float magnitudes. NaN where values are missing or not numeric.
+    unitCodes : numpy.ndarray
+        Index of value units in the units list. -1 where values are missing
+        or not numeric.
+    units : list
+        Unit strings in order of unit code. Unitless numbers have unit ''.
+
+    """
+
+    def __init__(self, lankey='en'):
+        self.lankey = lankey
+        self.parameterNames = ParameterNames(lankey=lankey)
+        self.rowNames = []
+        self.rowIndex = {}
+        self.colNames = []
+        self.units = []
+        self.unitIndex = {}
+        self.parsedValues = {}
+        self.pendingColumns = []
+
+        self.values = np.empty((0, 0), dtype=object)
+        self.magnitudes = np.empty((0, 0))
+        self.unitCodes = np.empty((0, 0), dtype=np.int32)
+
+    @classmethod
+    def fromWorkflows(cls, workflows, lankey='en'):
+        """
+        Build store from workflow data.
+
+        Parameters
+        ----------
+        workflows : dict
+            Workflow data dictionaries by workflow name.
+        lankey : str, optional
+            Language key of the row names. The default is 'en'.
+
+        Returns
+        -------
+        store : ParameterStore
+            Built parameter store.
+
+        """
+        store = cls(lankey=lankey)
+        for name, workflow in workflows.items():
+            store.addWorkflow(name, workflow)
+        store.build()
+        return store
+
+    @classmethod
+    def fromFiles(cls, filepaths, lankey='en'):
+        """
+        Build store from workflow .json files.
+
+        Columns are named after the file names without extension.
+
+        """
+        store = cls(lankey=lankey)
+        for filepath in filepaths:
+            store.addWorkflow(getWorkflowName(filepath), loadjson(filepath))
+        store.build()
+        return store
+
+    def addWorkflow(self, name, workflow):
+        """
+        Add workflow parameters as a new column.
+
+        Values are kept aside until build is called, so workflows can be added
+        one at a time without resizing arrays.
+
+        Parameters
+        ----------
+        name : str
+            Column name of the workflow.
+        workflow : dict
+            Workflow data dictionary.
+
+        """
+        column = {}
+        for [entryName, value, sectPath, objKey, ii
+             ] in self.parameterNames.iterTableEntries(workflow):
+            iRow = self.rowIndex.get(entryName)
+            if iRow is None:
+                iRow = len(self.rowNames)
+                self.rowIndex[entryName] = iRow
+                self.rowNames.append(entryName)
+            column[iRow] = value
+        self.colNames.append(name)
+        self.pendingColumns.append(column)
+
+    def build(self):
+        """Convert all added workflow columns into value arrays."""
+        nRows = len(self.rowNames)
+        nCols = len(self.colNames)
+        values = np.full((nRows, nCols), None, dtype=object)
+        magnitudes = np.full((nRows, nCols), np.nan)
+        unitCodes = np.full((nRows, nCols), -1, dtype=np.int32)
+
+        builtRows, builtCols = self.values.shape
+        values[:builtRows, :builtCols] = self.values
+        magnitudes[:builtRows, :builtCols] = self.magnitudes
+        unitCodes[:builtRows, :builtCols] = self.unitCodes
+
+        for col, column in enumerate(self.pendingColumns, start=builtCols):
+            for iRow, value in column.items():
+                values[iRow, col] = value
+                magnitudes[iRow, col], unitCodes[iRow, col] = \
+                    self.parseValue(value)
+
+        self.values = values
+        self.magnitudes = magnitudes
+        self.unitCodes = unitCodes
+        self.pendingColumns = []
+
+    def parseValue(self, value):
+        """Return magnitude and unit code of a value, parsing each once."""
+        if value not in self.parsedValues:
+            magnitude, unit = parseValue(value)
+            unitCode = -1
+            if unit is not None:
+                if unit not in self.unitIndex:
+                    self.unitIndex[unit] = len(self.units)
+                    self.units.append(unit)
+                unitCode = self.unitIndex[unit]
+            self.parsedValues[value] = (magnitude, unitCode)
+        return self.parsedValues[value]
+
+    def getUnitCode(self, unit):
+        """Return code of a unit string, or -1 if no value uses the unit."""
+        return self.unitIndex.get(unit, -1)
+
+    def getMagnitudes(self, rowName, unit=None):
+        """
+        Return magnitudes of a parameter across all workflows.
+
+        Parameters
+        ----------
+        rowName : str
+            Parameter row name.
+        unit : str, optional
+            Only keep values with this unit. The default is None, which keeps
+            all numeric values.
+
+        Returns
+        -------
+        magnitudes : numpy.ndarray
+            Magnitude for each workflow column. NaN where the value is
+            missing, not numeric, or has a different unit.
+
+        """
+        iRow = self.rowIndex[rowName]
+        magnitudes = self.magnitudes[iRow].copy()
+        if unit is not None:
+            magnitudes[self.unitCodes[iRow] != self.getUnitCode(unit)] = np.nan
+        return magnitudes
+
+    def rangeQuery(self, rowName, low=None, high=None, unit=None):
+        """
+        Return mask of workflows with a parameter inside a value range.
+
+        Parameters
+        ----------
+        rowName : str
+            Parameter row name.
+        low : float, optional
+            Inclusive lower bound. The default is None for no bound.
+        high : float, optional
+            Inclusive upper bound. The default is None for no bound.
+        unit : str, optional
+            Only match values with this unit. The default is None.
+
+        Returns
+        -------
+        mask : numpy.ndarray
+            Boolean mask over workflow columns.
+
+        """
+        magnitudes = self.getMagnitudes(rowName, unit=unit)
+        mask = ~np.isnan(magnitudes)
+        if low is not None:
+            mask &= magnitudes >= low
+        if high is not None:
+            mask &= magnitudes <= high
+        return mask
+
+    def getWorkflowNames(self, mask):
+        """Return names of workflow columns selected by a boolean mask."""
+        return [name for name, selected in zip(self.colNames, mask)
+                if selected]
+
+    def summarize(self, unit=None):
+        """
+        Return count, minimum, maximum, and mean of every parameter.
+
+        Parameters
+        ----------
+        unit : str, optional
+            Only include values with this unit. The default is None, which
+            includes all numeric values.
+
+        Returns
+        -------
+        summary : dict
+            Arrays over rows with keys 'count', 'min', 'max', and 'mean'.
+            Statistics of rows without numeric values are NaN.
+
+        """
+        valid = ~np.isnan(self.magnitudes)
+        if unit is not None:
+            valid &= self.unitCodes == self.getUnitCode(unit)
+        count = valid.sum(axis=1)
+        empty = count == 0
+
+        total = np.where(valid, self.magnitudes, 0.0).sum(axis=1)
+        mean = np.full(len(count), np.nan)
+        np.divide(total, count, out=mean, where=~empty)
+        minimum = np.where(valid, self.magnitudes, np.inf).min(
+            axis=1, initial=np.inf)
+        maximum = np.where(valid, self.magnitudes, -np.inf).max(
+            axis=1, initial=-np.inf)
+        minimum[empty] = np.nan
+        maximum[empty] = np.nan
+        return {'count': count, 'min': minimum, 'max': maximum, 'mean': mean}
+
+
+def getWorkflowName(filepath):
+    """Return workflow table name of a .json file: the file name."""
+    return os.path.splitext(os.path.basename(filepath))[0]
+
+
+def iterWorkflowParameters(filepaths, lankey='en'):
+    """
+    Load workflow files one at a time and iterate through their parameters.
+
+    Files which cannot be loaded are reported and skipped.
+
+    Parameters
+    ----------
+    filepaths : list
+        Workflow .json file paths.
+    lankey : str, optional
+        Language key of the row names. The default is 'en'.
+
+    Yields
+    ------
+    name : str
+        Workflow name.
+    parameters : list
+        Parameters in the format [<table name>, <value>], in table order.
+
+    """
+    parameterNames = ParameterNames(lankey=lankey)
+    for filepath in filepaths:
+        try:
+            workflow = loadjson(filepath)
+        except Exception as e:
+            logger.warning('%s: %r', filepath, e)
+            continue
+        parameters = [[entryName, value] for [entryName, value, sectPath,
+                                              objKey, ii] in
+                      parameterNames.iterTableEntries(workflow)]
+        yield getWorkflowName(filepath), parameters
+
+
+def iterTableChunks(filepaths, lankey='en', layout='wide', chunksize=500):
+    """
+    Iterate through the cross-workflow table in chunks of workflows.
+
+    Only one chunk of workflows is held in memory at a time. The 'wide'
+    layout holds one row per workflow and one column per parameter, using
+    the row names of the interface 'Table' tab as column names. As parameter
+    columns are only known after all workflows are read, the wide layout
+    reads the files twice. The 'long' layout holds one row per workflow
+    parameter and reads the files once.
+
+    Parameters
+    ----------
+    filepaths : list
+        Workflow .json file paths.
+    lankey : str, optional
+        Language key of the parameter names. The default is 'en'.
+    layout : {'wide', 'long'}, optional
+        Table layout. The default is 'wide'.
+    chunksize : int, optional
+        Number of workflows per chunk. The default is 500.
+
+    Yields
+    ------
+    columns : list
+        Column names. The same for every chunk.
+    rows : list
+        Row value lists of the chunk. Missing values are None.
+
+    """
+    if layout == 'wide':
+        rowIndex = {}
+        for name, parameters in iterWorkflowParameters(filepaths, lankey):
+            for entryName, value in parameters:
+                if entryName not in rowIndex:
+                    rowIndex[entryName] = len(rowIndex)
+        columns = ['Workflow'] + [entryName for entryName in rowIndex]
+    elif layout == 'long':
+        columns = ['Workflow', 'Parameter', 'Value', 'Magnitude', 'Unit']
+    else:
+        raise ValueError('unknown table layout: ' + str(layout))
+
+    rows = []
+    nWorkflows = 0
+    for name, parameters in iterWorkflowParameters(filepaths, lankey):
+        if layout == 'wide':
+            row = [None for column in columns]
+            row[0] = name
+            for entryName, value in parameters:
+                row[rowIndex[entryName] + 1] = value
+            rows.append(row)
+        else:
+            for entryName, value in parameters:
+                magnitude, unit = parseValue(value)
+                rows.append([name, entryName, value, magnitude, unit])
+
+        nWorkflows += 1
+        if nWorkflows == chunksize:
+            yield columns, rows
+            rows = []
+            nWorkflows = 0
+
+    if nWorkflows > 0 or rows != []:
+        yield columns, rows
+
+
+def formatCSVValue(value):
+    """Return value for a .csv cell. Missing values are left empty."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ''
+    return value
+
+
+def writeTableCSV(chunks, outpath):
+    """Write table chunks to a .csv file. Return number of rows written."""
+    nRows = 0
+    with open(outpath, 'w', encoding='utf-8', newline='') as outfile:
+        writer = csv.writer(outfile)
+        header = False
+        for columns, rows in chunks:
+            if not header:
+                writer.writerow(columns)
+                header = True
+            writer.writerows([[formatCSVValue(value) for value in row]
+                              for row in rows])
+            nRows += len(rows)
+    return nRows
+
+
+def writeTableParquet(chunks, outpath):
+    """
+    Write table chunks to a .parquet file. Return number of rows written.
+
+    Requires the pyarrow package. Each chunk is written as a row group.
+
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError('Parquet export requires the pyarrow package.')
+
+    nRows = 0
+    writer = None
+    try:
+        for columns, rows in chunks:
+            if writer is None:
+                schema = pyarrow.schema(
+                    [pyarrow.field(column, pyarrow.float64())
+                     if column == 'Magnitude' else
+                     pyarrow.field(column, pyarrow.string())
+                     for column in columns])
+                writer = pyarrow.parquet.ParquetWriter(outpath, schema)
+            data = {}
+            for ii, column in enumerate(columns):
+                if column == 'Magnitude':
+                    data[column] = [row[ii] for row in rows]
+                else:
+                    data[column] = [None if row[ii] is None else str(row[ii])
+                                    for row in rows]
+            writer.write_table(
+                pyarrow.Table.from_pydict(data, schema=schema))
+            nRows += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+    return nRows
+
+
+def exportTable(filepaths, outpath, lankey='en', layout='wide',
+                chunksize=500):
+    """
+    Stream the cross-workflow parameter table of workflow files to disk.
+
+    Parameters
+    ----------
+    filepaths : list
+        Workflow .json file paths.
+    outpath : str
+        Output file path ending in .csv or .parquet.
+    lankey : str, optional
+        Language key of the parameter names. The default is 'en'.
+    layout : {'wide', 'long'}, optional
+        Table layout, as described in iterTableChunks. The default is 'wide'.
+    chunksize : int, optional
+        Number of workflows held in memory at a time. The default is 500.
+
+    Returns
+    -------
+    nRows : int
+        Number of table rows written.
+
+    """
+    chunks = iterTableChunks(filepaths, lankey=lankey, layout=layout,
+                             chunksize=chunksize)
+    extension = os.path.splitext(outpath)[1].lower()
+    if extension == '.csv':
+        return writeTableCSV(chunks, outpath)
+    elif extension == '.parquet':
+        return writeTableParquet(chunks, outpath)
+    raise ValueError('unsupported table file type: ' + extension)
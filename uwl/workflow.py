@@ -0,0 +1,884 @@
+"""
+Workflow, section, and block data model.
+
+Classes wrap the dictionaries read and written by loadjson and savejson so
+workflow logic can run without a graphical interface. Wrappers do not copy
+data; all changes are made directly to the wrapped dictionaries.
+
+"""
+import copy
+import itertools
+import os
+
+from uwl.fileio import loadjson, savejson
+from uwl.priority import PriorityOrder
+
+
+connectionTypes = ['A', 'B', 'C']
+versionCounter = itertools.count(1)
+
+
+def newVersion():
+    """Return a data version number not used before in this session."""
+    return next(versionCounter)
+
+
+class Block():
+    """Action or item block data wrapper."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def getConnectionKeys(self, connectionType):
+        """
+        Return identifiers of blocks connected through a connection type.
+
+        Parameters
+        ----------
+        connectionType : {'A','B','C'}
+            Connection type to search.
+
+        Returns
+        -------
+        keys : list
+            Connected block identifiers. Empty for item blocks.
+
+        """
+        if self.data['Type'] != 'Action':
+            return []
+        return self.data[connectionType + ' In']
+
+    def getAllConnectionKeys(self):
+        """Return identifiers of blocks connected through any type."""
+        keys = []
+        for connectionType in connectionTypes:
+            keys += self.getConnectionKeys(connectionType)
+        return keys
+
+    def addConnection(self, key, connectionType, index=None):
+        """
+        Connect block identifier to action through connection type.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the connected block.
+        connectionType : {'A','B','C'}
+            Connection type.
+        index : int, optional
+            Position of the connection in the connection list. The default
+            is None, which adds the connection at the end.
+
+        """
+        inKeys = self.data[connectionType + ' In']
+        if index is None:
+            inKeys.append(key)
+        else:
+            inKeys.insert(index, key)
+
+    def removeConnection(self, key):
+        """
+        Remove first connection to block identifier.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the connected block.
+
+        Returns
+        -------
+        connectionType : {'A','B','C'} or None
+            Type of the removed connection. None if no connection was found.
+
+        """
+        for connectionType in connectionTypes:
+            if key in self.getConnectionKeys(connectionType):
+                self.data[connectionType + ' In'].remove(key)
+                return connectionType
+        return None
+
+
+class EdgeIndex():
+    """
+    Forward and reverse connection index for blocks in one section.
+
+    forward maps action identifiers to the item identifiers connected to
+    them, and reverse maps item identifiers to the actions they connect to.
+    Both are split by connection type, e.g. forward[<action>]['A'] is the set
+    of items listed in the action's 'A In' data.
+
+    """
+
+    def __init__(self, data=None):
+        self.forward = {}
+        self.reverse = {}
+        if data is None:
+            return
+        for key in data['Objects'].keys():
+            self.addBlock(key, data['Objects'][key])
+
+    def addBlock(self, key, block):
+        """Add all connections listed in block data to the index."""
+        if block['Type'] != 'Action':
+            return
+        for connectionType in connectionTypes:
+            for inKey in block[connectionType + ' In']:
+                self.add(inKey, key, connectionType)
+
+    def removeDestination(self, destKey):
+        """Remove all connections to a destination action from the index."""
+        for edgeType, sourceKeys in self.forward.pop(destKey, {}).items():
+            for sourceKey in sourceKeys:
+                self.reverse.get(sourceKey, {}).get(
+                    edgeType, set()).discard(destKey)
+
+    def remap(self, keyMap):
+        """
+        Rename block identifiers in the index.
+
+        Connections to blocks missing from keyMap are removed, matching
+        Section.swapKeys.
+
+        """
+        forward = self.forward
+        self.forward = {}
+        self.reverse = {}
+        for destKey, edges in forward.items():
+            if destKey not in keyMap:
+                continue
+            for edgeType, sourceKeys in edges.items():
+                for sourceKey in sourceKeys:
+                    if sourceKey in keyMap:
+                        self.add(keyMap[sourceKey], keyMap[destKey], edgeType)
+
+    def add(self, sourceKey, destKey, edgeType):
+        """Add connection from source block to destination action."""
+        self.forward.setdefault(destKey, {}).setdefault(
+            edgeType, set()).add(sourceKey)
+        self.reverse.setdefault(sourceKey, {}).setdefault(
+            edgeType, set()).add(destKey)
+
+    def remove(self, sourceKey, destKey, edgeType):
+        """Remove connection from source block to destination action."""
+        self.forward.get(destKey, {}).get(edgeType, set()).discard(sourceKey)
+        self.reverse.get(sourceKey, {}).get(edgeType, set()).discard(destKey)
+
+    def getEdgeType(self, sourceKey, destKey):
+        """
+        Return type of the connection between two blocks.
+
+        Parameters
+        ----------
+        sourceKey : str
+            Item block identifier.
+        destKey : str
+            Action block identifier.
+
+        Returns
+        -------
+        edgeType : {'A','B','C'} or None
+            First connection type, in A, B, C order, listing the source in
+            the destination action. None if the blocks are not connected.
+
+        """
+        destKeys = self.reverse.get(sourceKey, {})
+        for connectionType in connectionTypes:
+            if destKey in destKeys.get(connectionType, ()):
+                return connectionType
+        return None
+
+    def getDestinationKeys(self, sourceKey):
+        """Return set of action identifiers the source block connects to."""
+        destKeys = set()
+        for keys in self.reverse.get(sourceKey, {}).values():
+            destKeys |= keys
+        return destKeys
+
+    def getSourceKeys(self, destKey):
+        """Return set of block identifiers connected to an action."""
+        sourceKeys = set()
+        for keys in self.forward.get(destKey, {}).values():
+            sourceKeys |= keys
+        return sourceKeys
+
+
+class Section():
+    """
+    Workflow section data wrapper containing nested blocks.
+
+    Connection queries go through an EdgeIndex built on first use and kept
+    up to date by the block and edge methods of the wrapper. Wrappers of
+    nested sections are kept by their parent wrapper, so a wrapper held
+    between edits keeps one index per section. Block and connection data
+    should only be changed through the wrapper while it is in use.
+
+    The version attribute changes whenever a wrapper method changes the
+    section data, and changes to nested sections are passed on to the
+    wrapper holding the section. Each block also has a version, returned by
+    getBlockVersion, which only changes with the block. The layoutVersion
+    attribute only changes with block positions, identifiers, and types,
+    and keeps the positional priority order cached. Data changed outside
+    the wrapper, such as block positions dragged in the graphics scene, is
+    reported through markChanged.
+
+    Parameters
+    ----------
+    data : dict
+        Workflow entry or section data dictionary.
+    parent : Section, optional
+        Wrapper of the section holding this section. The default is None.
+
+    """
+
+    def __init__(self, data, parent=None):
+        self.data = data
+        self.parent = parent
+        self.edgeIndex = None
+        self.sections = {}  # Nested section wrappers by block identifier
+        self.version = newVersion()
+        self.layoutVersion = self.version
+        self.blockVersions = {}
+        self.priorityOrder = PriorityOrder()
+
+    def markChanged(self, keys=None, layout=True):
+        """
+        Give section and the sections holding it a new data version.
+
+        Parameters
+        ----------
+        keys : list, optional
+            Identifiers of the changed blocks, which get new block versions.
+            The default is None, which gives every block a new version.
+        layout : bool, optional
+            False if no block position, identifier, or type changed, which
+            keeps the positional priority order. The default is True.
+
+        """
+        self.version = newVersion()
+        if keys is None:
+            self.blockVersions = {}
+        else:
+            for key in keys:
+                self.blockVersions[key] = self.version
+        if layout:
+            self.layoutVersion = self.version
+        parent = self.parent
+        if parent is not None and parent.sections.get(
+                self.data.get('ID')) is self:
+            parent.markChanged([self.data['ID']], layout=False)
+
+    def getBlockVersion(self, key):
+        """
+        Return data version of a block in the section.
+
+        Versions are drawn from the same counter as section versions, so a
+        version identifies a single state of a single block.
+
+        """
+        version = self.blockVersions.get(key)
+        if version is None:
+            version = newVersion()
+            self.blockVersions[key] = version
+        return version
+
+    def getEdgeIndex(self):
+        """Return connection index for section, building it if needed."""
+        if self.edgeIndex is None:
+            self.edgeIndex = EdgeIndex(self.data)
+        return self.edgeIndex
+
+    def getBlock(self, key):
+        """Return Block or Section wrapper for object identifier."""
+        blockData = self.data['Objects'][key]
+        if blockData['Type'] == 'Section':
+            return self.getSection(key)
+        return Block(blockData)
+
+    def getSection(self, key):
+        """Return kept wrapper of a nested section, creating it if needed."""
+        blockData = self.data['Objects'][key]
+        section = self.sections.get(key)
+        if section is None or section.data is not blockData:
+            section = Section(blockData, parent=self)
+            self.sections[key] = section
+        return section
+
+    def findSection(self, data):
+        """
+        Return wrapper of section data in this section or nested sections.
+
+        Parameters
+        ----------
+        data : dict
+            Section data dictionary to search for.
+
+        Returns
+        -------
+        section : Section or None
+            Kept wrapper of the section data. None if it is not nested in
+            this section.
+
+        """
+        if data is self.data:
+            return self
+        for section in self.getSections():
+            found = section.findSection(data)
+            if found is not None:
+                return found
+        return None
+
+    def getBlockKeys(self):
+        """Return identifiers for all objects in section."""
+        return [key for key in self.data['Objects'].keys()]
+
+    def getSections(self):
+        """Return Section wrappers for all sections nested one level down."""
+        sections = []
+        for key in self.data['Objects'].keys():
+            if self.data['Objects'][key]['Type'] == 'Section':
+                sections.append(self.getSection(key))
+        return sections
+
+    def getNewBlockKey(self):
+        """Return next unused block identifier in section."""
+        objectKeys = [round(float(key)) for key in self.data['Objects']]
+        if objectKeys == []:
+            return str(0)
+        return str(max(objectKeys) + 1)
+
+    def addBlock(self, blockData):
+        """
+        Add or replace block data under its identifier.
+
+        Connections listed in the block data replace the connections of the
+        replaced block. Connections from other actions to the identifier are
+        kept.
+
+        """
+        key = blockData['ID']
+        oldData = self.data['Objects'].get(key)
+        if self.edgeIndex is not None:
+            self.edgeIndex.removeDestination(key)
+            self.edgeIndex.addBlock(key, blockData)
+        self.data['Objects'][key] = blockData
+        self.sections.pop(key, None)
+        if oldData is None or oldData != blockData:
+            self.markChanged([key], layout=oldData is None or any(
+                oldData.get(feature) != blockData.get(feature)
+                for feature in ['position', 'Type']))
+
+    def insertBlocks(self, blocks, indices):
+        """
+        Add blocks with new identifiers at positions in the section order.
+
+        Parameters
+        ----------
+        blocks : list
+            Block data dictionaries to add. Their 'ID' values are replaced.
+        indices : list
+            Index of each block in the section objects dictionary after the
+            insertion.
+
+        """
+        objects = self.data['Objects']
+        newKey = int(self.getNewBlockKey())
+        items = [item for item in objects.items()]
+        for ii, block in sorted(zip(indices, blocks), key=lambda x: x[0]):
+            block['ID'] = str(newKey)
+            newKey += 1
+            items.insert(ii, (block['ID'], block))
+            if self.edgeIndex is not None:
+                self.edgeIndex.addBlock(block['ID'], block)
+        objects.clear()
+        objects.update(items)
+        if blocks != []:
+            self.markChanged([block['ID'] for block in blocks])
+
+    def removeBlock(self, key):
+        """
+        Remove block from section along with all edges connected to it.
+
+        Parameters
+        ----------
+        key : str
+            Identifier of the block to remove.
+
+        """
+        edgeIndex = self.getEdgeIndex()
+        changedKeys = []
+        for connectionType, destKeys in edgeIndex.reverse.pop(key, {}).items():
+            for destKey in destKeys:
+                inKeys = self.data['Objects'][destKey][connectionType + ' In']
+                inKeys[:] = [inKey for inKey in inKeys if inKey != key]
+                edgeIndex.forward[destKey][connectionType].discard(key)
+                changedKeys.append(destKey)
+        edgeIndex.removeDestination(key)
+        del self.data['Objects'][key]
+        self.sections.pop(key, None)
+        self.blockVersions.pop(key, None)
+        self.markChanged(changedKeys)
+
+    def setBlockPosition(self, key, position):
+        """
+        Set position of a block in the section.
+
+        Parameters
+        ----------
+        key : str
+            Block identifier.
+        position : list
+            New block position in the format [<x>, <y>].
+
+        Returns
+        -------
+        bool
+            True if the position changed.
+
+        """
+        block = self.data['Objects'][key]
+        changed = list(block['position']) != list(position)
+        block['position'] = list(position)
+        if changed:
+            self.markChanged([key])
+        return changed
+
+    def getPriorityList(self):
+        """
+        Return list of all block identifiers in position order.
+
+        Object positional priority is based on object feature 'postion':(x, y).
+        Priority is first given by horizontal position from left to right, then
+        by vertical postion, from top to bottom. Orders are cached until the
+        layout version changes.
+
+        Returns
+        -------
+        priority : list
+            List of block identifiers in position order.
+
+        """
+        return list(self.getPriorityOrder()[0])
+
+    def getItemActionPriorityLists(self):
+        """
+        Return item and action priority lists based on block positions.
+
+        Returns
+        -------
+        itemPriority : list
+            List of item block identifiers sorted by positional priority.
+        actionPriority : list
+            List of action and section block identifiers sorted by positional
+            priority.
+
+        """
+        priority, itemPriority, actionPriority, itemRanks = \
+            self.getPriorityOrder()
+        return list(itemPriority), list(actionPriority)
+
+    def getItemPriorityRanks(self):
+        """
+        Return item block positional ranks for sorting connected items.
+
+        Returns
+        -------
+        itemRanks : dict
+            Item block identifiers mapped to their index in the item priority
+            list. Shared with the priority cache and must not be changed.
+
+        """
+        return self.getPriorityOrder()[3]
+
+    def getPriorityOrder(self):
+        """Return cached priority lists, see PriorityOrder.getOrder."""
+        return self.priorityOrder.getOrder(self.data, self.layoutVersion)
+
+    def hasEdge(self, sourceKey, destKey, edgeType=None):
+        """
+        Return True if source block is connected to destination action.
+
+        Parameters
+        ----------
+        sourceKey : str
+            Item block identifier.
+        destKey : str
+            Action block identifier.
+        edgeType : {'A','B','C'}, optional
+            Connection type to check. The default is None, which checks all
+            types.
+
+        """
+        edgeIndex = self.getEdgeIndex()
+        if edgeType is None:
+            return edgeIndex.getEdgeType(sourceKey, destKey) is not None
+        destKeys = edgeIndex.reverse.get(sourceKey, {}).get(edgeType, ())
+        return destKey in destKeys
+
+    def getEdgePosition(self, sourceKey, destKey, edgeType):
+        """
+        Return position of a connection in the connection list of an action.
+
+        Returns
+        -------
+        index : int or None
+            Index of sourceKey in the edgeType connection list of the
+            destination action. None if the blocks are not connected through
+            edgeType.
+
+        """
+        if not self.hasEdge(sourceKey, destKey, edgeType):
+            return None
+        return self.data['Objects'][destKey][edgeType + ' In'].index(sourceKey)
+
+    def addEdge(self, sourceKey, destKey, edgeType, index=None):
+        """
+        Connect item block to action block through a connection type.
+
+        Parameters
+        ----------
+        sourceKey : str
+            Item block identifier.
+        destKey : str
+            Action block identifier.
+        edgeType : {'A','B','C'}
+            Connection type.
+        index : int, optional
+            Position of the connection in the connection list of the action.
+            The default is None, which adds the connection at the end.
+
+        Returns
+        -------
+        bool
+            True if the edge was added. False if it already existed.
+
+        """
+        if self.hasEdge(sourceKey, destKey, edgeType):
+            return False
+        self.getBlock(destKey).addConnection(sourceKey, edgeType, index)
+        self.getEdgeIndex().add(sourceKey, destKey, edgeType)
+        self.markChanged([destKey], layout=False)
+        return True
+
+    def removeEdge(self, sourceKey, destKey, edgeType=None):
+        """
+        Remove connection between source block and destination action.
+
+        Parameters
+        ----------
+        sourceKey : str
+            Item block identifier.
+        destKey : str
+            Action block identifier.
+        edgeType : {'A','B','C'}, optional
+            Connection type to remove. The default is None, which removes the
+            first connection found in A, B, C order.
+
+        Returns
+        -------
+        edgeType : {'A','B','C'} or None
+            Type of the removed connection. None if no connection was found.
+
+        """
+        edgeIndex = self.getEdgeIndex()
+        if edgeType is None:
+            edgeType = edgeIndex.getEdgeType(sourceKey, destKey)
+        elif not self.hasEdge(sourceKey, destKey, edgeType):
+            edgeType = None
+        if edgeType is None:
+            return None
+        inKeys = self.data['Objects'][destKey][edgeType + ' In']
+        inKeys.remove(sourceKey)
+        if sourceKey not in inKeys:
+            edgeIndex.remove(sourceKey, destKey, edgeType)
+        self.markChanged([destKey], layout=False)
+        return edgeType
+
+    def clearEdges(self):
+        """Remove all connections from action blocks in section."""
+        changed = False
+        for key in self.data['Objects'].keys():
+            if self.data['Objects'][key]['Type'] == 'Action':
+                for connectionType in connectionTypes:
+                    if self.data['Objects'][key][connectionType + ' In']:
+                        changed = True
+                    self.data['Objects'][key][connectionType + ' In'] = []
+        self.edgeIndex = EdgeIndex()
+        if changed:
+            self.markChanged(layout=False)
+
+    def removeDislocatedEdges(self):
+        """Delete all edges with missing source or destination block."""
+        edgeIndex = self.getEdgeIndex()
+        objects = self.data['Objects']
+        for destKey in [k for k in edgeIndex.forward if k not in objects]:
+            edgeIndex.removeDestination(destKey)
+        dislocated = [k for k in edgeIndex.reverse if k not in objects]
+        for sourceKey in dislocated:
+            for connectionType, destKeys in edgeIndex.reverse.pop(
+                    sourceKey).items():
+                for destKey in destKeys:
+                    inKeys = objects[destKey][connectionType + ' In']
+                    inKeys[:] = [k for k in inKeys if k != sourceKey]
+                    edgeIndex.forward[destKey][connectionType].discard(
+                        sourceKey)
+        if dislocated != []:
+            self.markChanged(layout=False)
+
+    def checkItemForConnections(self, checkkey):
+        """
+        Check if item block is connected to any action.
+
+        Parameters
+        ----------
+        checkkey : str
+            Identifier for the item block to check within section.
+
+        Returns
+        -------
+        bool
+            True if any action block lists the item in a connection. False
+            if no connections are found.
+
+        """
+        return len(self.getEdgeIndex().getDestinationKeys(checkkey)) > 0
+
+    def getConnectionBlockName(self, block, connectionType):
+        """
+        Return name of item block(s) connected to an action block.
+
+        Parameters
+        ----------
+        block : dict
+            Action block used to search for connections.
+        connectionType : {'A','B','C'}
+            Connection type to search from.
+
+        Returns
+        -------
+        blockName : str
+            Name(s) of item blocks connected to the action block through the
+            specified type. Multiple items are separated in the string through
+            the delimiter '/'.
+
+        """
+        inLabel = connectionType + ' In'
+        inKeys = block[inLabel]
+        blockName = ''
+        for inKey in inKeys:
+            blockName += self.data['Objects'][inKey]['Name'] + '/'
+        if blockName != '':
+            blockName = blockName[:-1]
+        return blockName
+
+    def writeLinkedData(self, linkData):
+        """
+        Overwrite all item blocks sharing the link ID of linkData.
+
+        Linked blocks keep their own identifier and position. Nested sections
+        are updated recursively.
+
+        Parameters
+        ----------
+        linkData : dict
+            Item block data to distribute to linked blocks.
+
+        Returns
+        -------
+        changes : list
+            Replaced blocks in the format [<section data>, <old block data>,
+            <new block data>].
+
+        """
+        linkID = linkData['Link ID']
+        changes = []
+        for key in self.data['Objects']:
+            block = self.data['Objects'][key]
+            if block['Type'] != 'Item':
+                continue
+            if not block['Link']:
+                continue
+            if block['Link ID'] == linkID:
+                newBlock = linkData.copy()
+                newBlock['position'] = block['position'].copy()
+                newBlock['ID'] = key
+                changes.append([self.data, block, newBlock])
+
+        for sectionData, block, newBlock in changes:
+            self.addBlock(newBlock)
+
+        for section in self.getSections():
+            changes += section.writeLinkedData(linkData)
+
+        return changes
+
+    def findLinkData(self, linkID):
+        """
+        Return copy of the first item block data with link identifier.
+
+        Parameters
+        ----------
+        linkID : str
+            Link identifier string.
+
+        Returns
+        -------
+        linkData : dict or None
+            Copy of linked block data. None if no block uses the link.
+
+        """
+        for key in self.data['Objects'].keys():
+            block = self.data['Objects'][key]
+            if block['Type'] != 'Item':
+                continue
+            if not block['Link']:
+                continue
+            if block['Link ID'] == linkID:
+                return copy.deepcopy(block)
+
+        for section in self.getSections():
+            linkData = section.findLinkData(linkID)
+            if linkData is not None:
+                return linkData
+
+    def getLinkIDs(self):
+        """Return list of all link identifiers in section and subsections."""
+        linkIDs = []
+        for key in self.data['Objects'].keys():
+            block = self.data['Objects'][key]
+            if block['Type'] != 'Item':
+                continue
+            if not block['Link']:
+                continue
+            if block['Link ID'] == '':
+                continue
+            if block['Link ID'] not in linkIDs:
+                linkIDs.append(block['Link ID'])
+
+        for section in self.getSections():
+            for linkID in section.getLinkIDs():
+                if linkID not in linkIDs:
+                    linkIDs.append(linkID)
+
+        return linkIDs
+
+    def forceUniqueBlockIDs(self, indx=-1):
+        """
+        Rewrite block identifiers to always be unique.
+
+        Blocks are numbered in positional priority order, continuing through
+        nested sections. Block data is renamed in place and the section is
+        left untouched when identifiers are already in order.
+
+        Parameters
+        ----------
+        indx : int, optional
+            Most recent block identifier index. The default is -1.
+
+        Returns
+        -------
+        keyMap : dict
+            Old to new identifiers of blocks directly in this section.
+        indx : int
+            Updated most recent block identifier index.
+
+        """
+        prioritylist = self.getPriorityList()
+        keyMap = {}
+        for key in prioritylist:
+            indx += 1
+            keyMap[key] = str(indx)
+        self.swapKeys(keyMap)
+
+        # Connections never cross sections, so nested key maps are not needed
+        for section in self.getSections():
+            indx = section.forceUniqueBlockIDs(indx)[1]
+
+        return keyMap, indx
+
+    def swapKeys(self, keyMap):
+        """
+        Update section block keys with new keys in a single pass.
+
+        Objects are reordered to follow keyMap and connections to blocks
+        missing from keyMap are removed.
+
+        Parameters
+        ----------
+        keyMap : dict
+            Old to new block identifiers for every block in section.
+
+        """
+        objects = self.data['Objects']
+        canonical = list(objects.keys()) == list(keyMap.keys()) and all(
+            key == newKey for key, newKey in keyMap.items())
+        if canonical:
+            return
+
+        nObjects = len(objects)
+        newObjects = {}
+        for key, newKey in keyMap.items():
+            block = objects[key]
+            block['ID'] = newKey
+            if block['Type'] == 'Action':
+                for connectionType in connectionTypes:
+                    inKeys = block[connectionType + ' In']
+                    inKeys[:] = [keyMap[inKey] for inKey in inKeys
+                                 if inKey in keyMap]
+            newObjects[newKey] = block
+
+        objects.clear()
+        objects.update(newObjects)
+        if self.edgeIndex is not None:
+            self.edgeIndex.remap(keyMap)
+        self.sections = {keyMap[key]: section
+                         for key, section in self.sections.items()
+                         if key in keyMap}
+        # Identifiers are not part of protocol text, so block versions move
+        # with their blocks unless dropped blocks changed connection lists
+        self.blockVersions = {keyMap[key]: version
+                              for key, version in self.blockVersions.items()
+                              if key in keyMap}
+        if len(newObjects) == nObjects:
+            self.markChanged([])
+        else:
+            self.markChanged()
+
+
+class Workflow(Section):
+    """Root workflow data wrapper."""
+
+    def __init__(self, data=None, lankey='en'):
+        if data is None:
+            data = {'Name': '',
+                    'language': lankey,
+                    'Type': 'root',
+                    'File': '',
+                    'Description': '',
+                    'Objects': {}
+                    }
+        Section.__init__(self, data)
+
+    @classmethod
+    def load(cls, filepath):
+        """
+        Load workflow from .json file.
+
+        Parameters
+        ----------
+        filepath : str
+            .json file path of saved workflow.
+
+        Returns
+        -------
+        workflow : Workflow
+
+        """
+        data = loadjson(filepath)
+        data['File'] = filepath
+        if data.get('Name', '') == '':
+            data['Name'] = os.path.splitext(os.path.basename(filepath))[0]
+        return cls(data)
+
+    def save(self, filepath):
+        """Save workflow data as .json file."""
+        savejson(self.data, filepath)